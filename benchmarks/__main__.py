@@ -0,0 +1,131 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eth_account.messages import encode_defunct
+from eth_hash.auto import keccak
+from eth_account import Account
+
+from benchmarks.harness import MIN_TIME, REGRESSION_THRESHOLD, compare, load_results, run_benchmark, save_results
+from benchmarks.stub_server import Stub4ByteServer
+from src.resolver import FourByteBackend, SignatureResolver
+from src.selector_cache import SelectorCache
+from src.toolbox_core import ToolBoxCore
+from src.toolbox import ToolBox
+
+STUB_SIGNATURES = [f"benchFunction{index}(address,uint256)" for index in range(256)] + ["transfer(address,uint256)"]
+
+
+class _NullChannel:
+    def emit(self, value):
+        pass
+
+
+class NullSignal:
+    # Stands for the GUI result signal, the formatting is measured but nothing is rendered
+    result_to_copy = _NullChannel()
+    result = _NullChannel()
+    function_signature = _NullChannel()
+
+
+def selector(signature: str):
+    return "0x" + keccak(signature.encode("utf-8"))[:4].hex()
+
+
+def creation_bytecode(signatures: list[str], size: int = 24_000):
+    # solc-like dispatcher (DUP1 PUSH4 <selector> EQ PUSH2 <destination> JUMPI) padded with JUMPDESTs up to size bytes
+    dispatcher = "".join(f"8063{selector(signature)[2:]}1461{index:04x}57" for index, signature in enumerate(signatures))
+    bytecode = "6080604052" + dispatcher
+    return "0x" + bytecode + "5b" * max(0, size - len(bytecode) // 2)
+
+
+def transfer_calldata(index: int):
+    return "0xa9059cbb" + f"{index + 1:040x}".rjust(64, "0") + f"{index * 1000:064x}"
+
+
+def build_cases(stub: Stub4ByteServer):
+    # One core with a warm selector cache and one that always misses it, so every lookup reaches the stub
+    resolver = lambda: SignatureResolver([FourByteBackend(stub.url, calls=1_000_000, period=1)])
+    core = ToolBoxCore(NullSignal(), ToolBox(SelectorCache(":memory:"), resolver=resolver()))
+    uncached_core = ToolBoxCore(NullSignal(), ToolBox(SelectorCache(":memory:", ttl=0, not_found_ttl=0), resolver=resolver()))
+
+    account = Account.from_key(b"\x01" * 32)
+    signed = []
+    for index in range(16):
+        message = f"Order {index}: sell 1 ETH"
+        signed.append((message, account.sign_message(encode_defunct(text=message)).signature.hex()))
+
+    addresses = [account.address, account.address.lower(), account.address.upper().replace("0X", "0x"), "0x123"]
+    values = [("1", "ether", "wei"), ("123456789.123456789", "gwei", "ether"), ("115792089237316195423570985008687907853269984665640564039457", "ether", "wei")]
+
+    return {
+        "keccak256_hash": (core.keccak256_hash, [("transfer(address,uint256)",), ("x" * 1024,)]),
+        "function_selector_encoder": (core.function_selector_encoder, [("transfer", ["address", "uint256"]), ("swap", ["uint256", "bytes", "address"])]),
+        "function_selector_encoder_advanced": (core.function_selector_encoder_advanced, [("transfer(address,uint256)",), ("swap(uint256,bytes,address)",)]),
+        "function_selector_decoder_cached": (core.function_selector_decoder, [(selector(signature),) for signature in STUB_SIGNATURES[:16]]),
+        "decode_transaction_input_call_cached": (core.decode_transaction_input, [(transfer_calldata(index),) for index in range(16)]),
+        "decode_transaction_input_call_stub": (uncached_core.decode_transaction_input, [(transfer_calldata(index),) for index in range(16)]),
+        "decode_transaction_input_creation_cached": (core.decode_transaction_input, [(creation_bytecode(STUB_SIGNATURES[:200]),)]),
+        "eip55_validator": (core.eip55_validator, [(address,) for address in addresses]),
+        "get_signer_owner": (core.get_signer_owner, signed),
+        "wei_converter": (core.wei_converter, values),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="CrazyToolBox core benchmarks")
+    parser.add_argument("-o", "--output", help="save the results to this JSON file")
+    parser.add_argument("-b", "--baseline", help="compare against the results saved in this JSON file")
+    parser.add_argument("-k", "--filter", default="", help="run only the benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="seconds each benchmark runs for")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="ops/sec drop (%%) reported as a regression")
+    args = parser.parse_args()
+
+    stub = Stub4ByteServer({selector(signature): [signature] for signature in STUB_SIGNATURES}).start()
+    results = []
+    try:
+        print(f"{'benchmark':<45}{'ops/sec':>12}{'p50 (us)':>12}{'p99 (us)':>12}{'peak (KB)':>12}")
+        for name, (function, inputs) in build_cases(stub).items():
+            if args.filter not in name:
+                continue
+            result = run_benchmark(name, function, inputs, args.min_time)
+            results.append(result)
+            print(f"{name:<45}{result.ops_per_sec:>12.1f}{result.p50_us:>12.2f}{result.p99_us:>12.2f}{result.peak_memory_kb:>12.1f}")
+    finally:
+        stub.stop()
+
+    if args.output:
+        save_results(args.output, results)
+
+    if args.baseline:
+        print(f"\n{'benchmark':<45}{'baseline':>12}{'current':>12}{'change':>10}")
+        regressions = 0
+        for name, before, after, change, regression in compare(results, load_results(args.baseline), args.threshold):
+            regressions += regression
+            print(f"{name:<45}{before:>12.1f}{after:>12.1f}{change:>+9.1f}%{'  REGRESSION' if regression else ''}")
+        if regressions > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
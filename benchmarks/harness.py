@@ -0,0 +1,105 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from dataclasses import asdict, dataclass
+import tracemalloc
+import platform
+import json
+import time
+
+MIN_TIME = 1.0
+MIN_ITERATIONS = 20
+MAX_ITERATIONS = 200_000
+MEMORY_ITERATIONS = 50
+REGRESSION_THRESHOLD = 10.0
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_memory_kb: float
+
+
+def percentile(sorted_values: list, fraction: float):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def run_benchmark(name: str, function, inputs: list[tuple], min_time: float = MIN_TIME, max_iterations: int = MAX_ITERATIONS):
+    # Calls function with each tuple of inputs in turn for at least min_time seconds. The first pass over the inputs is
+    # a warm up (decoder caches, keep-alive connections...) and is not measured
+    for args in inputs:
+        function(*args)
+
+    timings = []
+    started_at = time.perf_counter()
+    while len(timings) < max_iterations and (len(timings) < MIN_ITERATIONS or time.perf_counter() - started_at < min_time):
+        args = inputs[len(timings) % len(inputs)]
+        start = time.perf_counter_ns()
+        function(*args)
+        timings.append(time.perf_counter_ns() - start)
+
+    # Peak memory in a separate pass, tracing the allocations slows everything down
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for index in range(min(MEMORY_ITERATIONS, len(timings))):
+        function(*inputs[index % len(inputs)])
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    timings.sort()
+    return BenchmarkResult(
+        name,
+        len(timings),
+        round(len(timings) / (sum(timings) / 1e9), 1),
+        round(percentile(timings, 0.5) / 1000, 2),
+        round(percentile(timings, 0.99) / 1000, 2),
+        round(peak / 1024, 1),
+    )
+
+
+def save_results(path: str, results: list[BenchmarkResult]):
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def load_results(path: str):
+    with open(path, "r", encoding="utf-8") as report_file:
+        return {name: BenchmarkResult(**result) for name, result in json.load(report_file)["results"].items()}
+
+
+def compare(results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult], threshold: float = REGRESSION_THRESHOLD):
+    # Returns (name, baseline ops/sec, ops/sec, change %, regression) for the benchmarks found in both runs
+    comparison = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+        before = baseline[result.name].ops_per_sec
+        change = (result.ops_per_sec - before) / before * 100 if before > 0 else 0
+        comparison.append((result.name, before, result.ops_per_sec, change, change < -threshold))
+
+    return comparison
@@ -0,0 +1,95 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import threading
+import json
+import time
+
+
+class Stub4ByteServer:
+    # Local stand-in of the 4byte.directory API (/api/v1/signatures/ and /api/v1/event-signatures/), so the benchmarks
+    # never depend on the network. latency (seconds) is added to every response, and the status codes queued in errors
+    # are answered (one per request) before the normal responses, to test the retries and circuit breakers
+    def __init__(self, functions: dict[str, list[str]], events: dict[str, list[str]] = None, latency: float = 0):
+        self.functions = functions
+        self.events = events if events is not None else {}
+        self.latency = latency
+        self.requests = 0
+        self.errors = []
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # The headers and the body are separate writes: with Nagle the body waits for the delayed ACK of the
+            # client (~40 ms) on every keep-alive request
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests += 1
+                url = urlparse(self.path)
+                selector = parse_qs(url.query).get("hex_signature", [""])[0].lower()
+                signatures = (stub.events if "event-signatures" in url.path else stub.functions).get(selector, [])
+
+                if stub.latency > 0:
+                    time.sleep(stub.latency)
+
+                with stub.lock:
+                    status = stub.errors.pop(0) if stub.errors else 200
+                if status != 200:
+                    self.send_response(status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = json.dumps(
+                    {
+                        "count": len(signatures),
+                        "next": None,
+                        "previous": None,
+                        "results": [{"id": index, "text_signature": signature} for index, signature in enumerate(signatures)],
+                    }
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.__server.server_address[1]}/api/v1/signatures/"
+
+    def start(self):
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.__server.shutdown()
+        self.__server.server_close()
@@ -16,30 +16,100 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import time
+
+# Taken before any other import so the startup report includes the Qt imports
+STARTED_AT = time.perf_counter()
+
 import threading
+import json
+import sys
 import os
 
-from PySide6.QtCore import QObject, Signal, Slot, QFile, QTimer
+from PySide6.QtCore import QMetaObject, QObject, Qt, Signal, Slot, QFile, QThreadPool, QTimer
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
     QComboBox,
+    QFileDialog,
     QHBoxLayout,
     QPlainTextEdit,
     QPushButton,
     QSizePolicy,
+    QSpinBox,
     QStackedWidget,
     QTabWidget,
     QTextEdit,
 )
-import pyperclip
 
-from src.custom_types import MOST_USED_SOLIDITY_DATA_TYPES, CURRENCY_TYPES, MOST_USED_CURRENCY_TYPES
-from src.toolbox_core import ToolBoxCore
+from src.custom_types import MOST_USED_SOLIDITY_DATA_TYPES, CURRENCY_TYPES, HASH_INPUT_TYPES, MOST_USED_CURRENCY_TYPES
+from src.task_runner import TaskRunner
+from src.metrics import metrics
 
 MAX_PARAMS = 8
+# Debounce delay (ms) of the tabs that query 4byte.directory or decode, the local ones run on every change
+LOOKUP_DELAY = 500
+# "1" prints the startup timings to stderr, "exit" also quits once the core is ready (to track the cold start)
+STARTUP_TIMING = os.environ.get("CRAZYTOOLBOX_STARTUP_TIMING", "")
+# With CRAZYTOOLBOX_METRICS set the metrics are printed to stderr on exit, CRAZYTOOLBOX_PROFILE saves a cProfile capture
+PROFILE_PATH = os.environ.get("CRAZYTOOLBOX_PROFILE", "")
+
+
+#####################
+#      STARTUP      #
+#####################
+class StartupTimer:
+    def __init__(self, started_at: float):
+        self.__started_at = started_at
+        self.marks = []
+
+    def mark(self, name: str):
+        self.marks.append((name, time.perf_counter() - self.__started_at))
+
+    def report(self):
+        for name, elapsed in self.marks:
+            print(f"{name:<20}{elapsed * 1000:>10.1f} ms", file=sys.stderr)
+
+
+def get_core():
+    global toolBoxCore
+
+    # web3, eth_abi and eth_account take longer to import than the whole GUI, so the core is created after the window is
+    # shown (in the background) or by the first tab that needs it, whichever comes first
+    with core_lock:
+        if toolBoxCore is None:
+            from src.toolbox_core import ToolBoxCore
+
+            toolBoxCore = ToolBoxCore(task_runner)
+            startup_timer.mark("core ready")
+            if STARTUP_TIMING != "":
+                startup_timer.report()
+            if STARTUP_TIMING == "exit":
+                QMetaObject.invokeMethod(app, "quit", Qt.QueuedConnection)
+
+    return toolBoxCore
+
+
+def start_core():
+    startup_timer.mark("event loop started")
+    QThreadPool.globalInstance().start(get_core)
+
+
+def run_core(method: str, *args):
+    getattr(get_core(), method)(*args)
+
+
+def report_metrics():
+    metrics.stop_profiling(PROFILE_PATH or None)
+    if metrics.enabled:
+        print(json.dumps(metrics.snapshot(), indent=2), file=sys.stderr)
+
+
+def cancel_function_selector_search():
+    if toolBoxCore is not None:
+        toolBoxCore.cancel_function_selector_search()
 
 
 #####################
@@ -114,6 +184,8 @@ def copy_result():
     global result_to_copy, copyButton
 
     if result_to_copy != "":
+        import pyperclip
+
         # Convert markdown to plain text
         result_to_copy_plain = result_to_copy.replace("<br />", "\n").replace("**", "").replace("__", "")
 
@@ -132,6 +204,14 @@ def reset_gui():
 
 
 def render_licenses():
+    global licenses_window
+
+    # The window is built once, closing it only hides it
+    if licenses_window is not None:
+        licenses_window.show()
+        licenses_window.raise_()
+        return
+
     # Load the UI
     licenses_ui_file = QFile(os.path.join(os.path.dirname(__file__), "view", "licenses.ui"))
     licenses_ui_file.open(QFile.ReadOnly)
@@ -143,7 +223,8 @@ def render_licenses():
     licenseAttributionsText = licenses_window.findChild(QTextEdit, "licenseAttributionsText")
     closeButton = licenses_window.findChild(QPushButton, "closeButton")
 
-    license_attributions = open(os.path.join(os.path.dirname(__file__), "license_attributions.txt"), "r", encoding="utf-8").read()
+    with open(os.path.join(os.path.dirname(__file__), "license_attributions.txt"), "r", encoding="utf-8") as license_attributions_file:
+        license_attributions = license_attributions_file.read()
     licenseAttributionsText.setPlainText(license_attributions)
     closeButton.clicked.connect(lambda: licenses_window.close())
 
@@ -151,6 +232,18 @@ def render_licenses():
     licenses_window.show()
 
 
+def open_file_to_hash():
+    global keccak256HashInput, keccak256InputTypeComboBox
+
+    path, _ = QFileDialog.getOpenFileName(window, "Open file to hash")
+    if path != "":
+        # Setting the type first, so only the file is hashed
+        keccak256InputTypeComboBox.blockSignals(True)
+        keccak256InputTypeComboBox.setCurrentText("File")
+        keccak256InputTypeComboBox.blockSignals(False)
+        keccak256HashInput.setPlainText(path)
+
+
 #####################
 #      SIGNALS      #
 #####################
@@ -194,6 +287,8 @@ if __name__ == "__main__":
 
     # Set the window
     window = loader.load(ui_file)
+    startup_timer = StartupTimer(STARTED_AT)
+    startup_timer.mark("ui loaded")
 
     # Connect the signals
     result_signal = ResultSignal()
@@ -201,8 +296,14 @@ if __name__ == "__main__":
     result_signal.result.connect(update_output_label)
     result_signal.function_signature.connect(update_function_signature)
 
-    # Create the core
-    toolBoxCore = ToolBoxCore(result_signal)
+    # Create the core. Its calls run in the task runner pool, which only lets the latest result of each tab through
+    if PROFILE_PATH != "":
+        metrics.enable()
+        metrics.start_profiling()
+    task_runner = TaskRunner(result_signal, ("result_to_copy", "result", "function_signature"))
+    toolBoxCore = None
+    core_lock = threading.Lock()
+    licenses_window = None
 
     # General
     result_to_copy = ""
@@ -212,6 +313,7 @@ if __name__ == "__main__":
     licenseAttributionsAction = window.findChild(QAction, "licenseAttributionsAction")
 
     copyButton.clicked.connect(copy_result)
+    tabWidget.currentChanged.connect(task_runner.cancel_all)
     tabWidget.currentChanged.connect(reset_gui)
     licenseAttributionsAction.triggered.connect(render_licenses)
 
@@ -221,17 +323,19 @@ if __name__ == "__main__":
     weiConverterTo = window.findChild(QComboBox, "weiConverterTo")
     advancedModeCheckbox = window.findChild(QCheckBox, "advancedModeCheckbox")
 
-    weiConverterInput.textChanged.connect(
-        lambda: toolBoxCore.wei_converter(weiConverterInput.toPlainText(), weiConverterFrom.currentText(), weiConverterTo.currentText())
-    )
-
-    weiConverterFrom.currentIndexChanged.connect(
-        lambda: toolBoxCore.wei_converter(weiConverterInput.toPlainText(), weiConverterFrom.currentText(), weiConverterTo.currentText())
+    wei_converter = lambda: task_runner.submit(
+        "weiConverter",
+        0,
+        run_core,
+        "wei_converter",
+        weiConverterInput.toPlainText(),
+        weiConverterFrom.currentText(),
+        weiConverterTo.currentText(),
     )
 
-    weiConverterTo.currentIndexChanged.connect(
-        lambda: toolBoxCore.wei_converter(weiConverterInput.toPlainText(), weiConverterFrom.currentText(), weiConverterTo.currentText())
-    )
+    weiConverterInput.textChanged.connect(wei_converter)
+    weiConverterFrom.currentIndexChanged.connect(wei_converter)
+    weiConverterTo.currentIndexChanged.connect(wei_converter)
 
     advancedModeCheckbox.stateChanged.connect(update_items)
 
@@ -251,11 +355,15 @@ if __name__ == "__main__":
     functionSignatureOutput = window.findChild(QPlainTextEdit, "functionSignatureOutput")
     paramsLayout = window.findChild(QHBoxLayout, "paramsLayout")
 
-    addParamButton.clicked.connect(lambda: add_list_widget_item(toolBoxCore.function_selector_encoder))
+    function_selector_encoder = lambda func_name, params_type: task_runner.submit(
+        "functionSelectorEncoder", 0, run_core, "function_selector_encoder", func_name, params_type
+    )
+
+    addParamButton.clicked.connect(lambda: add_list_widget_item(function_selector_encoder))
     removeParamButton.clicked.connect(remove_list_widget_item)
 
     functionSelectorNameInput.textChanged.connect(
-        lambda: toolBoxCore.function_selector_encoder(
+        lambda: function_selector_encoder(
             functionSelectorNameInput.toPlainText(), [paramsLayout.itemAt(i).widget().currentText() for i in range(paramsLayout.count())]
         )
     )
@@ -264,46 +372,97 @@ if __name__ == "__main__":
     functionSelectorSignatureInput = window.findChild(QPlainTextEdit, "functionSelectorSignatureInput")
 
     functionSelectorSignatureInput.textChanged.connect(
-        lambda: toolBoxCore.function_selector_encoder_advanced(functionSelectorSignatureInput.toPlainText())
+        lambda: task_runner.submit(
+            "functionSelectorEncoderAdvanced",
+            0,
+            run_core,
+            "function_selector_encoder_advanced",
+            functionSelectorSignatureInput.toPlainText(),
+        )
     )
 
     # Function selector decoder
     functionSelectorDecoderInput = window.findChild(QPlainTextEdit, "functionSelectorDecoderInput")
     functionSelectorDecoderInput.textChanged.connect(
-        lambda: QTimer.singleShot(1000, lambda: toolBoxCore.function_selector_decoder(functionSelectorDecoderInput.toPlainText()))
+        lambda: task_runner.submit(
+            "functionSelectorDecoder", LOOKUP_DELAY, run_core, "function_selector_decoder", functionSelectorDecoderInput.toPlainText()
+        )
+    )
+
+    # Function selector search
+    selectorSearchTargetInput = window.findChild(QPlainTextEdit, "selectorSearchTargetInput")
+    selectorSearchPrefixInput = window.findChild(QPlainTextEdit, "selectorSearchPrefixInput")
+    selectorSearchParamsInput = window.findChild(QPlainTextEdit, "selectorSearchParamsInput")
+    selectorSearchMaxLengthSpinBox = window.findChild(QSpinBox, "selectorSearchMaxLengthSpinBox")
+    selectorSearchButton = window.findChild(QPushButton, "selectorSearchButton")
+    selectorSearchCancelButton = window.findChild(QPushButton, "selectorSearchCancelButton")
+
+    # The search runs in worker processes, the pool thread only waits for them so the GUI is never blocked
+    selectorSearchButton.clicked.connect(
+        lambda: task_runner.submit(
+            "selectorSearch",
+            0,
+            run_core,
+            "search_function_selector",
+            selectorSearchTargetInput.toPlainText(),
+            selectorSearchPrefixInput.toPlainText(),
+            selectorSearchParamsInput.toPlainText(),
+            selectorSearchMaxLengthSpinBox.value(),
+        )
     )
+    selectorSearchCancelButton.clicked.connect(cancel_function_selector_search)
+    tabWidget.currentChanged.connect(cancel_function_selector_search)
+    app.aboutToQuit.connect(cancel_function_selector_search)
+    app.aboutToQuit.connect(task_runner.shutdown)
+    app.aboutToQuit.connect(report_metrics)
 
     # Transaction input decoder
     transactionInputDecoderInput = window.findChild(QPlainTextEdit, "transactionInputDecoderInput")
     transactionInputDecoderInput.textChanged.connect(
-        lambda: QTimer.singleShot(
-            1000,
-            lambda: threading.Thread(
-                target=toolBoxCore.decode_transaction_input, args=(transactionInputDecoderInput.toPlainText(),)
-            ).start(),
+        lambda: task_runner.submit(
+            "transactionInputDecoder", LOOKUP_DELAY, run_core, "decode_transaction_input", transactionInputDecoderInput.toPlainText()
         )
     )
 
     # Keccak256 hash
     keccak256HashInput = window.findChild(QPlainTextEdit, "keccak256HashInput")
-    keccak256HashInput.textChanged.connect(lambda: toolBoxCore.keccak256_hash(keccak256HashInput.toPlainText()))
+    keccak256InputTypeComboBox = window.findChild(QComboBox, "keccak256InputTypeComboBox")
+    keccak256OpenFileButton = window.findChild(QPushButton, "keccak256OpenFileButton")
+    keccak256InputTypeComboBox.addItems(HASH_INPUT_TYPES)
+
+    # Hex and file inputs are hashed in chunks with progress, a new input stops the running hash
+    keccak256_hash = lambda: task_runner.submit(
+        "keccak256Hash", 0, run_core, "keccak256_hash", keccak256HashInput.toPlainText(), keccak256InputTypeComboBox.currentText()
+    )
+
+    keccak256HashInput.textChanged.connect(keccak256_hash)
+    keccak256InputTypeComboBox.currentIndexChanged.connect(keccak256_hash)
+    keccak256OpenFileButton.clicked.connect(open_file_to_hash)
 
     # EIP55 Validator
     eip55ValidatorInput = window.findChild(QPlainTextEdit, "eip55ValidatorInput")
-    eip55ValidatorInput.textChanged.connect(lambda: toolBoxCore.eip55_validator(eip55ValidatorInput.toPlainText()))
+    eip55ValidatorInput.textChanged.connect(
+        lambda: task_runner.submit("eip55Validator", 0, run_core, "eip55_validator", eip55ValidatorInput.toPlainText())
+    )
 
     # Get signature owner
     signatureMessageHashInput = window.findChild(QPlainTextEdit, "signatureMessageHashInput")
     signatureInput = window.findChild(QPlainTextEdit, "signatureInput")
 
     signatureMessageHashInput.textChanged.connect(
-        lambda: toolBoxCore.get_signer_owner(signatureMessageHashInput.toPlainText(), signatureInput.toPlainText())
+        lambda: task_runner.submit(
+            "signerOwner", 0, run_core, "get_signer_owner", signatureMessageHashInput.toPlainText(), signatureInput.toPlainText()
+        )
     )
 
     signatureInput.textChanged.connect(
-        lambda: toolBoxCore.get_signer_owner(signatureMessageHashInput.toPlainText(), signatureInput.toPlainText())
+        lambda: task_runner.submit(
+            "signerOwner", 0, run_core, "get_signer_owner", signatureMessageHashInput.toPlainText(), signatureInput.toPlainText()
+        )
     )
 
-    # Show the window
+    # Show the window and load the core once the event loop has painted it
     window.show()
+    startup_timer.mark("window shown")
+    QTimer.singleShot(0, start_core)
     app.exec()
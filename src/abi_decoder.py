@@ -0,0 +1,109 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from functools import lru_cache
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.registry import registry
+
+DECODER_CACHE_SIZE = 4096
+
+
+def split_params(params: str):
+    # Splits on the top level commas only, so tuples like "(address,uint256)[]" are kept as a single type
+    if params.strip() == "":
+        return []
+
+    types = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(params):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                raise ValueError(f"Unbalanced parentheses: {params}")
+        elif char == "," and depth == 0:
+            types.append(params[start:index].strip())
+            start = index + 1
+
+    if depth != 0:
+        raise ValueError(f"Unbalanced parentheses: {params}")
+
+    types.append(params[start:].strip())
+    if "" in types:
+        raise ValueError(f"Empty param type: {params}")
+
+    return types
+
+
+def parse_signature(signature: str):
+    # "transfer(address,uint256)" -> ("transfer", ["address", "uint256"])
+    start = signature.find("(")
+    if start == -1 or not signature.rstrip().endswith(")"):
+        raise ValueError(f"Invalid function signature: {signature}")
+
+    return signature[:start].strip(), split_params(signature.strip()[start + 1 : -1])
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def get_types_decoder(params_type: tuple[str]):
+    return TupleDecoder(decoders=[registry.get_decoder(param) for param in params_type])
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def get_decoder(signature: str):
+    # Returns (param types, decoder) or None if the signature can't be decoded, both are cached
+    try:
+        params_type = tuple(parse_signature(signature)[1])
+        return params_type, get_types_decoder(params_type)
+    except Exception:
+        return None
+
+
+def decode_types(params_type: tuple[str], data: bytes):
+    # Returns the values of the params, raises ValueError if they don't match the types
+    try:
+        return list(get_types_decoder(params_type)(ContextFramesBytesIO(data)))
+    except Exception as error:
+        raise ValueError(f"Invalid params for ({','.join(params_type)})") from error
+
+
+def decode_params(signature: str, data: bytes):
+    # Returns the (type, value) pairs of the params, raises ValueError if they don't match the signature
+    decoder = get_decoder(signature)
+    if decoder is None:
+        raise ValueError(f"Unsupported function signature: {signature}")
+
+    params_type, tuple_decoder = decoder
+    try:
+        return list(zip(params_type, tuple_decoder(ContextFramesBytesIO(data))))
+    except Exception as error:
+        raise ValueError(f"Invalid params for {signature}") from error
+
+
+def abi_type(param: dict):
+    # Expands the tuple components, "tuple[]" with (address,uint256) components -> "(address,uint256)[]"
+    if param["type"].startswith("tuple"):
+        return "({}){}".format(",".join(abi_type(component) for component in param.get("components", [])), param["type"][5:])
+    return param["type"]
+
+
+def abi_signature(entry: dict):
+    return "{}({})".format(entry["name"], ",".join(abi_type(param) for param in entry.get("inputs", [])))
@@ -0,0 +1,174 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+import os
+
+from eth_hash.auto import keccak
+
+from src.abi_decoder import abi_signature, abi_type
+
+DEFAULT_ABI_DIRECTORY = os.path.join(os.path.expanduser("~"), ".crazytoolbox", "abis")
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".crazytoolbox", "abi_index.json")
+INDEX_VERSION = 1
+SKIPPED_DIRECTORIES = (".git", "node_modules")
+
+
+def index_abi(abi: list[dict]):
+    # Returns the functions, events and errors of an ABI with their selector (topic for the events) and named inputs
+    entries = []
+    for entry in abi:
+        entry_type = entry.get("type", "function")
+        if entry_type not in ("function", "event", "error"):
+            continue
+
+        signature = abi_signature(entry)
+        digest = keccak(signature.encode("utf-8"))
+        entries.append(
+            {
+                "type": entry_type,
+                "signature": signature,
+                "selector": "0x" + (digest if entry_type == "event" else digest[:4]).hex(),
+                "inputs": [
+                    {"name": param.get("name", ""), "type": abi_type(param), "indexed": param.get("indexed", False)}
+                    for param in entry.get("inputs", [])
+                ],
+                "anonymous": entry.get("anonymous", False),
+            }
+        )
+
+    return entries
+
+
+def read_abi_entries(content: bytes):
+    # Plain ABI files or Hardhat/Foundry artifacts with an "abi" field, any other JSON file has no entries
+    try:
+        abi = json.loads(content)
+        abi = abi.get("abi") if isinstance(abi, dict) else abi
+        return index_abi(abi) if isinstance(abi, list) else []
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return []
+
+
+class AbiIndex:
+    # Index of the ABIs found in some directories, persisted so only the files whose mtime or size changed are read
+    # again, and only the ones whose content hash changed are indexed again
+    def __init__(self, directories: list[str], index_path: str = DEFAULT_INDEX_PATH):
+        self.directories = [os.path.abspath(directory) for directory in directories]
+        self.index_path = index_path
+        self.functions = {}
+        self.events = {}
+        self.errors = {}
+        self.__files = self.__load()
+        self.refresh()
+
+    def __load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            if index.get("version") == INDEX_VERSION:
+                return index["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def __save(self):
+        index_dir = os.path.dirname(self.index_path)
+        if index_dir != "":
+            os.makedirs(index_dir, exist_ok=True)
+
+        # Written to a temporary file first, so a crash never leaves a truncated index
+        temporary_path = self.index_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as index_file:
+            json.dump({"version": INDEX_VERSION, "files": self.__files}, index_file)
+        os.replace(temporary_path, self.index_path)
+
+    def __walk(self):
+        for directory in self.directories:
+            for root, directories, files in os.walk(directory):
+                directories[:] = [name for name in directories if name not in SKIPPED_DIRECTORIES]
+                for file_name in files:
+                    if file_name.endswith(".json"):
+                        yield os.path.join(root, file_name)
+
+    def refresh(self):
+        # Returns the number of files indexed again
+        seen = []
+        indexed = 0
+        changed = False
+
+        for path in self.__walk():
+            try:
+                stat = os.stat(path)
+                indexed_file = self.__files.get(path)
+                if indexed_file is not None and indexed_file["mtime"] == stat.st_mtime_ns and indexed_file["size"] == stat.st_size:
+                    seen.append(path)
+                    continue
+
+                with open(path, "rb") as abi_file:
+                    content = abi_file.read()
+            except OSError:
+                continue
+
+            changed = True
+            content_hash = hashlib.sha256(content).hexdigest()
+            if indexed_file is None or indexed_file["sha256"] != content_hash:
+                indexed_file = {"sha256": content_hash, "entries": read_abi_entries(content)}
+                indexed += 1
+
+            indexed_file.update(mtime=stat.st_mtime_ns, size=stat.st_size)
+            self.__files[path] = indexed_file
+            seen.append(path)
+
+        # Files deleted from the scanned directories, the ones from other directories are kept for later
+        seen_paths = set(seen)
+        for path in list(self.__files):
+            if path not in seen_paths and any(path.startswith(directory + os.sep) for directory in self.directories):
+                del self.__files[path]
+                changed = True
+
+        if changed:
+            self.__save()
+
+        self.__build_lookups(seen)
+        return indexed
+
+    def __build_lookups(self, paths: list[str]):
+        self.functions, self.events, self.errors = {}, {}, {}
+        lookups = {"function": self.functions, "event": self.events, "error": self.errors}
+
+        # The same signature in several contracts (e.g. ERC20 transfer) is kept once, with the names of the first one
+        for path in sorted(paths):
+            for entry in self.__files[path]["entries"]:
+                entries = lookups[entry["type"]].setdefault(entry["selector"], [])
+                if all(known["signature"] != entry["signature"] for known in entries):
+                    entries.append(entry)
+
+    @staticmethod
+    def normalize(selector: str):
+        return "0x" + selector.strip().lower().replace("0x", "")
+
+    def lookup_function(self, func_selector: str):
+        return self.functions.get(self.normalize(func_selector), [])
+
+    def lookup_event(self, topic: str):
+        return self.events.get(self.normalize(topic), [])
+
+    def lookup_error(self, error_selector: str):
+        return self.errors.get(self.normalize(error_selector), [])
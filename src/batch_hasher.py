@@ -0,0 +1,67 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import struct
+import json
+
+from eth_hash.auto import keccak
+
+from src.parallel import chunked, map_chunks
+from src.abi_decoder import abi_signature
+
+CHUNK_SIZE = 10_000
+
+# Binary table layout: magic (8 bytes) | digest size (u32) | digests, one per input and in the same order
+BINARY_TABLE_MAGIC = b"CTBKEC01"
+BINARY_TABLE_HEADER = struct.Struct("<8sI")
+
+
+def _hash_chunk(values: list[str], digest_size: int):
+    return [keccak(value.encode("utf-8"))[:digest_size] for value in values]
+
+
+def hash_strings(values, digest_size: int = 32, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    # Yields (value, digest) in the input order
+    for chunk, digests in map_chunks(_hash_chunk, chunked(values, chunk_size), workers, digest_size):
+        yield from zip(chunk, digests)
+
+
+def hash_abi(abi: list[dict]):
+    # Returns (type, signature, selector or topic) for the functions, events and errors of an ABI
+    hashes = []
+    for entry in abi:
+        if entry.get("type", "function") not in ("function", "event", "error"):
+            continue
+
+        signature = abi_signature(entry)
+        digest = keccak(signature.encode("utf-8"))
+        hashes.append((entry.get("type", "function"), signature, "0x" + (digest if entry.get("type") == "event" else digest[:4]).hex()))
+
+    return hashes
+
+
+def read_abi(path: str):
+    # Plain ABI files or Hardhat/Foundry artifacts with an "abi" field
+    with open(path, "r", encoding="utf-8") as abi_file:
+        abi = json.load(abi_file)
+
+    return abi["abi"] if isinstance(abi, dict) else abi
+
+
+def write_binary_table_header(output, digest_size: int):
+    output.write(BINARY_TABLE_HEADER.pack(BINARY_TABLE_MAGIC, digest_size))
@@ -0,0 +1,71 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import Counter
+
+from eth_hash.auto import keccak
+
+from src.parallel import chunked, map_chunks
+
+CHUNK_SIZE = 10_000
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
+CHECKSUMMED = "checksummed"
+FIXED = "fixed"
+INVALID = "invalid"
+
+
+def check_address(address: str):
+    # Returns (status, checksum address) hashing the lowercase address only once. It follows the Web3.is_address and
+    # Web3.is_checksum_address rules: mixed case addresses must have a valid checksum, lowercase or uppercase ones are
+    # valid and can be fixed
+    body = address[2:] if address[:2] in ("0x", "0X") else address
+    if len(body) != 40 or not HEX_CHARS.issuperset(body):
+        return INVALID, ""
+
+    lower = body.lower()
+    digest = keccak(lower.encode("ascii")).hex()
+    checksum_address = "0x" + "".join(char.upper() if digest[index] in "89abcdef" else char for index, char in enumerate(lower))
+
+    if address == checksum_address:
+        return CHECKSUMMED, checksum_address
+
+    # Mixed case with a wrong checksum
+    if body != lower and body != body.upper():
+        return INVALID, ""
+
+    return FIXED, checksum_address
+
+
+def _check_chunk(addresses: list[str]):
+    return [check_address(address) for address in addresses]
+
+
+class AddressValidator:
+    # Validates and checksums addresses in chunks across worker processes, keeping the count of each status
+    def __init__(self, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+        self.__workers = workers
+        self.__chunk_size = chunk_size
+        self.summary = Counter()
+
+    def validate(self, addresses):
+        # Yields (address, status, checksum address) in the input order
+        for chunk, results in map_chunks(_check_chunk, chunked(addresses, self.__chunk_size), self.__workers):
+            for address, (status, checksum_address) in zip(chunk, results):
+                self.summary[status] += 1
+                yield address, status, checksum_address
@@ -0,0 +1,209 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+import os
+
+from src.event_decoder import decode_event, parse_log
+from src.abi_decoder import decode_params
+from src.results import DecodedCall, EventDecodeResult, TransactionDecodeResult
+from src.toolbox import ToolBox
+
+CHUNK_SIZE = 2000
+MAX_RESOLVED_SELECTORS = 100_000
+
+
+def _decode_groups(groups: list[tuple[list[str], list[tuple[int, str]]]]):
+    # Each group holds the candidate signatures of one selector and the (position, params hex) of its inputs
+    decoded = []
+    for signatures, items in groups:
+        for position, tx_params_body in items:
+            calls = []
+            for signature in signatures:
+                try:
+                    calls.append(DecodedCall(signature, decode_params(signature, bytes.fromhex(tx_params_body))))
+                except ValueError:
+                    calls.append(DecodedCall(signature, error="Invalid transaction params"))
+            decoded.append((position, calls))
+
+    return decoded
+
+
+def _decode_event_groups(groups: list[tuple[list[tuple], list[tuple[int, list[bytes], bytes]]]]):
+    # Each group holds the candidate (signature, names, indexed) of one event topic and the (position, topics, data) of
+    # its logs, so the decoders of each signature are built once and reused for all of them
+    decoded = []
+    for candidates, items in groups:
+        for position, topics, data in items:
+            decoded.append((position, [decode_event(signature, topics, data, names, indexed) for signature, names, indexed in candidates]))
+
+    return decoded
+
+
+class BulkDecoder:
+    # Decodes transaction inputs in chunks across worker processes. The selectors of each chunk are resolved once in the
+    # main process and the inputs are grouped by selector, so each worker reuses the same decoder for all of them.
+    def __init__(self, toolbox: ToolBox = None, workers: int = None, chunk_size: int = CHUNK_SIZE):
+        self.toolbox = toolbox if toolbox is not None else ToolBox()
+        self.__workers = workers or os.cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__resolved = {}
+        self.__names = {}
+
+    def __resolve(self, func_selectors: set[str]):
+        if len(self.__resolved) > MAX_RESOLVED_SELECTORS:
+            self.__resolved.clear()
+            self.__names.clear()
+
+        pending = [func_selector for func_selector in func_selectors if func_selector not in self.__resolved]
+        for func_selector, decoded in self.toolbox.resolve_function_selectors(pending):
+            self.__resolved[func_selector] = decoded if decoded[0] != "Not found" else []
+            self.__names[func_selector] = self.toolbox.function_param_names(func_selector)
+
+    def __prepare_chunk(self, transaction_inputs: list[str]):
+        results = []
+        for transaction_input in transaction_inputs:
+            transaction_input = transaction_input.strip().replace("0x", "")
+
+            # Contract creations are rare, they are decoded here with their own selector lookups
+            if transaction_input[:8] in ("60806040", "60606040"):
+                results.append(self.toolbox.decode_transaction_input(transaction_input))
+            else:
+                results.append(TransactionDecodeResult("call", "0x" + transaction_input[:8]))
+
+        self.__resolve({result.selector for result in results if result.kind == "call"})
+
+        groups = {}
+        for position, (transaction_input, result) in enumerate(zip(transaction_inputs, results)):
+            if result.kind != "call":
+                continue
+
+            result.signatures = self.__resolved[result.selector]
+            tx_params_body = transaction_input.strip().replace("0x", "")[8:]
+            if result.signatures != [] and tx_params_body != "":
+                groups.setdefault(result.selector, []).append((position, tx_params_body))
+
+        # The param names go with the chunk, the cache can be cleared before its decoded calls come back
+        names = {func_selector: self.__names[func_selector] for func_selector in groups}
+        return results, [(self.__resolved[func_selector], items) for func_selector, items in groups.items()], names
+
+    def decode(self, transaction_inputs):
+        # Yields a TransactionDecodeResult per input, in the same order. Only a few chunks are in flight at a time, so
+        # memory use doesn't depend on the input size
+        transaction_inputs = iter(transaction_inputs)
+        in_flight = deque()
+
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            while True:
+                chunk = list(islice(transaction_inputs, self.__chunk_size))
+                if chunk != []:
+                    results, groups, names = self.__prepare_chunk(chunk)
+                    in_flight.append((results, names, executor.submit(_decode_groups, groups)))
+
+                if len(in_flight) == 0:
+                    break
+
+                if chunk == [] or len(in_flight) > self.__workers * 2:
+                    results, names, future = in_flight.popleft()
+                    for position, calls in future.result():
+                        selector_names = names[results[position].selector]
+                        for call in calls:
+                            call.names = selector_names.get(call.signature)
+                        results[position].calls = calls
+                    yield from results
+
+
+class BulkEventDecoder:
+    # Decodes event logs in chunks like BulkDecoder: the topics of each chunk are resolved once in the main process and
+    # the logs are grouped by topic. With a single worker everything runs in the main process
+    def __init__(self, toolbox: ToolBox = None, workers: int = None, chunk_size: int = CHUNK_SIZE):
+        self.toolbox = toolbox if toolbox is not None else ToolBox()
+        self.__workers = workers or os.cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__resolved = {}
+
+    def __resolve(self, topics: set[str]):
+        if len(self.__resolved) > MAX_RESOLVED_SELECTORS:
+            self.__resolved.clear()
+
+        pending = [topic for topic in topics if topic not in self.__resolved]
+        for topic, decoded in self.toolbox.resolve_event_topics(pending):
+            params = self.toolbox.event_params(topic)
+            self.__resolved[topic] = [
+                (signature, *params.get(signature, (None, None))) for signature in (decoded if decoded[0] != "Not found" else [])
+            ]
+
+    def __prepare_chunk(self, logs: list[tuple[list[str], str]]):
+        results = []
+        parsed = []
+        for topics, data in logs:
+            try:
+                topics, data = parse_log(topics, data)
+            except ValueError as error:
+                results.append(EventDecodeResult(error=str(error)))
+                parsed.append(None)
+                continue
+
+            results.append(EventDecodeResult("0x" + topics[0].hex()))
+            parsed.append((topics, data))
+
+        self.__resolve({result.topic for result in results if result.error is None})
+
+        groups = {}
+        for position, (result, log) in enumerate(zip(results, parsed)):
+            if log is None:
+                continue
+
+            candidates = self.__resolved[result.topic]
+            result.signatures = [signature for signature, _, _ in candidates]
+            if candidates != []:
+                groups.setdefault(result.topic, []).append((position, log[0][1:], log[1]))
+
+        return results, [(self.__resolved[topic], items) for topic, items in groups.items()]
+
+    def decode(self, logs):
+        # logs are (topics, data) pairs. Yields an EventDecodeResult per log, in the same order
+        logs = iter(logs)
+        if self.__workers <= 1:
+            while True:
+                chunk = list(islice(logs, self.__chunk_size))
+                if chunk == []:
+                    return
+                results, groups = self.__prepare_chunk(chunk)
+                for position, events in _decode_event_groups(groups):
+                    results[position].events = events
+                yield from results
+
+        in_flight = deque()
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            while True:
+                chunk = list(islice(logs, self.__chunk_size))
+                if chunk != []:
+                    results, groups = self.__prepare_chunk(chunk)
+                    in_flight.append((results, executor.submit(_decode_event_groups, groups)))
+
+                if len(in_flight) == 0:
+                    break
+
+                if chunk == [] or len(in_flight) > self.__workers * 2:
+                    results, future = in_flight.popleft()
+                    for position, events in future.result():
+                        results[position].events = events
+                    yield from results
@@ -0,0 +1,81 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import Counter
+
+from eth_account.messages import encode_defunct
+from eth_account import Account
+
+from src.parallel import chunked, map_chunks
+
+CHUNK_SIZE = 500
+
+MATCH = "match"
+MISMATCH = "mismatch"
+RECOVERED = "recovered"
+INVALID = "invalid"
+
+# Account holds no state, one instance is shared instead of building a Web3 object for each signature
+account = Account()
+
+
+def recover_signer(signature_message_or_hash: str, signature: str):
+    # Returns (owner, error)
+    try:
+        if signature_message_or_hash[:2] == "0x":
+            signable_message = encode_defunct(hexstr=signature_message_or_hash)
+        else:
+            signable_message = encode_defunct(text=signature_message_or_hash)
+    except:
+        return "", "Invalid signature message or hash"
+
+    try:
+        return account.recover_message(signable_message, signature=signature), ""
+    except:
+        return "", "Invalid signature"
+
+
+def _recover_chunk(rows: list[tuple]):
+    return [recover_signer(row[0], row[1]) for row in rows]
+
+
+class SignerRecovery:
+    # Recovers the signers of (message or hash, signature) pairs in chunks across worker processes, optionally
+    # comparing them against the expected signers
+    def __init__(self, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+        self.__workers = workers
+        self.__chunk_size = chunk_size
+        self.summary = Counter()
+
+    def recover(self, rows):
+        # rows are (message or hash, signature, expected signer or None). Yields (row, owner, status, error) in the
+        # input order
+        for chunk, results in map_chunks(_recover_chunk, chunked(rows, self.__chunk_size), self.__workers):
+            for row, (owner, error) in zip(chunk, results):
+                expected = row[2]
+                if error != "":
+                    status = INVALID
+                elif expected is None or expected == "":
+                    status = RECOVERED
+                elif owner.lower() == expected.strip().lower():
+                    status = MATCH
+                else:
+                    status = MISMATCH
+
+                self.summary[status] += 1
+                yield row, owner, status, error
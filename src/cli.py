@@ -0,0 +1,548 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import asdict
+import argparse
+import asyncio
+import gzip
+import os
+import json
+import time
+import csv
+import sys
+
+from src.batch_hasher import hash_abi, hash_strings, read_abi, write_binary_table_header
+from src.stream_hasher import hash_file, hash_hex
+from src.bulk_address import CHECKSUMMED, FIXED, INVALID, AddressValidator
+from src.bulk_signer import INVALID as INVALID_SIGNATURE, MATCH, MISMATCH, RECOVERED, SignerRecovery
+from src.bulk_decoder import BulkDecoder, BulkEventDecoder
+from src.selector_search import DEFAULT_CHARSET, SelectorSearch
+from src.selector_db import SelectorDatabase, DEFAULT_DATABASE_PATH
+from src.resolver import (
+    DEFAULT_TIMEOUT,
+    FIRST,
+    MERGE,
+    AbiDirectoryBackend,
+    FourByteBackend,
+    KnownSelectorsBackend,
+    OpenChainBackend,
+    SelectorDatabaseBackend,
+    SignatureResolver,
+)
+from src.unit_converter import convert_units
+from src.abi_index import AbiIndex, DEFAULT_ABI_DIRECTORY
+from src.custom_types import CURRENCY_TYPES
+from src.signature_parser import canonical_params
+from src.parallel import chunked
+from src.selector_stats import DEFAULT_CAPACITY, DEFAULT_TOP, SelectorStatistics
+from src.metrics import metrics
+from src.server import ToolBoxServer
+from src.results import to_json
+from src.toolbox import ToolBox
+
+# Transaction exports name the calldata column differently (Etherscan uses "Input")
+INPUT_COLUMNS = ("input", "Input", "calldata", "data", "transaction_input")
+ADDRESS_COLUMNS = ("address", "Address", "wallet", "account")
+VALUE_COLUMNS = ("value", "Value", "amount", "balance")
+# Fields of the log dumps (eth_getLogs, BigQuery, Etherscan...) copied to the decoded output
+LOG_FIELDS = ("address", "blockNumber", "block_number", "transactionHash", "transaction_hash", "logIndex", "log_index")
+TOPIC_COLUMNS = ("topic0", "topic1", "topic2", "topic3")
+EXPECTED_SIGNER_COLUMNS = ("expected", "expected_signer", "signer", "owner")
+CONTRACT_COLUMNS = ("to", "To", "to_address")
+
+
+def open_input(path: str):
+    if path == "-":
+        return sys.stdin
+    # Compressed exports are decompressed while they are read
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def open_output(path: str, binary: bool = False):
+    # Standard output is left open when the mode finishes
+    if path == "-":
+        return nullcontext(sys.stdout.buffer if binary else sys.stdout)
+    if binary:
+        return open(path, "wb")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def find_column(row: dict, columns: tuple[str]):
+    column = next((name for name in columns if name in row), None)
+    if column is None:
+        raise ValueError(f"No input column found, use --column (keys: {', '.join(row)})")
+    return column
+
+
+def detect_format(path: str, input_format: str):
+    if input_format != "auto":
+        return input_format
+    path = path.removesuffix(".gz")
+    for extension in ("csv", "jsonl"):
+        if path.endswith("." + extension):
+            return extension
+    return "lines"
+
+
+def read_rows(stream, input_format: str, column: str = None, columns: tuple[str] = INPUT_COLUMNS):
+    # Yields the values one by one, so the input is never fully loaded in memory
+    if input_format == "csv":
+        reader = csv.DictReader(stream)
+        if column is None:
+            column = next((name for name in columns if name in (reader.fieldnames or [])), None)
+            if column is None:
+                raise ValueError(f"No input column found, use --column (columns: {', '.join(reader.fieldnames or [])})")
+        for row in reader:
+            yield row[column]
+    elif input_format == "jsonl":
+        for line in stream:
+            if line.strip() == "":
+                continue
+            row = json.loads(line)
+            if isinstance(row, str):
+                yield row
+            else:
+                yield row[column if column is not None else find_column(row, columns)]
+    else:
+        for line in stream:
+            yield line.strip()
+
+
+def read_records(stream, input_format: str):
+    # Yields each row as a dict, for the modes that need several columns
+    if input_format == "csv":
+        yield from csv.DictReader(stream)
+    elif input_format == "jsonl":
+        for line in stream:
+            if line.strip() != "":
+                yield json.loads(line)
+    else:
+        raise ValueError("This mode needs a CSV or JSONL input")
+
+
+def add_resolver_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--selector-database", help="offline selector database (see src/selector_db.py)")
+    parser.add_argument("--abi-dir", action="append", default=[], help="directory with ABI files or artifacts to resolve selectors")
+    parser.add_argument("--mirror", action="append", default=[], help="URL of a 4byte.directory API mirror")
+    parser.add_argument("--openchain", action="store_true", help="look up the selectors in openchain.xyz too")
+    parser.add_argument("--no-4byte", action="store_true", help="do not query 4byte.directory")
+    parser.add_argument("--merge", action="store_true", help="merge the answers of all the sources instead of taking the first one")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="timeout (seconds) of each source")
+
+
+def build_toolbox(args):
+    selector_database = None
+    if args.selector_database or os.path.isfile(DEFAULT_DATABASE_PATH):
+        selector_database = SelectorDatabase(args.selector_database or DEFAULT_DATABASE_PATH)
+
+    # Local sources first (the ABIs of the project before the well-known selectors), then the remote ones in order of
+    # preference
+    abi_directories = args.abi_dir or ([DEFAULT_ABI_DIRECTORY] if os.path.isdir(DEFAULT_ABI_DIRECTORY) else [])
+    abi_index = AbiIndex(abi_directories) if abi_directories != [] else None
+    backends = [AbiDirectoryBackend(abi_index)] if abi_index is not None else []
+    backends.append(KnownSelectorsBackend())
+    if selector_database is not None:
+        backends.append(SelectorDatabaseBackend(selector_database))
+    if not args.no_4byte:
+        backends.append(FourByteBackend(timeout=args.timeout))
+    backends += [FourByteBackend(url, args.timeout) for url in args.mirror]
+    if args.openchain:
+        backends.append(OpenChainBackend(timeout=args.timeout))
+
+    resolver = SignatureResolver(backends, MERGE if args.merge else FIRST)
+    return ToolBox(selector_database=selector_database, resolver=resolver, abi_index=abi_index)
+
+
+def decode(args):
+    toolbox = build_toolbox(args)
+
+    with open_input(args.input) as stream, open_output(args.output) as output:
+        rows = deque()
+
+        def transaction_inputs():
+            for row, transaction_input in enumerate(read_rows(stream, detect_format(args.input, args.format), args.column), start=1):
+                transaction_input = transaction_input.strip()
+                if transaction_input != "":
+                    rows.append((row, transaction_input))
+                    yield transaction_input
+
+        if args.workers > 1:
+            results = BulkDecoder(toolbox, args.workers).decode(transaction_inputs())
+        else:
+            results = (toolbox.decode_transaction_input(transaction_input) for transaction_input in transaction_inputs())
+
+        # The results come in the same order as the inputs
+        for result in results:
+            row, transaction_input = rows.popleft()
+            output.write(json.dumps({"row": row, "input": transaction_input, **asdict(result)}, default=to_json) + "\n")
+
+
+def selector_statistics(args):
+    statistics = SelectorStatistics(args.capacity)
+    input_format = detect_format(args.input, args.format)
+
+    with open_input(args.input) as stream:
+        if args.contract is None:
+            statistics.update(read_rows(stream, input_format, args.column))
+        else:
+            # Only the transactions sent to the contract are counted
+            contract = args.contract.lower()
+            for record in read_records(stream, input_format):
+                contract_column = args.contract_column or next((name for name in CONTRACT_COLUMNS if name in record), None)
+                if (record.get(contract_column) or "").lower() == contract:
+                    column = args.column or find_column(record, INPUT_COLUMNS)
+                    statistics.add(record[column])
+
+    report = statistics.report(None if args.no_resolve else build_toolbox(args), args.top)
+    with open_output(args.output) as output:
+        if args.json:
+            output.write(json.dumps(report, indent=2) + "\n")
+        else:
+            output.write(
+                f"{report['transactions']} transactions: {report['calls']} calls, {report['creations']} contract creations, "
+                f"{report['transfers']} transfers and {report['invalid']} invalid inputs\n\n"
+            )
+            output.write(f"{'selector':<12}{'count':>12}{'error':>10}{'share':>9}  signatures\n")
+            for entry in report["top"]:
+                output.write(
+                    f"{entry['selector']:<12}{entry['count']:>12}{entry['error']:>10}{entry['share']:>8.2f}%  "
+                    f"{', '.join(entry['signatures']) or '-'}\n"
+                )
+
+
+def read_log(record: dict):
+    # Topics as a list, a JSON list or a comma separated string, or one column per topic
+    topics = record.get("topics")
+    if topics is None:
+        topics = [record[name] for name in TOPIC_COLUMNS if record.get(name)]
+    elif isinstance(topics, str):
+        if topics.strip().startswith("["):
+            topics = json.loads(topics)
+        else:
+            topics = [topic for topic in topics.replace(";", ",").split(",") if topic.strip()]
+
+    return topics, record.get("data") or "0x"
+
+
+def decode_events(args):
+    toolbox = build_toolbox(args)
+
+    # Log dumps are JSONL unless they are CSV
+    input_format = "csv" if detect_format(args.input, args.format) == "csv" else "jsonl"
+
+    with open_input(args.input) as stream, open_output(args.output) as output:
+        records = deque()
+
+        def logs():
+            for row, record in enumerate(read_records(stream, input_format), start=1):
+                records.append((row, record))
+                yield read_log(record)
+
+        # The results come in the same order as the logs
+        for result in BulkEventDecoder(toolbox, args.workers).decode(logs()):
+            row, record = records.popleft()
+            fields = {name: record[name] for name in LOG_FIELDS if name in record}
+            output.write(json.dumps({"row": row, **fields, **asdict(result)}, default=to_json) + "\n")
+
+
+def hash_values(args):
+    if args.abi:
+        with open_output(args.output) as output:
+            writer = csv.writer(output)
+            writer.writerow(("type", "signature", "hash"))
+            writer.writerows(hash_abi(read_abi(args.input)))
+        return
+
+    digest_size = 4 if args.selector else 32
+    start = time.perf_counter()
+    count = 0
+    invalid = 0
+
+    if args.file:
+        # The whole content of the input, read in chunks
+        digest = hash_file("/dev/stdin" if args.input == "-" else args.input)[:digest_size]
+        with open_output(args.output, args.format == "binary") as output:
+            if args.format == "binary":
+                write_binary_table_header(output, digest_size)
+                output.write(digest)
+            else:
+                output.write(f"0x{digest.hex()}  {args.input}\n")
+        return
+
+    def hex_hashes(values):
+        # (value, digest, error), an invalid line has no digest so the rows still match the lines of the input
+        nonlocal invalid
+        for value in values:
+            try:
+                yield value, hash_hex(value)[:digest_size], ""
+            except ValueError as error:
+                invalid += 1
+                yield value, None, f"Invalid hex: {error}"
+
+    with open_input(args.input) as stream, open_output(args.output, args.format == "binary") as output:
+        # Blank lines are hashed too (as empty strings), so the Nth row of the output is the Nth line of the input
+        values = (line.rstrip("\r\n") for line in stream)
+        if args.hex:
+            hashes = hex_hashes(values)
+        else:
+            hashes = ((value, digest, "") for value, digest in hash_strings(values, digest_size, args.workers))
+
+        if args.format == "binary":
+            # The digest of the invalid lines is all zeros
+            write_binary_table_header(output, digest_size)
+            for _, digest, _ in hashes:
+                output.write(digest if digest is not None else bytes(digest_size))
+                count += 1
+        else:
+            # The hex lines have an error column, empty when the line is valid
+            writer = csv.writer(output)
+            for value, digest, error in hashes:
+                row = (value, "0x" + digest.hex() if digest is not None else "")
+                writer.writerow(row + (error,) if args.hex else row)
+                count += 1
+
+    elapsed = time.perf_counter() - start
+    summary = f"{count} hashes in {elapsed:.2f}s ({count / elapsed if elapsed > 0 else 0:.0f} hashes/sec)"
+    print(summary + (f", {invalid} invalid hex lines" if invalid > 0 else ""), file=sys.stderr)
+
+
+def search(args):
+    selector_search = SelectorSearch(
+        args.target,
+        list(canonical_params(args.params)),
+        args.prefix,
+        args.charset,
+        args.min_length,
+        args.max_length,
+        args.results,
+        args.workers,
+    )
+
+    def report(progress):
+        print(f"\r{progress.checked} names checked ({progress.rate:.0f} hashes/sec)", end="", file=sys.stderr)
+
+    try:
+        matches = selector_search.run(on_progress=report)
+    except KeyboardInterrupt:
+        selector_search.cancel()
+        matches = selector_search.matches
+
+    print(file=sys.stderr)
+    for signature, selector in matches:
+        print(f"{selector} {signature}")
+
+
+def validate_addresses(args):
+    validator = AddressValidator(args.workers)
+    with open_input(args.input) as stream, open_output(args.output) as output:
+        writer = csv.writer(output)
+        writer.writerow(("address", "status", "checksum_address"))
+        addresses = read_rows(stream, detect_format(args.input, args.format), args.column, ADDRESS_COLUMNS)
+        addresses = (address.strip() for address in addresses)
+        for address, status, checksum_address in validator.validate(address for address in addresses if address != ""):
+            writer.writerow((address, status, checksum_address))
+
+    print(", ".join(f"{status}: {validator.summary[status]}" for status in (CHECKSUMMED, FIXED, INVALID)), file=sys.stderr)
+
+
+def recover_signers(args):
+    recovery = SignerRecovery(args.workers)
+    with open_input(args.input) as stream, open_output(args.output) as output:
+        writer = csv.writer(output)
+        writer.writerow(("row", "message", "signature", "expected", "owner", "status", "error"))
+        records = read_records(stream, detect_format(args.input, args.format))
+
+        def pairs():
+            expected_column = args.expected_column
+            for row, record in enumerate(records, start=1):
+                if expected_column is None:
+                    expected_column = next((name for name in EXPECTED_SIGNER_COLUMNS if name in record), "")
+                yield record[args.message_column], record[args.signature_column].strip(), record.get(expected_column), row
+
+        for (message, signature, expected, row), owner, status, error in recovery.recover(pairs()):
+            if not args.mismatches or status in (MISMATCH, INVALID_SIGNATURE):
+                writer.writerow((row, message, signature, expected or "", owner, status, error))
+
+    statuses = (MATCH, MISMATCH, RECOVERED, INVALID_SIGNATURE)
+    print(", ".join(f"{status}: {recovery.summary[status]}" for status in statuses if recovery.summary[status] > 0), file=sys.stderr)
+
+
+def convert_values(args):
+    with open_input(args.input) as stream, open_output(args.output) as output:
+        writer = csv.writer(output)
+        writer.writerow(("value", args.currency_to, "error"))
+        values = (value.strip() for value in read_rows(stream, detect_format(args.input, args.format), args.column, VALUE_COLUMNS))
+        for chunk in chunked((value for value in values if value != ""), 10_000):
+            for value, (converted, error) in zip(chunk, convert_units(chunk, args.currency_from, args.currency_to)):
+                writer.writerow((value, converted, error))
+
+
+def serve(args):
+    toolbox = build_toolbox(args)
+    print(f"Listening on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(ToolBoxServer(toolbox, args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+def index_abis(args):
+    start = time.perf_counter()
+    abi_index = AbiIndex(args.directories or [DEFAULT_ABI_DIRECTORY])
+    print(
+        f"{len(abi_index.functions)} functions, {len(abi_index.events)} events and {len(abi_index.errors)} errors indexed "
+        f"in {time.perf_counter() - start:.2f}s",
+        file=sys.stderr,
+    )
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog="python -m src", description="CrazyToolBox headless mode")
+    parser.add_argument("--metrics", choices=("json", "prometheus"), help="print the timers and counters to stderr when done")
+    parser.add_argument("--profile", metavar="PATH", help="save a cProfile (pstats) capture of the command to PATH")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    decode_parser = subparsers.add_parser("decode", help="decodes transaction inputs, writing one JSON object per line")
+    decode_parser.add_argument("input", nargs="?", default="-", help="input file (newline-delimited, CSV or JSONL), stdin by default")
+    decode_parser.add_argument("-f", "--format", choices=("auto", "lines", "csv", "jsonl"), default="auto", help="input format")
+    decode_parser.add_argument("-c", "--column", help="CSV column or JSONL key holding the transaction input")
+    decode_parser.add_argument("-o", "--output", default="-", help="output JSONL file, stdout by default")
+    decode_parser.add_argument("-w", "--workers", type=int, default=1, help="decode in this many worker processes")
+    add_resolver_arguments(decode_parser)
+    decode_parser.set_defaults(handler=decode)
+
+    events_parser = subparsers.add_parser("events", help="decodes event logs (topics and data), writing one JSON object per line")
+    events_parser.add_argument("input", nargs="?", default="-", help="input file (JSONL or CSV), stdin by default")
+    events_parser.add_argument("-f", "--format", choices=("auto", "csv", "jsonl"), default="auto", help="input format")
+    events_parser.add_argument("-o", "--output", default="-", help="output JSONL file, stdout by default")
+    events_parser.add_argument("-w", "--workers", type=int, default=1, help="decode in this many worker processes")
+    add_resolver_arguments(events_parser)
+    events_parser.set_defaults(handler=decode_events)
+
+    stats_parser = subparsers.add_parser("stats", help="counts the most called selectors of a transaction dump (can be gzipped)")
+    stats_parser.add_argument("input", nargs="?", default="-", help="input file (newline-delimited, CSV or JSONL), stdin by default")
+    stats_parser.add_argument("-f", "--format", choices=("auto", "lines", "csv", "jsonl"), default="auto", help="input format")
+    stats_parser.add_argument("-c", "--column", help="CSV column or JSONL key holding the transaction input")
+    stats_parser.add_argument("--contract", help="count only the transactions sent to this address (CSV or JSONL inputs)")
+    stats_parser.add_argument("--contract-column", help="CSV column or JSONL key holding the recipient, detected by default")
+    stats_parser.add_argument("-k", "--top", type=int, default=DEFAULT_TOP, help="number of selectors reported and resolved")
+    stats_parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY, help="selectors tracked (bounds the memory used)")
+    stats_parser.add_argument("--no-resolve", action="store_true", help="do not resolve the signatures of the top selectors")
+    stats_parser.add_argument("--json", action="store_true", help="write the report as JSON")
+    stats_parser.add_argument("-o", "--output", default="-", help="output file, stdout by default")
+    add_resolver_arguments(stats_parser)
+    stats_parser.set_defaults(handler=selector_statistics)
+
+    hash_parser = subparsers.add_parser("hash", help="computes the Keccak-256 hash of each line or the selectors of an ABI file")
+    hash_parser.add_argument("input", nargs="?", default="-", help="input file (one string per line), stdin by default")
+    hash_parser.add_argument("--abi", action="store_true", help="the input is an ABI (or Hardhat/Foundry artifact) JSON file")
+    hash_parser.add_argument("--hex", action="store_true", help="each line is hex encoded bytes instead of text")
+    hash_parser.add_argument("--file", action="store_true", help="hash the content of the input file instead of each line")
+    hash_parser.add_argument("-s", "--selector", action="store_true", help="keep only the first 4 bytes (function selectors)")
+    hash_parser.add_argument("-f", "--format", choices=("csv", "binary"), default="csv", help="output format")
+    hash_parser.add_argument("-o", "--output", default="-", help="output file, stdout by default")
+    hash_parser.add_argument("-w", "--workers", type=int, default=1, help="hash the lines of text in this many worker processes")
+    hash_parser.set_defaults(handler=hash_values)
+
+    search_parser = subparsers.add_parser("search", help="finds function names whose selector starts with the target")
+    search_parser.add_argument("target", help="selector or selector prefix in hex, e.g. 0x00000000")
+    search_parser.add_argument("-p", "--params", default="", help="comma separated param types, e.g. address,uint256")
+    search_parser.add_argument("--prefix", default="", help="function name prefix")
+    search_parser.add_argument("--charset", default=DEFAULT_CHARSET, help="characters used for the rest of the name")
+    search_parser.add_argument("--min-length", type=int, default=1, help="min number of characters added to the prefix")
+    search_parser.add_argument("--max-length", type=int, default=6, help="max number of characters added to the prefix")
+    search_parser.add_argument("-n", "--results", type=int, default=1, help="stop after this many matches")
+    search_parser.add_argument("-w", "--workers", type=int, help="worker processes, all the cores by default")
+    search_parser.set_defaults(handler=search)
+
+    eip55_parser = subparsers.add_parser("eip55", help="validates and checksums (EIP55) a list of addresses, writing CSV")
+    eip55_parser.add_argument("input", nargs="?", default="-", help="input file (newline-delimited, CSV or JSONL), stdin by default")
+    eip55_parser.add_argument("-f", "--format", choices=("auto", "lines", "csv", "jsonl"), default="auto", help="input format")
+    eip55_parser.add_argument("-c", "--column", help="CSV column or JSONL key holding the address")
+    eip55_parser.add_argument("-o", "--output", default="-", help="output CSV file, stdout by default")
+    eip55_parser.add_argument("-w", "--workers", type=int, default=1, help="validate in this many worker processes")
+    eip55_parser.set_defaults(handler=validate_addresses)
+
+    recover_parser = subparsers.add_parser("recover", help="recovers the signers of (message or hash, signature) pairs, writing CSV")
+    recover_parser.add_argument("input", nargs="?", default="-", help="input file (CSV or JSONL), stdin by default")
+    recover_parser.add_argument("-f", "--format", choices=("auto", "csv", "jsonl"), default="auto", help="input format")
+    recover_parser.add_argument("--message-column", default="message", help="column holding the message or the 0x hash")
+    recover_parser.add_argument("--signature-column", default="signature", help="column holding the signature")
+    recover_parser.add_argument("--expected-column", help="column holding the expected signer, detected by default")
+    recover_parser.add_argument("-m", "--mismatches", action="store_true", help="write only the mismatches and invalid signatures")
+    recover_parser.add_argument("-o", "--output", default="-", help="output CSV file, stdout by default")
+    recover_parser.add_argument("-w", "--workers", type=int, default=1, help="recover in this many worker processes")
+    recover_parser.set_defaults(handler=recover_signers)
+
+    convert_parser = subparsers.add_parser("convert", help="converts a list of values between Ethereum units, writing CSV")
+    convert_parser.add_argument("input", nargs="?", default="-", help="input file (newline-delimited, CSV or JSONL), stdin by default")
+    convert_parser.add_argument("--from", dest="currency_from", choices=CURRENCY_TYPES, default="wei", help="unit of the values")
+    convert_parser.add_argument("--to", dest="currency_to", choices=CURRENCY_TYPES, default="ether", help="unit to convert to")
+    convert_parser.add_argument("-f", "--format", choices=("auto", "lines", "csv", "jsonl"), default="auto", help="input format")
+    convert_parser.add_argument("-c", "--column", help="CSV column or JSONL key holding the value")
+    convert_parser.add_argument("-o", "--output", default="-", help="output CSV file, stdout by default")
+    convert_parser.set_defaults(handler=convert_values)
+
+    serve_parser = subparsers.add_parser("serve", help="runs the toolbox as an HTTP/JSON service")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve_parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    serve_parser.add_argument("-w", "--workers", type=int, default=16, help="threads running the requests")
+    add_resolver_arguments(serve_parser)
+    serve_parser.set_defaults(handler=serve)
+
+    index_parser = subparsers.add_parser("index", help="indexes (or updates the index of) directories of ABI files or artifacts")
+    index_parser.add_argument("directories", nargs="*", help=f"directories to index, {DEFAULT_ABI_DIRECTORY} by default")
+    index_parser.set_defaults(handler=index_abis)
+
+    args = parser.parse_args(argv)
+    if args.command == "hash":
+        # The ABI, hex and file modes hash in the main process, and the ABI mode always writes a CSV of the selectors
+        # and topics
+        modes = [option for option, enabled in (("--abi", args.abi), ("--hex", args.hex), ("--file", args.file)) if enabled]
+        if len(modes) > 1:
+            hash_parser.error(f"{' and '.join(modes)} can't be used together")
+        if modes != [] and args.workers > 1:
+            hash_parser.error(f"-w can't be used with {modes[0]}")
+        if args.abi and (args.format == "binary" or args.selector):
+            hash_parser.error("-f binary and -s can't be used with --abi")
+    # Contract creations can be larger than the default CSV field size limit (128 KB)
+    csv.field_size_limit(2**31 - 1)
+    if args.metrics is None and args.profile is None:
+        args.handler(args)
+        return
+
+    # The worker processes (-w) are not measured. In serve mode the toolbox calls of the requests are timed (and
+    # profiled) instead of the whole event loop
+    metrics.enable()
+    if args.profile is not None:
+        metrics.start_profiling()
+    try:
+        if args.command == "serve":
+            args.handler(args)
+        else:
+            metrics.profile_call(args.handler, args)
+    finally:
+        metrics.stop_profiling(args.profile)
+        if args.metrics == "json":
+            print(json.dumps(metrics.snapshot(), indent=2), file=sys.stderr)
+        elif args.metrics == "prometheus":
+            print(metrics.to_prometheus(), end="", file=sys.stderr)
@@ -109,3 +109,10 @@ MOST_USED_CURRENCY_TYPES = [
     "gwei",
     "ether",
 ]
+
+# Inputs of the Keccak-256 hash, the text is hashed as UTF-8
+HASH_INPUT_TYPES = [
+    "Text",
+    "Hex",
+    "File",
+]
@@ -0,0 +1,94 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from functools import lru_cache
+from itertools import combinations, islice
+
+from src.abi_decoder import DECODER_CACHE_SIZE, decode_types, parse_signature
+from src.results import DecodedEvent
+
+# Text signatures don't say which params are indexed, at most this many combinations are tried
+MAX_INDEXED_CANDIDATES = 64
+
+
+def parse_log(topics: list[str], data: str):
+    # Returns the topics and the data as bytes, raises ValueError if they are not valid. Log dumps and JSON bodies can
+    # have numbers, nulls or nested lists anywhere
+    if not isinstance(topics, (list, tuple)) or not all(isinstance(topic, str) for topic in topics) or not isinstance(data, str):
+        raise ValueError("Invalid topics or data")
+
+    try:
+        topics = [bytes.fromhex(topic.strip().replace("0x", "")) for topic in topics]
+        data = bytes.fromhex(data.strip().replace("0x", ""))
+    except ValueError:
+        raise ValueError("Invalid topics or data")
+
+    if topics == [] or any(len(topic) != 32 for topic in topics):
+        raise ValueError("Invalid topics, the first one must be the event topic (anonymous events can't be decoded)")
+
+    return topics, data
+
+
+def is_hashed_when_indexed(param_type: str):
+    # Indexed strings, bytes, arrays and tuples only keep the keccak hash of their value in the topic
+    return param_type in ("string", "bytes") or "[" in param_type or "(" in param_type
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def indexed_candidates(params_count: int, indexed_count: int):
+    # The leading params first, which is how most events are declared (e.g. Transfer(address indexed, address indexed, uint256))
+    candidates = []
+    for indexes in islice(combinations(range(params_count), indexed_count), MAX_INDEXED_CANDIDATES):
+        candidates.append(tuple(index in indexes for index in range(params_count)))
+    return candidates
+
+
+def decode_with_indexed(params_type: tuple[str], indexed: tuple[bool], topics: list[bytes], data: bytes):
+    if sum(indexed) != len(topics):
+        raise ValueError("The number of topics doesn't match the indexed params")
+
+    data_values = iter(decode_types(tuple(param for param, is_indexed in zip(params_type, indexed) if not is_indexed), data))
+    topic_values = iter(topics)
+    params = []
+    for param, is_indexed in zip(params_type, indexed):
+        if not is_indexed:
+            params.append((param, next(data_values)))
+            continue
+
+        topic = next(topic_values)
+        params.append((param, "0x" + topic.hex() if is_hashed_when_indexed(param) else decode_types((param,), topic)[0]))
+
+    return params
+
+
+def decode_event(signature: str, topics: list[bytes], data: bytes, names: list[str] = None, indexed: list[bool] = None):
+    # topics without the event topic. Without the indexed flags (signatures from 4byte.directory), the first combination
+    # of indexed params that decodes is used
+    try:
+        params_type = tuple(parse_signature(signature)[1])
+    except ValueError:
+        return DecodedEvent(signature, error="Unsupported event signature", names=names)
+
+    candidates = [tuple(indexed)] if indexed is not None else indexed_candidates(len(params_type), len(topics))
+    for candidate in candidates:
+        try:
+            return DecodedEvent(signature, decode_with_indexed(params_type, candidate, topics, data), list(candidate), names=names)
+        except ValueError:
+            continue
+
+    return DecodedEvent(signature, error="Invalid event topics or data", names=names)
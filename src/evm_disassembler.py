@@ -0,0 +1,93 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+PUSH1 = 0x60
+PUSH4 = 0x63
+PUSH32 = 0x7F
+EQ = 0x14
+DUP1 = 0x80
+SWAP16 = 0x9F
+
+# Bytes taken by each opcode, including the PUSH immediates
+INSTRUCTION_SIZES = bytes(op - PUSH1 + 2 if PUSH1 <= op <= PUSH32 else 1 for op in range(256))
+
+# Start of the CBOR encoded metadata that solc appends to the runtime code
+# https://docs.soliditylang.org/en/latest/metadata.html#encoding-of-the-metadata-hash-in-the-bytecode
+METADATA_MARKERS = (
+    b"\xa2\x64ipfs\x58\x22",
+    b"\xa3\x64ipfs\x58\x22",
+    b"\xa1\x65bzzr0\x58\x20",
+    b"\xa2\x65bzzr0\x58\x20",
+    b"\xa2\x65bzzr1\x58\x20",
+)
+MAX_METADATA_SIZE = 128
+
+
+def find_metadata_ranges(bytecode: bytes):
+    # The metadata is followed by its length as a 2 bytes big-endian integer, which is used to find where it ends
+    ranges = []
+    for marker in METADATA_MARKERS:
+        start = bytecode.find(marker)
+        while start != -1:
+            for end in range(start + len(marker), min(start + MAX_METADATA_SIZE, len(bytecode) - 1)):
+                if int.from_bytes(bytecode[end : end + 2], "big") == end - start:
+                    ranges.append((start, end + 2))
+                    break
+            start = bytecode.find(marker, start + 1)
+
+    return sorted(ranges)
+
+
+def find_function_selectors(bytecode: bytes):
+    # Walks the opcodes once, skipping PUSH immediates and metadata, looking for the dispatcher comparisons:
+    #   PUSH4 <selector> EQ             (DUP1 PUSH4 <selector> EQ PUSH2 <tag> JUMPI)
+    #   PUSH4 <selector> DUPn/SWAPn EQ  (via-IR and older compilers)
+    #   DUP1 PUSH1-3 <selector> EQ      (the optimizer drops the leading zero bytes, e.g. 0x00fdd58e)
+    # Returns a list of (byte offset, selector) with the first occurrence of each selector.
+    metadata_ranges = find_metadata_ranges(bytecode)
+    next_metadata = metadata_ranges.pop(0) if metadata_ranges != [] else (len(bytecode), len(bytecode))
+
+    selectors = {}
+    index = 0
+    previous_op = None
+    size = len(bytecode)
+    while index < size:
+        if index >= next_metadata[0]:
+            index = max(index, next_metadata[1])
+            next_metadata = metadata_ranges.pop(0) if metadata_ranges != [] else (size, size)
+            continue
+
+        op = bytecode[index]
+        if op == PUSH4 and index + 5 < size:
+            next_op = bytecode[index + 5]
+            if next_op == EQ or (DUP1 <= next_op <= SWAP16 and index + 6 < size and bytecode[index + 6] == EQ):
+                func_selector = "0x" + bytecode[index + 1 : index + 5].hex()
+                if func_selector not in selectors:
+                    selectors[func_selector] = index
+        elif PUSH1 <= op < PUSH4 and previous_op == DUP1:
+            # The shorter pushes are common outside the dispatcher, so only the "DUP1 PUSHn EQ" form is taken
+            push_size = op - PUSH1 + 1
+            if index + push_size + 1 < size and bytecode[index + push_size + 1] == EQ:
+                func_selector = "0x" + bytecode[index + 1 : index + push_size + 1].rjust(4, b"\x00").hex()
+                if func_selector not in selectors:
+                    selectors[func_selector] = index
+
+        previous_op = op
+        index += INSTRUCTION_SIZES[op]
+
+    return [(offset, func_selector) for func_selector, offset in selectors.items()]
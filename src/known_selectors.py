@@ -0,0 +1,327 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+# Generated by src/known_signatures.py (python -m src.known_signatures), do not edit
+
+from types import MappingProxyType
+
+TABLE_VERSION = 1
+SOURCE_HASH = "621be4b6435d2b14af1fb60d333586a9b12e2eb32648bba8299b3866dffcdcd8"
+
+FUNCTIONS = MappingProxyType(
+    {
+        "0x00fdd58e": ("balanceOf(address,uint256)",),
+        "0x017e7e58": ("feeTo()",),
+        "0x01e1d114": ("totalAssets()",),
+        "0x01ffc9a7": ("supportsInterface(bytes4)",),
+        "0x022c0d9f": ("swap(uint256,uint256,address,bytes)",),
+        "0x02751cec": ("removeLiquidityETH(address,uint256,uint256,uint256,address,uint256)",),
+        "0x0396cb60": ("addStake(uint32)",),
+        "0x04e45aaf": ("exactInputSingle((address,address,uint24,address,uint256,uint256,uint160))",),
+        "0x054d50d4": ("getAmountOut(uint256,uint256,uint256)",),
+        "0x06fdde03": ("name()",),
+        "0x07a2d13a": ("convertToAssets(uint256)",),
+        "0x081812fc": ("getApproved(uint256)",),
+        "0x08c379a0": ("Error(string)",),
+        "0x0902f1ac": ("getReserves()",),
+        "0x094b7415": ("feeToSetter()",),
+        "0x095ea7b3": ("approve(address,uint256)",),
+        "0x09b81346": ("exactOutput((bytes,address,uint256,uint256))",),
+        "0x0a28a477": ("previewWithdraw(uint256)",),
+        "0x0c49ccbe": ("decreaseLiquidity((uint256,uint128,uint256,uint256,uint256))",),
+        "0x0d582f13": ("addOwnerWithThreshold(address,uint256)",),
+        "0x0dfe1681": ("token0()",),
+        "0x0e89341c": ("uri(uint256)",),
+        "0x0f28c97d": ("getCurrentBlockTimestamp()",),
+        "0x10d1e85c": ("uniswapV2Call(address,uint256,uint256,bytes)",),
+        "0x12210e8a": ("refundETH()",),
+        "0x128acb08": ("swap(address,bool,int256,uint160,bytes)",),
+        "0x13ead562": ("createAndInitializePoolIfNecessary(address,address,uint24,uint160)",),
+        "0x150b7a02": ("onERC721Received(address,address,uint256,bytes)",),
+        "0x1626ba7e": ("isValidSignature(bytes32,bytes)",),
+        "0x1688f0b9": ("createProxyWithNonce(address,bytes,uint256)",),
+        "0x1698ee82": ("getPool(address,address,uint24)",),
+        "0x174dea71": ("aggregate3Value((address,bool,uint256,bytes)[])",),
+        "0x18160ddd": ("totalSupply()",),
+        "0x18cbafe5": ("swapExactTokensForETH(uint256,uint256,address[],address,uint256)",),
+        "0x18dfb3c7": ("executeBatch(address[],bytes[])",),
+        "0x19822f7c": ("validateUserOp((address,uint256,bytes,bytes,bytes32,uint256,bytes32,bytes,bytes),bytes32,uint256)",),
+        "0x1a686502": ("liquidity()",),
+        "0x1e3dd18b": ("allPairs(uint256)",),
+        "0x1f00ca74": ("getAmountsIn(uint256,address[])",),
+        "0x1f0464d1": ("multicall(bytes32,bytes[])",),
+        "0x1fad948c": ("handleOps((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes)[],address)",),
+        "0x205c2878": ("withdrawTo(address,uint256)",),
+        "0x20c13b0b": ("isValidSignature(bytes,bytes)",),
+        "0x2195995c": ("removeLiquidityWithPermit(address,address,uint256,uint256,uint256,address,uint256,bool,uint8,bytes32,bytes32)",),
+        "0x219f5d17": ("increaseLiquidity((uint256,uint256,uint256,uint256,uint256,uint256))",),
+        "0x22cdde4c": ("getUserOpHash((address,uint256,bytes,bytes,bytes32,uint256,bytes32,bytes,bytes))",),
+        "0x23b872dd": ("transferFrom(address,address,uint256)",),
+        "0x24856bc3": ("execute(bytes,bytes[])",),
+        "0x248a9ca3": ("getRoleAdmin(bytes32)",),
+        "0x252dba42": ("aggregate((address,bytes)[])",),
+        "0x2a2d80d1": ("permit(address,((address,uint160,uint48,uint48)[],address,uint256),bytes)",),
+        "0x2a55205a": ("royaltyInfo(uint256,uint256)",),
+        "0x2b67b570": ("permit(address,((address,uint160,uint48,uint48),address,uint256),bytes)",),
+        "0x2d9ad53d": ("isModuleEnabled(address)",),
+        "0x2e1a7d4d": ("withdraw(uint256)",),
+        "0x2eb2c2d6": ("safeBatchTransferFrom(address,address,uint256[],uint256[],bytes)",),
+        "0x2f2ff15d": ("grantRole(bytes32,address)",),
+        "0x2f54bf6e": ("isOwner(address)",),
+        "0x2f745c59": ("tokenOfOwnerByIndex(address,uint256)",),
+        "0x30f28b7a": ("permitTransferFrom(((address,uint256),uint256,uint256),(address,uint256),address,bytes)",),
+        "0x313ce567": ("decimals()",),
+        "0x32148f67": ("increaseObservationCardinalityNext(uint16)",),
+        "0x35567e1a": ("getNonce(address,uint192)",),
+        "0x3593564c": ("execute(bytes,bytes[],uint256)",),
+        "0x3644e515": ("DOMAIN_SEPARATOR()",),
+        "0x36568abe": ("renounceRole(bytes32,address)",),
+        "0x3659cfe6": ("upgradeTo(address)",),
+        "0x36c78516": ("transferFrom(address,address,uint160,address)",),
+        "0x3850c7bd": ("slot0()",),
+        "0x38d52e0f": ("asset()",),
+        "0x38ed1739": ("swapExactTokensForTokens(uint256,uint256,address[],address,uint256)",),
+        "0x39509351": ("increaseAllowance(address,uint256)",),
+        "0x399542e9": ("tryBlockAndAggregate(bool,(address,bytes)[])",),
+        "0x3a871cdd": ("validateUserOp((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes),bytes32,uint256)",),
+        "0x3c8a7d8d": ("mint(address,int24,int24,uint128,bytes)",),
+        "0x3f4ba83a": ("unpause()",),
+        "0x3ff9dcb1": ("invalidateUnorderedNonces(uint256,uint256)",),
+        "0x402d267d": ("maxDeposit(address)",),
+        "0x414bf389": ("exactInputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))",),
+        "0x42842e0e": ("safeTransferFrom(address,address,uint256)",),
+        "0x42966c68": ("burn(uint256)",),
+        "0x42cbb15c": ("getBlockNumber()",),
+        "0x468721a7": ("execTransactionFromModule(address,uint256,bytes,uint8)",),
+        "0x47e1da2a": ("executeBatch(address[],uint256[],bytes[])",),
+        "0x490e6cbc": ("flash(address,uint256,uint256,bytes)",),
+        "0x49404b7c": ("unwrapWETH9(uint256,address)",),
+        "0x49616997": ("unwrapWETH9(uint256)",),
+        "0x4a25d94a": ("swapTokensForExactETH(uint256,uint256,address[],address,uint256)",),
+        "0x4b1d7cf5": ("handleAggregatedOps(((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes)[],address,bytes)[],address)",),
+        "0x4cdad506": ("previewRedeem(uint256)",),
+        "0x4d2301cc": ("getEthBalance(address)",),
+        "0x4e1273f4": ("balanceOfBatch(address[],uint256[])",),
+        "0x4e487b71": ("Panic(uint256)",),
+        "0x4f1eb3d8": ("collect(address,int24,int24,uint128,uint128)",),
+        "0x4f1ef286": ("upgradeToAndCall(address,bytes)",),
+        "0x4f6ccce7": ("tokenByIndex(uint256)",),
+        "0x5023b4df": ("exactOutputSingle((address,address,uint24,address,uint256,uint256,uint160))",),
+        "0x5229073f": ("execTransactionFromModuleReturnData(address,uint256,bytes,uint8)",),
+        "0x52b7512c": ("validatePaymasterUserOp((address,uint256,bytes,bytes,bytes32,uint256,bytes32,bytes,bytes),bytes32,uint256)",),
+        "0x52d1902d": ("proxiableUUID()",),
+        "0x574f2ba3": ("allPairsLength()",),
+        "0x5909c0d5": ("price0CumulativeLast()",),
+        "0x5a3d5493": ("price1CumulativeLast()",),
+        "0x5ae401dc": ("multicall(uint256,bytes[])",),
+        "0x5ae6bd37": ("signedMessages(bytes32)",),
+        "0x5b0d5984": ("removeLiquidityETHWithPermitSupportingFeeOnTransferTokens(address,uint256,uint256,uint256,address,uint256,bool,uint8,bytes32,bytes32)",),
+        "0x5c11d795": ("swapExactTokensForTokensSupportingFeeOnTransferTokens(uint256,uint256,address[],address,uint256)",),
+        "0x5c60da1b": ("implementation()",),
+        "0x5c975abb": ("paused()",),
+        "0x610b5925": ("enableModule(address)",),
+        "0x6352211e": ("ownerOf(uint256)",),
+        "0x65d9723c": ("invalidateNonces(address,address,uint48)",),
+        "0x694e80c3": ("changeThreshold(uint256)",),
+        "0x6a627842": ("mint(address)",),
+        "0x6a761202": ("execTransaction(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,bytes)",),
+        "0x6e553f65": ("deposit(uint256,address)",),
+        "0x70a08231": ("balanceOf(address)",),
+        "0x715018a6": ("renounceOwnership()",),
+        "0x7464fc3d": ("kLast()",),
+        "0x765e827f": ("handleOps((address,uint256,bytes,bytes,bytes32,uint256,bytes32,bytes,bytes)[],address)",),
+        "0x791ac947": ("swapExactTokensForETHSupportingFeeOnTransferTokens(uint256,uint256,address[],address,uint256)",),
+        "0x79ba5097": ("acceptOwnership()",),
+        "0x7c627b21": ("postOp(uint8,bytes,uint256,uint256)",),
+        "0x7d832974": ("approvedHashes(address,bytes32)",),
+        "0x7ecebe00": ("nonces(address)",),
+        "0x7ff36ab5": ("swapExactETHForTokens(uint256,address[],address,uint256)",),
+        "0x82ad56cb": ("aggregate3((address,bool,bytes)[])",),
+        "0x8456cb59": ("pause()",),
+        "0x84b0196e": ("eip712Domain()",),
+        "0x85f8c259": ("getAmountIn(uint256,uint256,uint256)",),
+        "0x87517c45": ("approve(address,address,uint160,uint48)",),
+        "0x8803dbee": ("swapTokensForExactTokens(uint256,uint256,address[],address,uint256)",),
+        "0x88316456": ("mint((address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,address,uint256))",),
+        "0x883bdbfd": ("observe(uint32[])",),
+        "0x89afcb44": ("burn(address)",),
+        "0x8d80ff0a": ("multiSend(bytes)",),
+        "0x8da5cb5b": ("owner()",),
+        "0x8f283970": ("changeAdmin(address)",),
+        "0x91d14854": ("hasRole(bytes32,address)",),
+        "0x927da105": ("allowance(address,address,address)",),
+        "0x934f3a11": ("checkSignatures(bytes32,bytes,bytes)",),
+        "0x94bf804d": ("mint(uint256,address)",),
+        "0x95d89b41": ("symbol()",),
+        "0x99fbab88": ("positions(uint256)",),
+        "0xa0e67e2b": ("getOwners()",),
+        "0xa1671295": ("createPool(address,address,uint24)",),
+        "0xa217fddf": ("DEFAULT_ADMIN_ROLE()",),
+        "0xa22cb465": ("setApprovalForAll(address,bool)",),
+        "0xa2e74af6": ("setFeeToSetter(address)",),
+        "0xa34123a7": ("burn(int24,int24,uint128)",),
+        "0xa457c2d7": ("decreaseAllowance(address,uint256)",),
+        "0xa6193531": ("getUserOpHash((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes))",),
+        "0xa9059cbb": ("transfer(address,uint256)",),
+        "0xa9a23409": ("postOp(uint8,bytes,uint256)",),
+        "0xac9650d8": ("multicall(bytes[])",),
+        "0xad5c4648": ("WETH()",),
+        "0xad615dec": ("quote(uint256,uint256,uint256)",),
+        "0xaf2979eb": ("removeLiquidityETHSupportingFeeOnTransferTokens(address,uint256,uint256,uint256,address,uint256)",),
+        "0xaffed0e0": ("nonce()",),
+        "0xb3d7f6b9": ("previewMint(uint256)",),
+        "0xb460af94": ("withdraw(uint256,address,address)",),
+        "0xb61d27f6": ("execute(address,uint256,bytes)",),
+        "0xb63e800d": ("setup(address[],uint256,address,bytes,address,address,uint256,address)",),
+        "0xb6f9de95": ("swapExactETHForTokensSupportingFeeOnTransferTokens(uint256,address[],address,uint256)",),
+        "0xb760faf9": ("depositTo(address)",),
+        "0xb858183f": ("exactInput((bytes,address,uint256,uint256))",),
+        "0xb88d4fde": ("safeTransferFrom(address,address,uint256,bytes)",),
+        "0xba087652": ("redeem(uint256,address,address)",),
+        "0xba9a7a56": ("MINIMUM_LIQUIDITY()",),
+        "0xbaa2abde": ("removeLiquidity(address,address,uint256,uint256,uint256,address,uint256)",),
+        "0xbb9fe6bf": ("unlockStake()",),
+        "0xbc197c81": ("onERC1155BatchReceived(address,address,uint256[],uint256[],bytes)",),
+        "0xbc25cf77": ("skim(address)",),
+        "0xbce38bd7": ("tryAggregate(bool,(address,bytes)[])",),
+        "0xc04b8d59": ("exactInput((bytes,address,uint256,uint256,uint256))",),
+        "0xc23a5cea": ("withdrawStake(address)",),
+        "0xc3077fa9": ("blockAndAggregate((address,bytes)[])",),
+        "0xc45a0155": ("factory()",),
+        "0xc63d75b6": ("maxMint(address)",),
+        "0xc6e6f592": ("convertToShares(uint256)",),
+        "0xc87b56dd": ("tokenURI(uint256)",),
+        "0xc9c65396": ("createPair(address,address)",),
+        "0xcc2f8452": ("getModulesPaginated(address,uint256)",),
+        "0xcc53287f": ("lockdown((address,address)[])",),
+        "0xce96cb77": ("maxWithdraw(address)",),
+        "0xd06ca61f": ("getAmountsOut(uint256,address[])",),
+        "0xd0c93a7c": ("tickSpacing()",),
+        "0xd0e30db0": ("deposit()",),
+        "0xd18af54d": ("createProxyWithCallback(address,bytes,uint256,address)",),
+        "0xd21220a7": ("token1()",),
+        "0xd3487997": ("uniswapV3MintCallback(uint256,uint256,bytes)",),
+        "0xd4d9bdcd": ("approveHash(bytes32)",),
+        "0xd505accf": ("permit(address,address,uint256,uint256,uint8,bytes32,bytes32)",),
+        "0xd547741f": ("revokeRole(bytes32,address)",),
+        "0xd6383f94": ("simulateHandleOp((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes),address,bytes)",),
+        "0xd8d11f78": ("getTransactionHash(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,uint256)",),
+        "0xd905777e": ("maxRedeem(address)",),
+        "0xdb3e2198": ("exactOutputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))",),
+        "0xdbed18e0": ("handleAggregatedOps(((address,uint256,bytes,bytes,bytes32,uint256,bytes32,bytes,bytes)[],address,bytes)[],address)",),
+        "0xdd62ed3e": ("allowance(address,address)",),
+        "0xddca3f43": ("fee()",),
+        "0xded9382a": ("removeLiquidityETHWithPermit(address,uint256,uint256,uint256,address,uint256,bool,uint8,bytes32,bytes32)",),
+        "0xdf2ab5bb": ("sweepToken(address,uint256,address)",),
+        "0xe009cfde": ("disableModule(address,address)",),
+        "0xe19a9dd9": ("setGuard(address)",),
+        "0xe30c3978": ("pendingOwner()",),
+        "0xe318b52b": ("swapOwner(address,address,address)",),
+        "0xe6a43905": ("getPair(address,address)",),
+        "0xe75235b8": ("getThreshold()",),
+        "0xe86637db": ("encodeTransactionData(address,uint256,bytes,uint8,uint256,uint256,uint256,address,address,uint256)",),
+        "0xe8e33700": ("addLiquidity(address,address,uint256,uint256,uint256,uint256,address,uint256)",),
+        "0xe90a182f": ("sweepToken(address,uint256)",),
+        "0xe985e9c5": ("isApprovedForAll(address,address)",),
+        "0xe9cbafb0": ("uniswapV3FlashCallback(uint256,uint256,bytes)",),
+        "0xec9e80bb": ("createChainSpecificProxyWithNonce(address,bytes,uint256)",),
+        "0xee219423": ("simulateValidation((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes))",),
+        "0xef8b30f7": ("previewDeposit(uint256)",),
+        "0xf08a0323": ("setFallbackHandler(address)",),
+        "0xf23a6e61": ("onERC1155Received(address,address,uint256,uint256,bytes)",),
+        "0xf242432a": ("safeTransferFrom(address,address,uint256,uint256,bytes)",),
+        "0xf28c0498": ("exactOutput((bytes,address,uint256,uint256,uint256))",),
+        "0xf2fde38b": ("transferOwnership(address)",),
+        "0xf305d719": ("addLiquidityETH(address,uint256,uint256,uint256,address,uint256)",),
+        "0xf465c77e": ("validatePaymasterUserOp((address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes),bytes32,uint256)",),
+        "0xf46901ed": ("setFeeTo(address)",),
+        "0xf637731d": ("initialize(uint160)",),
+        "0xf698da25": ("domainSeparator()",),
+        "0xf851a440": ("admin()",),
+        "0xf8dc5dd9": ("removeOwner(address,address,uint256)",),
+        "0xfa461e33": ("uniswapV3SwapCallback(int256,int256,bytes)",),
+        "0xfb3bdb41": ("swapETHForExactTokens(uint256,address[],address,uint256)",),
+        "0xfc6f7865": ("collect((uint256,address,uint128,uint128))",),
+        "0xffa1ad74": ("VERSION()",),
+        "0xfff6cae9": ("sync()",),
+    }
+)
+
+EVENTS = MappingProxyType(
+    {
+        "0x0c396cd989a39f4459b5fa1aed6a9a8dcdbc45908acfd67e028cd568da98982c": ("Burn(address,int24,int24,uint128,uint256,uint256)",),
+        "0x0d3648bd0f6ba80134a33ba9275ac585d9d315f0ad8355cddefde31afa28d0e9": ("PairCreated(address,address,address,uint256)",),
+        "0x1151116914515bc0891ff9047a6cb32cf902546f83066499bcf8ba33d2353fa2": ("ChangedGuard(address)",),
+        "0x141df868a6331af528e38c83b7aa03edc19be66e37ae67f9285bf4f8e3c6a1a8": ("SafeSetup(address,address[],uint256,address,address)",),
+        "0x17307eab39ab6107e8899845ad3d59bd9653f200f220920489ca2b5937696c31": ("ApprovalForAll(address,address,bool)",),
+        "0x1c411e9a96e071241c2f21f7726b17ae89e3cab4c78be50e062b03a9fffbbad1": ("Sync(uint112,uint112)",),
+        "0x1c4fada7374c0a9ee8841fc38afe82932dc0f8e69012e927f061a8bae611a201": ("UserOperationRevertReason(bytes32,address,uint256,bytes)",),
+        "0x1cf3b03a6cf19fa2baba4df148e9dcabedea7f8a5c07840e207e5c089be95d3e": ("BeaconUpgraded(address)",),
+        "0x23428b18acfb3ea64b08dc0c1d296ea9c09702c09083ca5272e64d115b687d23": ("ExecutionFailure(bytes32,uint256)",),
+        "0x26f6a048ee9138f2c0ce266f322cb99228e8d619ae2bff30c67f8dcf9d2377b4": ("DecreaseLiquidity(uint256,uint128,uint256,uint256)",),
+        "0x2da466a7b24304f47e87fa2e1e5a81b9831ce54fec19055ce277ca2f39ba42c4": ("Deposited(address,uint256)",),
+        "0x2f8788117e7eff1d82e926ec794901d17c78024a50270940304540a733656f0d": ("RoleGranted(bytes32,address,address)",),
+        "0x3067048beee31b25b2f1681f88dac838c8bba36af25bfb2b7cf7473a5847e35f": ("IncreaseLiquidity(uint256,uint128,uint256,uint256)",),
+        "0x38d16b8cac22d99fc7c124b9cd0de2d3fa1faef420bfe791d8c362d765e22700": ("OwnershipTransferStarted(address,address)",),
+        "0x3d0ce9bfc3ed7d6862dbb28b2dea94561fe714a1b4d019aa8af39730d1ad7c3d": ("SafeReceived(address,uint256)",),
+        "0x40d0efd1a53d60ecbf40971b9daf7dc90178c3aadc7aab1765632738fa8b8f01": ("Collect(uint256,address,uint256,uint256)",),
+        "0x442e715f626346e8c54381002da614f62bee8d27386535b2521ec8540898556e": ("ExecutionSuccess(bytes32,uint256)",),
+        "0x49628fd1471006c1482da88028e9ce4dbb080b815c9b0344d39e5a8e6ec1419f": ("UserOperationEvent(bytes32,address,address,uint256,bool,uint256,uint256)",),
+        "0x4a39dc06d4c0dbc64b70af90fd698a233a518aa5d07e595d983b8c0526c8f7fb": ("TransferBatch(address,address,address,uint256[],uint256[])",),
+        "0x4c209b5fc8ad50758f13e2e1088ba56a560dff690a1c6fef26394f4c03821c4f": ("Mint(address,uint256,uint256)",),
+        "0x4f51faf6c4561ff95f067657e43439f0f856d97c04d9ec9070a6199ad418e235": ("ProxyCreation(address,address)",),
+        "0x5ac6c46c93c8d0e53714ba3b53db3e7c046da994313d7ed0d192028bc7c228b0": ("ChangedFallbackHandler(address)",),
+        "0x5db9ee0a495bf2e6ff9c91a7834c1ba4fdd244a5e8aa4e537bd38aeae4b073aa": ("Unpaused(address)",),
+        "0x610f7ff2b304ae8903c3de74c60c6ab1f7d6226b3f52c5161905bb5ad4039c93": ("ChangedThreshold(uint256)",),
+        "0x62e78cea01bee320cd4e420270b5ea74000d11b0c9f74754ebdbfc544b05a258": ("Paused(address)",),
+        "0x6895c13664aa4f67288b25d7a21d7aaa34916e355fb9b6fae0a139a9085becb8": ("ExecutionFromModuleSuccess(address)",),
+        "0x6bb7ff708619ba0610cba295a58592e0451dee2622938c8755667688daf3529b": ("URI(string,uint256)",),
+        "0x70935338e69775456a85ddef226c395fb668b63fa0115f5f20610b388e6ca9c0": ("Collect(address,address,int24,int24,uint128,uint128)",),
+        "0x783cca1c0412dd0d695e784568c96da2e9c22ff989357a2e8b1d9b2b4e6b7118": ("PoolCreated(address,address,uint24,int24,address)",),
+        "0x7a53080ba414158be7ec69b987b5fb7d07dee101fe85488f0853ae16239d0bde": ("Mint(address,address,int24,int24,uint128,uint256,uint256)",),
+        "0x7e644d79422f17c01e4894b5f4f588d331ebfa28653d42ae832dc59e38c9798f": ("AdminChanged(address,address)",),
+        "0x7f26b83ff96e1f2b6a682f133852f6798a09c465da95921460cefb3847402498": ("Initialized(uint8)",),
+        "0x7fcf532c15f0a6db0bd6d0e038bea71d30d808c7d98cb3bf7268a95bf5081b65": ("Withdrawal(address,uint256)",),
+        "0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0": ("OwnershipTransferred(address,address)",),
+        "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925": ("Approval(address,address,uint256)",),
+        "0x9465fa0c962cc76958e6373a993326400c1c94f8be2fe3a952adfa7f60b2ea26": ("AddedOwner(address)",),
+        "0x98636036cb66a9c19a37435efc1e90142190214e8abeb821bdba3f2990dd4c95": ("Initialize(uint160,int24)",),
+        "0xaab4fa2b463f581b2b32cb3b7e3b704b9ce37cc209b5fb4d77e593ace4054276": ("DisabledModule(address)",),
+        "0xacd2c8702804128fdb0db2bb49f6d127dd0181c13fd45dbfe16de0930e2bd375": ("ExecutionFromModuleFailure(address)",),
+        "0xbb47ee3e183a558b1a2ff0874b079f3fc5478b7454eacf2bfc5af2ff5878f972": ("BeforeExecution()",),
+        "0xbc7cd75a20ee27fd9adebab32041f755214dbc6bffa90cc0225b39da2e5c2d3b": ("Upgraded(address)",),
+        "0xbd79b86ffe0ab8e8776151514217cd7cacd52c909f66475c3af44e129f0b00ff": ("RoleAdminChanged(bytes32,bytes32,bytes32)",),
+        "0xbdbdb71d7860376ba52b25a5028beea23581364a40522f6bcfb86bb1f2dca633": ("Flash(address,address,uint256,uint256,uint256,uint256)",),
+        "0xc3d58168c5ae7397731d063d5bbf3d657854427343f4c083240f7aacaa2d0f62": ("TransferSingle(address,address,address,uint256,uint256)",),
+        "0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67": ("Swap(address,address,int256,int256,uint160,uint128,int24)",),
+        "0xc7f505b2f371ae2175ee4913f4499e1f2633a7b5936321eed1cdaeb6115181d2": ("Initialized(uint64)",),
+        "0xd1c19fbcd4551a5edfb66d43d2e337c04837afda3482b42bdf569a8fccdae5fb": ("Withdrawn(address,address,uint256)",),
+        "0xd51a9c61267aa6196961883ecf5ff2da6619c37dac0fa92122513fb32c032d2d": ("AccountDeployed(bytes32,address,address,address)",),
+        "0xd78ad95fa46c994b6551d0da85fc275fe613ce37657fb8d5e3d130840159d822": ("Swap(address,uint256,uint256,uint256,uint256,address)",),
+        "0xdcbc1c05240f31ff3ad067ef1ee35ce4997762752e3a095284754544f4c709d7": ("Deposit(address,address,uint256,uint256)",),
+        "0xdccd412f0b1252819cb1fd330b93224ca42612892bb3f4f789976e6d81936496": ("Burn(address,uint256,uint256,address)",),
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef": ("Transfer(address,address,uint256)",),
+        "0xe1fffcc4923d04b559f4d29a8bfc6cda04eb5b0d3c460751c2402c5c5cc9109c": ("Deposit(address,uint256)",),
+        "0xe7f4675038f4f6034dfcbbb24c4dc08e4ebf10eb9d257d3d02c0f38d122ac6e4": ("SignMsg(bytes32)",),
+        "0xecdf3a3effea5783a3c4c2140e677577666428d44ed9d474a0b3a4c9943f8440": ("EnabledModule(address)",),
+        "0xf2a0eb156472d1440255b0d7c1e19cc07115d1051fe605b0dce69acfec884d9c": ("ApproveHash(bytes32,address)",),
+        "0xf6391f5c32d9c69d2a47ea670b442974b53935d1edc7fd64eb21e047a839171b": ("RoleRevoked(bytes32,address,address)",),
+        "0xf8d49fc529812e9a7c5c50e69c20f0dccc0db8fa95c98bc58cc9a4f1c1299eaf": ("RemovedOwner(address)",),
+        "0xfbde797d201c681b91056529119e0b02407c7bb96a4a2c75c01fc9667232c8db": ("Withdraw(address,address,address,uint256,uint256)",),
+    }
+)
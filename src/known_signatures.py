@@ -0,0 +1,465 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import defaultdict
+import argparse
+import hashlib
+import sys
+import os
+
+from eth_hash.auto import keccak
+
+from src.signature_parser import canonical_signature, function_selector
+
+# Bump it with every change of the signatures below, then regenerate src/known_selectors.py with:
+#   python -m src.known_signatures
+TABLE_VERSION = 1
+TABLE_PATH = os.path.join(os.path.dirname(__file__), "known_selectors.py")
+
+# Canonical signatures of the well-known standards and protocols. The order matters: when two signatures share a
+# selector the first one is ranked first
+USER_OPERATION = "(address,uint256,bytes,bytes,uint256,uint256,uint256,uint256,uint256,bytes,bytes)"
+PACKED_USER_OPERATION = "(address,uint256,bytes,bytes,bytes32,uint256,bytes32,bytes,bytes)"
+SAFE_TRANSACTION = "address,uint256,bytes,uint8,uint256,uint256,uint256,address,address"
+
+FUNCTIONS = {
+    "Solidity": [
+        "Error(string)",
+        "Panic(uint256)",
+    ],
+    "ERC-20": [
+        "transfer(address,uint256)",
+        "transferFrom(address,address,uint256)",
+        "approve(address,uint256)",
+        "allowance(address,address)",
+        "balanceOf(address)",
+        "totalSupply()",
+        "name()",
+        "symbol()",
+        "decimals()",
+        "increaseAllowance(address,uint256)",
+        "decreaseAllowance(address,uint256)",
+    ],
+    "ERC-2612": [
+        "permit(address,address,uint256,uint256,uint8,bytes32,bytes32)",
+        "nonces(address)",
+        "DOMAIN_SEPARATOR()",
+        "eip712Domain()",
+    ],
+    "WETH": [
+        "deposit()",
+        "withdraw(uint256)",
+    ],
+    "ERC-165": [
+        "supportsInterface(bytes4)",
+    ],
+    "ERC-721": [
+        "ownerOf(uint256)",
+        "safeTransferFrom(address,address,uint256)",
+        "safeTransferFrom(address,address,uint256,bytes)",
+        "setApprovalForAll(address,bool)",
+        "getApproved(uint256)",
+        "isApprovedForAll(address,address)",
+        "tokenURI(uint256)",
+        "tokenByIndex(uint256)",
+        "tokenOfOwnerByIndex(address,uint256)",
+        "onERC721Received(address,address,uint256,bytes)",
+    ],
+    "ERC-1155": [
+        "safeTransferFrom(address,address,uint256,uint256,bytes)",
+        "safeBatchTransferFrom(address,address,uint256[],uint256[],bytes)",
+        "balanceOf(address,uint256)",
+        "balanceOfBatch(address[],uint256[])",
+        "uri(uint256)",
+        "onERC1155Received(address,address,uint256,uint256,bytes)",
+        "onERC1155BatchReceived(address,address,uint256[],uint256[],bytes)",
+    ],
+    "ERC-2981": [
+        "royaltyInfo(uint256,uint256)",
+    ],
+    "ERC-1271": [
+        "isValidSignature(bytes32,bytes)",
+        "isValidSignature(bytes,bytes)",
+    ],
+    "ERC-4626": [
+        "asset()",
+        "totalAssets()",
+        "convertToShares(uint256)",
+        "convertToAssets(uint256)",
+        "maxDeposit(address)",
+        "previewDeposit(uint256)",
+        "deposit(uint256,address)",
+        "maxMint(address)",
+        "previewMint(uint256)",
+        "mint(uint256,address)",
+        "maxWithdraw(address)",
+        "previewWithdraw(uint256)",
+        "withdraw(uint256,address,address)",
+        "maxRedeem(address)",
+        "previewRedeem(uint256)",
+        "redeem(uint256,address,address)",
+    ],
+    "OpenZeppelin": [
+        "owner()",
+        "transferOwnership(address)",
+        "renounceOwnership()",
+        "pendingOwner()",
+        "acceptOwnership()",
+        "hasRole(bytes32,address)",
+        "getRoleAdmin(bytes32)",
+        "grantRole(bytes32,address)",
+        "revokeRole(bytes32,address)",
+        "renounceRole(bytes32,address)",
+        "DEFAULT_ADMIN_ROLE()",
+        "paused()",
+        "pause()",
+        "unpause()",
+        "upgradeTo(address)",
+        "upgradeToAndCall(address,bytes)",
+        "proxiableUUID()",
+        "implementation()",
+        "admin()",
+        "changeAdmin(address)",
+        "multicall(bytes[])",
+    ],
+    "Multicall3": [
+        "aggregate((address,bytes)[])",
+        "aggregate3((address,bool,bytes)[])",
+        "aggregate3Value((address,bool,uint256,bytes)[])",
+        "tryAggregate(bool,(address,bytes)[])",
+        "tryBlockAndAggregate(bool,(address,bytes)[])",
+        "blockAndAggregate((address,bytes)[])",
+        "getEthBalance(address)",
+        "getBlockNumber()",
+        "getCurrentBlockTimestamp()",
+    ],
+    "ERC-4337": [
+        f"handleOps({USER_OPERATION}[],address)",
+        f"handleAggregatedOps(({USER_OPERATION}[],address,bytes)[],address)",
+        f"getUserOpHash({USER_OPERATION})",
+        f"simulateValidation({USER_OPERATION})",
+        f"simulateHandleOp({USER_OPERATION},address,bytes)",
+        f"validateUserOp({USER_OPERATION},bytes32,uint256)",
+        f"validatePaymasterUserOp({USER_OPERATION},bytes32,uint256)",
+        "postOp(uint8,bytes,uint256)",
+        f"handleOps({PACKED_USER_OPERATION}[],address)",
+        f"handleAggregatedOps(({PACKED_USER_OPERATION}[],address,bytes)[],address)",
+        f"getUserOpHash({PACKED_USER_OPERATION})",
+        f"validateUserOp({PACKED_USER_OPERATION},bytes32,uint256)",
+        f"validatePaymasterUserOp({PACKED_USER_OPERATION},bytes32,uint256)",
+        "postOp(uint8,bytes,uint256,uint256)",
+        "getNonce(address,uint192)",
+        "depositTo(address)",
+        "addStake(uint32)",
+        "unlockStake()",
+        "withdrawStake(address)",
+        "withdrawTo(address,uint256)",
+        "execute(address,uint256,bytes)",
+        "executeBatch(address[],bytes[])",
+        "executeBatch(address[],uint256[],bytes[])",
+    ],
+    "Uniswap V2": [
+        "addLiquidity(address,address,uint256,uint256,uint256,uint256,address,uint256)",
+        "addLiquidityETH(address,uint256,uint256,uint256,address,uint256)",
+        "removeLiquidity(address,address,uint256,uint256,uint256,address,uint256)",
+        "removeLiquidityETH(address,uint256,uint256,uint256,address,uint256)",
+        "removeLiquidityWithPermit(address,address,uint256,uint256,uint256,address,uint256,bool,uint8,bytes32,bytes32)",
+        "removeLiquidityETHWithPermit(address,uint256,uint256,uint256,address,uint256,bool,uint8,bytes32,bytes32)",
+        "removeLiquidityETHSupportingFeeOnTransferTokens(address,uint256,uint256,uint256,address,uint256)",
+        "removeLiquidityETHWithPermitSupportingFeeOnTransferTokens(address,uint256,uint256,uint256,address,uint256,bool,uint8,bytes32,bytes32)",
+        "swapExactTokensForTokens(uint256,uint256,address[],address,uint256)",
+        "swapTokensForExactTokens(uint256,uint256,address[],address,uint256)",
+        "swapExactETHForTokens(uint256,address[],address,uint256)",
+        "swapTokensForExactETH(uint256,uint256,address[],address,uint256)",
+        "swapExactTokensForETH(uint256,uint256,address[],address,uint256)",
+        "swapETHForExactTokens(uint256,address[],address,uint256)",
+        "swapExactTokensForTokensSupportingFeeOnTransferTokens(uint256,uint256,address[],address,uint256)",
+        "swapExactETHForTokensSupportingFeeOnTransferTokens(uint256,address[],address,uint256)",
+        "swapExactTokensForETHSupportingFeeOnTransferTokens(uint256,uint256,address[],address,uint256)",
+        "quote(uint256,uint256,uint256)",
+        "getAmountOut(uint256,uint256,uint256)",
+        "getAmountIn(uint256,uint256,uint256)",
+        "getAmountsOut(uint256,address[])",
+        "getAmountsIn(uint256,address[])",
+        "factory()",
+        "WETH()",
+        "getReserves()",
+        "token0()",
+        "token1()",
+        "swap(uint256,uint256,address,bytes)",
+        "mint(address)",
+        "burn(address)",
+        "skim(address)",
+        "sync()",
+        "price0CumulativeLast()",
+        "price1CumulativeLast()",
+        "kLast()",
+        "MINIMUM_LIQUIDITY()",
+        "createPair(address,address)",
+        "getPair(address,address)",
+        "allPairs(uint256)",
+        "allPairsLength()",
+        "feeTo()",
+        "feeToSetter()",
+        "setFeeTo(address)",
+        "setFeeToSetter(address)",
+        "uniswapV2Call(address,uint256,uint256,bytes)",
+    ],
+    "Uniswap V3": [
+        "exactInputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))",
+        "exactInput((bytes,address,uint256,uint256,uint256))",
+        "exactOutputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))",
+        "exactOutput((bytes,address,uint256,uint256,uint256))",
+        "exactInputSingle((address,address,uint24,address,uint256,uint256,uint160))",
+        "exactInput((bytes,address,uint256,uint256))",
+        "exactOutputSingle((address,address,uint24,address,uint256,uint256,uint160))",
+        "exactOutput((bytes,address,uint256,uint256))",
+        "multicall(uint256,bytes[])",
+        "multicall(bytes32,bytes[])",
+        "unwrapWETH9(uint256,address)",
+        "unwrapWETH9(uint256)",
+        "refundETH()",
+        "sweepToken(address,uint256,address)",
+        "sweepToken(address,uint256)",
+        "swap(address,bool,int256,uint160,bytes)",
+        "mint(address,int24,int24,uint128,bytes)",
+        "burn(int24,int24,uint128)",
+        "collect(address,int24,int24,uint128,uint128)",
+        "flash(address,uint256,uint256,bytes)",
+        "slot0()",
+        "liquidity()",
+        "fee()",
+        "tickSpacing()",
+        "observe(uint32[])",
+        "initialize(uint160)",
+        "increaseObservationCardinalityNext(uint16)",
+        "createPool(address,address,uint24)",
+        "getPool(address,address,uint24)",
+        "mint((address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,address,uint256))",
+        "increaseLiquidity((uint256,uint256,uint256,uint256,uint256,uint256))",
+        "decreaseLiquidity((uint256,uint128,uint256,uint256,uint256))",
+        "collect((uint256,address,uint128,uint128))",
+        "positions(uint256)",
+        "burn(uint256)",
+        "createAndInitializePoolIfNecessary(address,address,uint24,uint160)",
+        "uniswapV3SwapCallback(int256,int256,bytes)",
+        "uniswapV3MintCallback(uint256,uint256,bytes)",
+        "uniswapV3FlashCallback(uint256,uint256,bytes)",
+    ],
+    "Uniswap Universal Router": [
+        "execute(bytes,bytes[],uint256)",
+        "execute(bytes,bytes[])",
+    ],
+    "Permit2": [
+        "approve(address,address,uint160,uint48)",
+        "allowance(address,address,address)",
+        "permit(address,((address,uint160,uint48,uint48),address,uint256),bytes)",
+        "permit(address,((address,uint160,uint48,uint48)[],address,uint256),bytes)",
+        "transferFrom(address,address,uint160,address)",
+        "permitTransferFrom(((address,uint256),uint256,uint256),(address,uint256),address,bytes)",
+        "invalidateNonces(address,address,uint48)",
+        "invalidateUnorderedNonces(uint256,uint256)",
+        "lockdown((address,address)[])",
+    ],
+    "Safe": [
+        f"execTransaction({SAFE_TRANSACTION},bytes)",
+        "setup(address[],uint256,address,bytes,address,address,uint256,address)",
+        f"getTransactionHash({SAFE_TRANSACTION},uint256)",
+        f"encodeTransactionData({SAFE_TRANSACTION},uint256)",
+        "getOwners()",
+        "getThreshold()",
+        "isOwner(address)",
+        "nonce()",
+        "addOwnerWithThreshold(address,uint256)",
+        "removeOwner(address,address,uint256)",
+        "swapOwner(address,address,address)",
+        "changeThreshold(uint256)",
+        "enableModule(address)",
+        "disableModule(address,address)",
+        "execTransactionFromModule(address,uint256,bytes,uint8)",
+        "execTransactionFromModuleReturnData(address,uint256,bytes,uint8)",
+        "isModuleEnabled(address)",
+        "getModulesPaginated(address,uint256)",
+        "approveHash(bytes32)",
+        "approvedHashes(address,bytes32)",
+        "signedMessages(bytes32)",
+        "setGuard(address)",
+        "setFallbackHandler(address)",
+        "domainSeparator()",
+        "checkSignatures(bytes32,bytes,bytes)",
+        "VERSION()",
+        "createProxyWithNonce(address,bytes,uint256)",
+        "createChainSpecificProxyWithNonce(address,bytes,uint256)",
+        "createProxyWithCallback(address,bytes,uint256,address)",
+        "multiSend(bytes)",
+    ],
+}
+
+EVENTS = {
+    "ERC-20": [
+        "Transfer(address,address,uint256)",
+        "Approval(address,address,uint256)",
+    ],
+    "WETH": [
+        "Deposit(address,uint256)",
+        "Withdrawal(address,uint256)",
+    ],
+    "ERC-721": [
+        "ApprovalForAll(address,address,bool)",
+    ],
+    "ERC-1155": [
+        "TransferSingle(address,address,address,uint256,uint256)",
+        "TransferBatch(address,address,address,uint256[],uint256[])",
+        "URI(string,uint256)",
+    ],
+    "ERC-4626": [
+        "Deposit(address,address,uint256,uint256)",
+        "Withdraw(address,address,address,uint256,uint256)",
+    ],
+    "OpenZeppelin": [
+        "OwnershipTransferred(address,address)",
+        "OwnershipTransferStarted(address,address)",
+        "RoleGranted(bytes32,address,address)",
+        "RoleRevoked(bytes32,address,address)",
+        "RoleAdminChanged(bytes32,bytes32,bytes32)",
+        "Paused(address)",
+        "Unpaused(address)",
+        "Upgraded(address)",
+        "AdminChanged(address,address)",
+        "BeaconUpgraded(address)",
+        "Initialized(uint8)",
+        "Initialized(uint64)",
+    ],
+    "ERC-4337": [
+        "UserOperationEvent(bytes32,address,address,uint256,bool,uint256,uint256)",
+        "AccountDeployed(bytes32,address,address,address)",
+        "UserOperationRevertReason(bytes32,address,uint256,bytes)",
+        "BeforeExecution()",
+        "Deposited(address,uint256)",
+        "Withdrawn(address,address,uint256)",
+    ],
+    "Uniswap V2": [
+        "Swap(address,uint256,uint256,uint256,uint256,address)",
+        "Sync(uint112,uint112)",
+        "Mint(address,uint256,uint256)",
+        "Burn(address,uint256,uint256,address)",
+        "PairCreated(address,address,address,uint256)",
+    ],
+    "Uniswap V3": [
+        "Swap(address,address,int256,int256,uint160,uint128,int24)",
+        "Mint(address,address,int24,int24,uint128,uint256,uint256)",
+        "Burn(address,int24,int24,uint128,uint256,uint256)",
+        "Collect(address,address,int24,int24,uint128,uint128)",
+        "Flash(address,address,uint256,uint256,uint256,uint256)",
+        "Initialize(uint160,int24)",
+        "PoolCreated(address,address,uint24,int24,address)",
+        "IncreaseLiquidity(uint256,uint128,uint256,uint256)",
+        "DecreaseLiquidity(uint256,uint128,uint256,uint256)",
+        "Collect(uint256,address,uint256,uint256)",
+    ],
+    "Safe": [
+        "ExecutionSuccess(bytes32,uint256)",
+        "ExecutionFailure(bytes32,uint256)",
+        "AddedOwner(address)",
+        "RemovedOwner(address)",
+        "ChangedThreshold(uint256)",
+        "EnabledModule(address)",
+        "DisabledModule(address)",
+        "ExecutionFromModuleSuccess(address)",
+        "ExecutionFromModuleFailure(address)",
+        "ChangedGuard(address)",
+        "ChangedFallbackHandler(address)",
+        "SafeSetup(address,address[],uint256,address,address)",
+        "SafeReceived(address,uint256)",
+        "SignMsg(bytes32)",
+        "ApproveHash(bytes32,address)",
+        "ProxyCreation(address,address)",
+    ],
+}
+
+
+def build_table(standards: dict[str, list[str]], event: bool = False):
+    # {selector or topic: (signatures)}, sorted by selector so the generated file only changes with the signatures
+    table = defaultdict(list)
+    for signatures in standards.values():
+        for signature in signatures:
+            signature = canonical_signature(signature)
+            selector = "0x" + keccak(signature.encode("utf-8")).hex() if event else function_selector(signature)
+            if signature not in table[selector]:
+                table[selector].append(signature)
+
+    return dict(sorted(table.items()))
+
+
+def source_hash():
+    # Of the canonical signatures, to tell if the generated table is outdated
+    content = repr((TABLE_VERSION, build_table(FUNCTIONS), build_table(EVENTS, True)))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def render_table(name: str, table: dict[str, list[str]]):
+    lines = [f"{name} = MappingProxyType(", "    {"]
+    for selector, signatures in table.items():
+        quoted = ", ".join(f'"{signature}"' for signature in signatures)
+        lines.append(f'        "{selector}": ({quoted}{"," if len(signatures) == 1 else ""}),')
+    lines += ["    }", ")"]
+    return "\n".join(lines)
+
+
+def generate():
+    with open(__file__, "r", encoding="utf-8") as source:
+        header = source.read().split('"""', 2)[1]
+
+    return "\n".join(
+        [
+            f'"""{header}"""',
+            "",
+            "# Generated by src/known_signatures.py (python -m src.known_signatures), do not edit",
+            "",
+            "from types import MappingProxyType",
+            "",
+            f"TABLE_VERSION = {TABLE_VERSION}",
+            f'SOURCE_HASH = "{source_hash()}"',
+            "",
+            render_table("FUNCTIONS", build_table(FUNCTIONS)),
+            "",
+            render_table("EVENTS", build_table(EVENTS, True)),
+            "",
+        ]
+    )
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(prog="python -m src.known_signatures", description="Generates src/known_selectors.py")
+    parser.add_argument("--check", action="store_true", help="only check that the generated table is up to date")
+    args = parser.parse_args(argv)
+
+    table = generate()
+    if args.check:
+        with open(TABLE_PATH, "r", encoding="utf-8") as table_file:
+            if table_file.read() != table:
+                sys.exit(f"{TABLE_PATH} is outdated, run python -m src.known_signatures")
+        return
+
+    with open(TABLE_PATH, "w", encoding="utf-8") as table_file:
+        table_file.write(table)
+    print(f"{TABLE_PATH} generated (version {TABLE_VERSION})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from functools import wraps
+import threading
+import cProfile
+import pstats
+import time
+import os
+
+# Any value enables the metrics from the start (the CLI and the server can also enable them later)
+METRICS_VARIABLE = "CRAZYTOOLBOX_METRICS"
+PROMETHEUS_PREFIX = "crazytoolbox"
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+# Shared by every disabled timer, so a disabled metric only costs an attribute check
+NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.__lock = threading.Lock()
+        # name: [count, total seconds, max seconds]
+        self.__timers = {}
+        self.__counters = {}
+
+        # cProfile only sees the thread that enables it, so the profiled calls are serialized and each one is run
+        # under the shared profiler (nested instrumented calls are part of the outermost one)
+        self.__profiler = None
+        self.__profiler_lock = threading.RLock()
+        self.__profiling = threading.local()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def timer(self, name: str):
+        return _Timer(self, name) if self.enabled else NULL_TIMER
+
+    def observe(self, name: str, seconds: float):
+        with self.__lock:
+            timer = self.__timers.get(name)
+            if timer is None:
+                self.__timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    def increment(self, name: str, value: int = 1):
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def reset(self):
+        with self.__lock:
+            self.__timers.clear()
+            self.__counters.clear()
+
+    def snapshot(self):
+        with self.__lock:
+            return {
+                "counters": dict(sorted(self.__counters.items())),
+                "timers": {
+                    name: {
+                        "count": count,
+                        "total_seconds": round(total, 6),
+                        "mean_ms": round(total / count * 1000, 3),
+                        "max_ms": round(maximum * 1000, 3),
+                    }
+                    for name, (count, total, maximum) in sorted(self.__timers.items())
+                },
+            }
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX):
+        with self.__lock:
+            counters = sorted(self.__counters.items())
+            timers = sorted((name, list(timer)) for name, timer in self.__timers.items())
+
+        lines = [f"# TYPE {prefix}_events_total counter"]
+        lines += [f'{prefix}_events_total{{event="{name}"}} {value}' for name, value in counters]
+
+        lines.append(f"# TYPE {prefix}_operation_seconds summary")
+        for name, (count, total, _) in timers:
+            lines.append(f'{prefix}_operation_seconds_count{{operation="{name}"}} {count}')
+            lines.append(f'{prefix}_operation_seconds_sum{{operation="{name}"}} {total:.6f}')
+
+        lines.append(f"# TYPE {prefix}_operation_max_seconds gauge")
+        lines += [f'{prefix}_operation_max_seconds{{operation="{name}"}} {maximum:.6f}' for name, (_, _, maximum) in timers]
+        return "\n".join(lines) + "\n"
+
+    @property
+    def profiling(self):
+        return self.__profiler is not None
+
+    def start_profiling(self):
+        with self.__profiler_lock:
+            if self.__profiler is None:
+                self.__profiler = cProfile.Profile()
+
+    def stop_profiling(self, path: str = None):
+        # Returns the collected stats, saved to path (pstats format, e.g. for snakeviz) if given
+        with self.__profiler_lock:
+            profiler, self.__profiler = self.__profiler, None
+
+        if profiler is None:
+            return None
+
+        stats = pstats.Stats(profiler)
+        if path is not None:
+            stats.dump_stats(path)
+        return stats
+
+    def profile_call(self, function, *args, **kwargs):
+        if getattr(self.__profiling, "active", False):
+            return function(*args, **kwargs)
+
+        with self.__profiler_lock:
+            profiler = self.__profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+
+            self.__profiling.active = True
+            try:
+                return profiler.runcall(function, *args, **kwargs)
+            finally:
+                self.__profiling.active = False
+
+
+metrics = Metrics(os.environ.get(METRICS_VARIABLE, "") != "")
+
+
+def instrumented(name: str):
+    # Times every call of the decorated function under name (and profiles it in the profiling mode)
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                if metrics.profiling:
+                    return metrics.profile_call(function, *args, **kwargs)
+                return function(*args, **kwargs)
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,47 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+
+
+def chunked(values, chunk_size: int):
+    values = iter(values)
+    return iter(lambda: list(islice(values, chunk_size)), [])
+
+
+def map_chunks(function, chunks, workers: int = 1, *args):
+    # Yields (chunk, function(chunk, *args)) in the same order as the chunks. With several workers the chunks are
+    # processed in other processes, with only a few of them in flight at a time so memory use stays bounded
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk, function(chunk, *args)
+        return
+
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            in_flight.append((chunk, executor.submit(function, chunk, *args)))
+            if len(in_flight) > workers * 2:
+                chunk, future = in_flight.popleft()
+                yield chunk, future.result()
+
+        while len(in_flight) > 0:
+            chunk, future = in_flight.popleft()
+            yield chunk, future.result()
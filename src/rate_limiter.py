@@ -0,0 +1,56 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, calls: int, period: float):
+        self.__capacity = calls
+        self.__refill_rate = calls / period
+        self.__tokens = float(calls)
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__refill_rate)
+        self.__updated_at = now
+
+    def try_acquire(self):
+        with self.__lock:
+            self.__refill()
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return True
+            return False
+
+    # Blocks until a token is available, returns the time spent waiting
+    def acquire(self):
+        waited = 0.0
+        while True:
+            with self.__lock:
+                self.__refill()
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return waited
+                wait = (1 - self.__tokens) / self.__refill_rate
+
+            time.sleep(wait)
+            waited += wait
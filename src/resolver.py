@@ -0,0 +1,258 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import requests
+
+from src.abi_index import AbiIndex
+from src.selector_db import SelectorDatabase
+from src.rate_limiter import TokenBucket
+from src.known_selectors import EVENTS as KNOWN_EVENTS, FUNCTIONS as KNOWN_FUNCTIONS
+from src.metrics import metrics
+
+FOUR_BYTE_URL = "https://www.4byte.directory/api/v1/signatures/"
+FOUR_BYTE_EVENTS_URL = "https://www.4byte.directory/api/v1/event-signatures/"
+OPENCHAIN_URL = "https://api.openchain.xyz/signature-database/v1/lookup"
+MAX_RESOLVER_WORKERS = 8
+DEFAULT_TIMEOUT = 10
+
+# What is looked up, the 4 bytes selector of a function or the topic of an event
+FUNCTION = "function"
+EVENT = "event"
+
+# Modes of the remote lookups: the first backend with an answer wins, or the answers of all of them are merged
+FIRST = "first"
+MERGE = "merge"
+
+
+class CircuitBreaker:
+    # After max_failures consecutive failures the backend is skipped for reset_timeout seconds, then a single trial
+    # request decides whether it is closed again
+    def __init__(self, max_failures: int = 5, reset_timeout: float = 30):
+        self.__max_failures = max_failures
+        self.__reset_timeout = reset_timeout
+        self.__failures = 0
+        self.__opened_at = None
+        self.__trial = False
+        self.__lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.__opened_at is not None
+
+    def allow(self):
+        with self.__lock:
+            if self.__opened_at is None:
+                return True
+            if self.__trial or time.monotonic() - self.__opened_at < self.__reset_timeout:
+                return False
+            self.__trial = True
+            return True
+
+    def record_success(self):
+        with self.__lock:
+            self.__failures = 0
+            self.__opened_at = None
+            self.__trial = False
+
+    def record_failure(self):
+        with self.__lock:
+            self.__failures += 1
+            if self.__trial or self.__failures >= self.__max_failures:
+                self.__opened_at = time.monotonic()
+                self.__trial = False
+
+
+class ResolverBackend:
+    # lookup returns the signatures of a "0x" prefixed selector (or event topic), [] when it is unknown, and raises when
+    # the source fails. Local backends are queried before any request is made
+    local = False
+
+    def __init__(self, name: str, timeout: float = DEFAULT_TIMEOUT, rate_limiter: TokenBucket = None):
+        self.name = name
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.breaker = CircuitBreaker()
+
+    def lookup(self, selector: str, kind: str = FUNCTION):
+        raise NotImplementedError
+
+
+class HttpBackend(ResolverBackend):
+    def __init__(self, name: str, url: str, timeout: float = DEFAULT_TIMEOUT, rate_limiter: TokenBucket = None):
+        super().__init__(name, timeout, rate_limiter)
+        self.url = url
+
+        # A keep-alive session shared by the concurrent lookups, retrying the transient errors
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=MAX_RESOLVER_WORKERS, max_retries=retry))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=MAX_RESOLVER_WORKERS, max_retries=retry))
+
+    def get_json(self, url: str, params: dict):
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class FourByteBackend(HttpBackend):
+    # 4byte.directory or any mirror of its API. 5 requests per 2 seconds because of the API limits
+    def __init__(self, url: str = FOUR_BYTE_URL, timeout: float = DEFAULT_TIMEOUT, calls: int = 5, period: float = 2):
+        super().__init__("4byte" if url == FOUR_BYTE_URL else url, url, timeout, TokenBucket(calls, period))
+        self.events_url = url.replace("/signatures/", "/event-signatures/")
+
+    def lookup(self, selector: str, kind: str = FUNCTION):
+        response = self.get_json(self.url if kind == FUNCTION else self.events_url, {"hex_signature": selector})
+        return [result["text_signature"] for result in response["results"]]
+
+
+class OpenChainBackend(HttpBackend):
+    # openchain.xyz signature database (also used by Foundry) or any mirror of its API
+    def __init__(self, url: str = OPENCHAIN_URL, timeout: float = DEFAULT_TIMEOUT, calls: int = 10, period: float = 1):
+        super().__init__("openchain" if url == OPENCHAIN_URL else url, url, timeout, TokenBucket(calls, period))
+
+    def lookup(self, selector: str, kind: str = FUNCTION):
+        response = self.get_json(self.url, {kind: selector, "filter": "true"})
+        if not response.get("ok", False):
+            raise ValueError(response.get("error", "Invalid response"))
+        return [result["name"] for result in response["result"][kind].get(selector) or []]
+
+
+def rank_known_signatures(selector: str, signatures: list[str], kind: str = FUNCTION):
+    # Moves the signatures of the well-known standards before the rest of the candidates of a selector
+    known = (KNOWN_FUNCTIONS if kind == FUNCTION else KNOWN_EVENTS).get(SignatureResolver.normalize(selector), ())
+    if known == () or len(signatures) < 2:
+        return signatures
+    return [signature for signature in signatures if signature in known] + [signature for signature in signatures if signature not in known]
+
+
+class KnownSelectorsBackend(ResolverBackend):
+    # Generated table of the well-known standards and protocols (ERC-20, ERC-721, Uniswap, Safe...), see
+    # src/known_signatures.py. It answers most of the lookups without any request, after the ABIs of the project
+    local = True
+
+    def __init__(self):
+        super().__init__("known")
+
+    def lookup(self, selector: str, kind: str = FUNCTION):
+        return list((KNOWN_FUNCTIONS if kind == FUNCTION else KNOWN_EVENTS).get(selector, ()))
+
+
+class SelectorDatabaseBackend(ResolverBackend):
+    local = True
+
+    def __init__(self, database: SelectorDatabase):
+        super().__init__("database")
+        self.database = database
+
+    def lookup(self, selector: str, kind: str = FUNCTION):
+        # Only function selectors are stored
+        return self.database.lookup(selector) if kind == FUNCTION else []
+
+
+class AbiDirectoryBackend(ResolverBackend):
+    # Functions and events of the ABI files (or Hardhat/Foundry artifacts) of the index directories
+    local = True
+
+    def __init__(self, abi_index: AbiIndex):
+        super().__init__("abi")
+        self.abi_index = abi_index
+
+    def lookup(self, selector: str, kind: str = FUNCTION):
+        entries = self.abi_index.lookup_function(selector) if kind == FUNCTION else self.abi_index.lookup_event(selector)
+        return [entry["signature"] for entry in entries]
+
+
+class SignatureResolver:
+    # Looks up the selectors in the local backends first and then in all the remote ones at the same time. Each backend
+    # has its own timeout, rate limiter and circuit breaker, so a slow or failing source never blocks the others
+    def __init__(self, backends: list[ResolverBackend], mode: str = FIRST):
+        if mode not in (FIRST, MERGE):
+            raise ValueError(f"Unknown resolver mode: {mode}")
+
+        self.backends = backends
+        self.mode = mode
+        self.__executor = ThreadPoolExecutor(max_workers=MAX_RESOLVER_WORKERS)
+
+    @staticmethod
+    def normalize(selector: str):
+        return "0x" + selector.strip().lower().replace("0x", "")
+
+    def resolve_locally(self, selector: str, kind: str = FUNCTION):
+        # Returns the signatures or [] if no local backend knows the selector
+        selector = self.normalize(selector)
+        for backend in self.backends:
+            if backend.local:
+                decoded = self.__lookup(backend, selector, kind)
+                if decoded:
+                    return decoded
+        return []
+
+    def resolve_remotely(self, selector: str, kind: str = FUNCTION):
+        # Returns the signatures, [] if they are unknown or None if every backend failed (the result must not be cached)
+        selector = self.normalize(selector)
+        backends = [backend for backend in self.backends if not backend.local and backend.breaker.allow()]
+        if backends == []:
+            return None
+
+        futures = {self.__executor.submit(self.__lookup, backend, selector, kind): backend for backend in backends}
+        answers = {}
+        for future in as_completed(futures):
+            decoded = future.result()
+            if decoded and self.mode == FIRST:
+                return decoded
+            answers[futures[future]] = decoded
+
+        if all(decoded is None for decoded in answers.values()):
+            return None
+
+        # Merged keeping the order of the backends
+        merged = []
+        for backend in backends:
+            for signature in answers[backend] or []:
+                if signature not in merged:
+                    merged.append(signature)
+        return merged
+
+    def resolve(self, selector: str, kind: str = FUNCTION):
+        return self.resolve_locally(selector, kind) or self.resolve_remotely(selector, kind)
+
+    @staticmethod
+    def __lookup(backend: ResolverBackend, selector: str, kind: str):
+        if backend.rate_limiter is not None:
+            waited = backend.rate_limiter.acquire()
+            if metrics.enabled and waited > 0:
+                metrics.observe(f"throttle.{backend.name}", waited)
+
+        # The time of the remote backends is the network time (requests and retries)
+        try:
+            with metrics.timer(f"lookup.{backend.name}"):
+                decoded = backend.lookup(selector, kind)
+        except Exception:
+            backend.breaker.record_failure()
+            if metrics.enabled:
+                metrics.increment(f"lookup.{backend.name}.error")
+            return None
+
+        backend.breaker.record_success()
+        return decoded
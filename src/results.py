@@ -0,0 +1,111 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from dataclasses import dataclass, field
+
+
+def to_json(value):
+    # Decoded params can hold raw bytes (bytesN, bytes), which are written as hex
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass
+class ConversionResult:
+    value: str
+    currency_from: str
+    currency_to: str
+    output: str = ""
+    error: str = None
+
+
+@dataclass
+class SelectorEncodeResult:
+    signature: str = ""
+    selector: str = ""
+    error: str = None
+
+
+@dataclass
+class SelectorDecodeResult:
+    selector: str
+    signatures: list[str] = field(default_factory=list)
+    error: str = None
+
+
+@dataclass
+class DecodedCall:
+    signature: str
+    # (type, value) pairs, None if the params don't match the signature
+    params: list[tuple[str, object]] = None
+    error: str = None
+    # Param names, only known when the signature comes from an indexed ABI
+    names: list[str] = None
+
+
+@dataclass
+class TransactionDecodeResult:
+    # "call" or "creation"
+    kind: str
+    selector: str = ""
+    signatures: list[str] = field(default_factory=list)
+    calls: list[DecodedCall] = field(default_factory=list)
+    # Contract creation: selectors found in the bytecode (in order) and their signatures, None until resolved
+    selectors: dict[str, list[str]] = field(default_factory=dict)
+    error: str = None
+
+
+@dataclass
+class HashResult:
+    value: str
+    hash: str
+    error: str = None
+
+
+@dataclass
+class AddressValidationResult:
+    address: str
+    is_address: bool = False
+    is_checksum_address: bool = False
+    checksum_address: str = ""
+
+
+@dataclass
+class SignerResult:
+    owner: str = ""
+    error: str = None
+
+
+@dataclass
+class DecodedEvent:
+    signature: str
+    # (type, value) pairs, None if the topics and data don't match the signature. The indexed params of dynamic types
+    # (string, bytes, arrays and tuples) only have the hash of their value
+    params: list[tuple[str, object]] = None
+    indexed: list[bool] = None
+    error: str = None
+    names: list[str] = None
+
+
+@dataclass
+class EventDecodeResult:
+    topic: str = ""
+    signatures: list[str] = field(default_factory=list)
+    events: list[DecodedEvent] = field(default_factory=list)
+    error: str = None
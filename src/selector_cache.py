@@ -0,0 +1,136 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import sqlite3
+import json
+import time
+import os
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".crazytoolbox", "selector_cache.sqlite3")
+FOUND_TTL = 30 * 24 * 60 * 60
+NOT_FOUND_TTL = 24 * 60 * 60
+MAX_ENTRIES = 100_000
+
+
+class SelectorCache:
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = FOUND_TTL,
+        not_found_ttl: float = NOT_FOUND_TTL,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self.__ttl = ttl
+        self.__not_found_ttl = not_found_ttl
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # The decoders run on worker threads, so the connection is shared behind a lock
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS selectors ("
+            "selector TEXT PRIMARY KEY, signatures TEXT NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS selectors_last_access ON selectors (last_access)")
+        self.__size = self.__connection.execute("SELECT COUNT(*) FROM selectors").fetchone()[0]
+
+    @staticmethod
+    def normalize(func_selector: str):
+        return func_selector.strip().lower().replace("0x", "")
+
+    def get(self, func_selector: str):
+        func_selector = self.normalize(func_selector)
+        now = time.time()
+
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT signatures, expires_at FROM selectors WHERE selector = ?", (func_selector,)
+            ).fetchone()
+
+            if row is None or row[1] < now:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__connection.execute("UPDATE selectors SET last_access = ? WHERE selector = ?", (now, func_selector))
+
+        signatures = json.loads(row[0])
+        return signatures if signatures != [] else ["Not found"]
+
+    def set(self, func_selector: str, signatures: list[str]):
+        func_selector = self.normalize(func_selector)
+        now = time.time()
+
+        # "Not found" results are stored as an empty list and expire sooner
+        if signatures == [] or signatures[0] == "Not found":
+            signatures, ttl = [], self.__not_found_ttl
+        else:
+            ttl = self.__ttl
+
+        with self.__lock:
+            inserted = self.__connection.execute(
+                "INSERT OR IGNORE INTO selectors (selector, signatures, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (func_selector, json.dumps(signatures), now + ttl, now),
+            ).rowcount
+            if inserted:
+                self.__size += 1
+            else:
+                self.__connection.execute(
+                    "UPDATE selectors SET signatures = ?, expires_at = ?, last_access = ? WHERE selector = ?",
+                    (json.dumps(signatures), now + ttl, now, func_selector),
+                )
+
+            if self.__size > self.__max_entries:
+                self.__evict()
+
+    def __evict(self):
+        # Drop the expired entries first and then the least recently used ones (10% headroom)
+        self.__connection.execute("DELETE FROM selectors WHERE expires_at < ?", (time.time(),))
+        self.__size = self.__connection.execute("SELECT COUNT(*) FROM selectors").fetchone()[0]
+
+        if self.__size > self.__max_entries:
+            to_delete = self.__size - int(self.__max_entries * 0.9)
+            self.__connection.execute(
+                "DELETE FROM selectors WHERE selector IN (SELECT selector FROM selectors ORDER BY last_access LIMIT ?)",
+                (to_delete,),
+            )
+            self.__size -= to_delete
+
+    def stats(self):
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self.__size}
+
+    def clear(self):
+        with self.__lock:
+            self.__connection.execute("DELETE FROM selectors")
+            self.__size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,176 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import bisect
+import struct
+import mmap
+import json
+import csv
+import sys
+import os
+
+from web3 import Web3
+
+DEFAULT_DATABASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "selectors.bin")
+
+# File layout (little-endian):
+#   header:  magic (8 bytes) | entries count (u32) | blob size (u32)
+#   keys:    count x u32 selectors, sorted (repeated for colliding signatures)
+#   offsets: (count + 1) x u32 offsets into the blob, the last one is the blob end
+#   blob:    UTF-8 text signatures, concatenated
+MAGIC = b"CTBSDB01"
+HEADER = struct.Struct("<8sII")
+
+
+class _LittleEndianU32Array:
+    # Fallback for big-endian hosts, where memoryview.cast("I") can't be used
+    def __init__(self, buffer):
+        self.__buffer = buffer
+
+    def __len__(self):
+        return len(self.__buffer) // 4
+
+    def __getitem__(self, index: int):
+        return struct.unpack_from("<I", self.__buffer, index * 4)[0]
+
+
+class SelectorDatabase:
+    def __init__(self, path: str = DEFAULT_DATABASE_PATH):
+        self.__view = self.__keys = self.__offsets = None
+        self.__file = open(path, "rb")
+        self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.__count, blob_size = HEADER.unpack_from(self.__mmap, 0)
+        if magic != MAGIC or len(self.__mmap) != HEADER.size + self.__count * 8 + 4 + blob_size:
+            self.close()
+            raise ValueError(f"Invalid selector database: {path}")
+
+        keys_start = HEADER.size
+        offsets_start = keys_start + self.__count * 4
+        self.__blob_start = offsets_start + (self.__count + 1) * 4
+
+        # Nothing is loaded into memory, the views read straight from the mapped file
+        self.__view = memoryview(self.__mmap)
+        if sys.byteorder == "little":
+            self.__keys = self.__view[keys_start:offsets_start].cast("I")
+            self.__offsets = self.__view[offsets_start : self.__blob_start].cast("I")
+        else:
+            self.__keys = _LittleEndianU32Array(self.__view[keys_start:offsets_start])
+            self.__offsets = _LittleEndianU32Array(self.__view[offsets_start : self.__blob_start])
+
+    def __len__(self):
+        return self.__count
+
+    def lookup(self, func_selector: str):
+        try:
+            key = int(func_selector.strip().replace("0x", ""), 16)
+        except ValueError:
+            return []
+
+        index = bisect.bisect_left(self.__keys, key)
+        signatures = []
+        while index < self.__count and self.__keys[index] == key:
+            start = self.__blob_start + self.__offsets[index]
+            end = self.__blob_start + self.__offsets[index + 1]
+            signatures.append(str(self.__mmap[start:end], "utf-8"))
+            index += 1
+
+        return signatures
+
+    def close(self):
+        # The views must be released before closing the map
+        self.__keys = self.__offsets = None
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+        self.__mmap.close()
+        self.__file.close()
+
+
+def read_signatures_dump(path: str):
+    # Accepts CSV (selector,text_signature), JSON (list of objects or {selector: [signatures]}) and JSONL dumps.
+    # Rows without selector get it computed from the text signature.
+    with open(path, "r", encoding="utf-8") as dump:
+        if path.endswith(".csv"):
+            for row in csv.reader(dump):
+                if len(row) == 0 or row[0].strip() in ("hex_signature", "selector", "text_signature"):
+                    continue
+                # Unquoted signatures are split by their own commas, so the rest of the row is joined back
+                if len(row) > 1 and (row[0].strip() == "" or "(" not in row[0]):
+                    yield row[0], ",".join(row[1:])
+                else:
+                    yield None, ",".join(row)
+        elif path.endswith(".jsonl"):
+            for line in dump:
+                if line.strip() != "":
+                    row = json.loads(line)
+                    yield row.get("hex_signature", row.get("selector")), row["text_signature"]
+        else:
+            rows = json.load(dump)
+            if isinstance(rows, dict):
+                rows = rows.get("results", rows)
+            if isinstance(rows, dict):
+                for func_selector, signatures in rows.items():
+                    for signature in signatures if isinstance(signatures, list) else [signatures]:
+                        yield func_selector, signature
+            else:
+                for row in rows:
+                    yield row.get("hex_signature", row.get("selector")), row["text_signature"]
+
+
+def build_selector_database(dump_path: str, output_path: str = DEFAULT_DATABASE_PATH):
+    entries = set()
+    for func_selector, signature in read_signatures_dump(dump_path):
+        signature = signature.strip()
+        if signature == "":
+            continue
+        if func_selector is None or func_selector.strip() == "":
+            func_selector = Web3.keccak(text=signature)[:4].hex()
+        entries.add((int(func_selector.strip().replace("0x", ""), 16), signature))
+
+    entries = sorted(entries)
+    offsets = [0]
+    blob = bytearray()
+    for _, signature in entries:
+        blob += signature.encode("utf-8")
+        offsets.append(len(blob))
+
+    if len(blob) > 0xFFFFFFFF:
+        raise ValueError("Signatures dump too big, the blob must fit in 4 GB")
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir != "":
+        os.makedirs(output_dir, exist_ok=True)
+
+    with open(output_path, "wb") as output:
+        output.write(HEADER.pack(MAGIC, len(entries), len(blob)))
+        output.write(struct.pack(f"<{len(entries)}I", *[key for key, _ in entries]))
+        output.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        output.write(blob)
+
+    return len(entries)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds the offline selector database from a 4byte-style dump")
+    parser.add_argument("dump", help="CSV, JSON or JSONL file with selector,text_signature rows")
+    parser.add_argument("output", nargs="?", default=DEFAULT_DATABASE_PATH, help="output database file")
+    args = parser.parse_args()
+
+    print(f"{build_selector_database(args.dump, args.output)} signatures written to {args.output}")
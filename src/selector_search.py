@@ -0,0 +1,191 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+import time
+import os
+
+from eth_hash.auto import keccak
+
+DEFAULT_CHARSET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$"
+JOB_SIZE = 200_000
+PROGRESS_INTERVAL = 4096
+
+# Shared with the workers through the pool initializer
+_stop_event = None
+_checked = None
+
+
+def _init_worker(stop_event, checked):
+    global _stop_event, _checked
+    _stop_event = stop_event
+    _checked = checked
+
+
+def _search_range(prefix: bytes, suffix: bytes, charset: bytes, length: int, start: int, count: int, target: bytes, nibble: int):
+    # Enumerates the names [start, start + count) of the given length. The signature is built once in a preallocated
+    # buffer and only the changed characters are rewritten on each step (like an odometer)
+    base = len(charset)
+    digits = []
+    for _ in range(length):
+        start, digit = divmod(start, base)
+        digits.append(digit)
+    digits.reverse()
+
+    buffer = bytearray(prefix + bytes(charset[digit] for digit in digits) + suffix)
+    offset = len(prefix)
+    target_size = len(target)
+    # Solidity identifiers can't start with a digit
+    check_first_char = prefix == b""
+    matches = []
+    pending = 0
+
+    for _ in range(count):
+        if not (check_first_char and 48 <= buffer[0] <= 57):
+            digest = keccak(buffer)
+            if digest[:target_size] == target and (nibble < 0 or digest[target_size] >> 4 == nibble):
+                matches.append((buffer.decode("utf-8"), "0x" + digest[:4].hex()))
+
+        position = length - 1
+        while position >= 0:
+            digits[position] += 1
+            if digits[position] < base:
+                buffer[offset + position] = charset[digits[position]]
+                break
+            digits[position] = 0
+            buffer[offset + position] = charset[0]
+            position -= 1
+
+        pending += 1
+        if pending == PROGRESS_INTERVAL:
+            with _checked.get_lock():
+                _checked.value += pending
+            pending = 0
+            if _stop_event.is_set():
+                break
+
+    with _checked.get_lock():
+        _checked.value += pending
+
+    return matches
+
+
+class SelectorSearch:
+    # Looks for function names that, with the given params, produce a selector starting with the target (a full
+    # selector for collisions or a prefix such as "0000" for gas-optimized selectors)
+    def __init__(
+        self,
+        target: str,
+        params_type: list[str],
+        prefix: str = "",
+        charset: str = DEFAULT_CHARSET,
+        min_length: int = 1,
+        max_length: int = 6,
+        max_results: int = 1,
+        workers: int = None,
+    ):
+        target = target.strip().lower().replace("0x", "")
+        if target == "" or len(target) > 8 or any(char not in "0123456789abcdef" for char in target):
+            raise ValueError("Invalid target selector")
+
+        if prefix != "" and prefix[0] in "0123456789" or any(char not in DEFAULT_CHARSET for char in prefix + charset):
+            raise ValueError("Invalid function name prefix or charset")
+
+        self.__target = bytes.fromhex(target[: len(target) // 2 * 2])
+        self.__nibble = int(target[-1], 16) if len(target) % 2 == 1 else -1
+        self.__prefix = prefix.encode("utf-8")
+        self.__suffix = f'({",".join(params_type)})'.encode("utf-8")
+        self.__charset = "".join(dict.fromkeys(charset)).encode("utf-8")
+        self.__min_length = max(min_length, 0 if prefix != "" else 1)
+        self.__max_length = max_length
+        self.__max_results = max_results
+        self.__workers = workers or os.cpu_count() or 1
+
+        context = multiprocessing.get_context()
+        self.__stop_event = context.Event()
+        self.__checked = context.Value("Q", 0)
+        self.__context = context
+        # The stop event also ends the workers when the search finishes, only cancel() marks it as cancelled
+        self.__cancelled = False
+
+        self.matches = []
+        self.started_at = None
+
+    @property
+    def checked(self):
+        return self.__checked.value
+
+    @property
+    def rate(self):
+        elapsed = time.monotonic() - self.started_at if self.started_at is not None else 0
+        return self.checked / elapsed if elapsed > 0 else 0
+
+    @property
+    def cancelled(self):
+        return self.__cancelled
+
+    def cancel(self):
+        self.__cancelled = True
+        self.__stop_event.set()
+
+    def __jobs(self):
+        for length in range(self.__min_length, self.__max_length + 1):
+            total = len(self.__charset) ** length
+            for start in range(0, total, JOB_SIZE):
+                yield (self.__prefix, self.__suffix, self.__charset, length, start, min(JOB_SIZE, total - start), self.__target, self.__nibble)
+
+    def run(self, on_progress=None, progress_interval: float = 0.5):
+        # Blocks until max_results matches are found, the search space is exhausted or it is cancelled. on_progress is
+        # called with the search itself every progress_interval seconds
+        self.started_at = time.monotonic()
+        jobs = self.__jobs()
+        in_flight = set()
+
+        with ProcessPoolExecutor(
+            max_workers=self.__workers,
+            mp_context=self.__context,
+            initializer=_init_worker,
+            initargs=(self.__stop_event, self.__checked),
+        ) as executor:
+            while not self.__stop_event.is_set():
+                while len(in_flight) < self.__workers * 2:
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    in_flight.add(executor.submit(_search_range, *job))
+
+                if len(in_flight) == 0:
+                    break
+
+                done, in_flight = wait(in_flight, timeout=progress_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.matches.extend(future.result())
+
+                if len(self.matches) >= self.__max_results:
+                    self.__stop_event.set()
+
+                if on_progress is not None:
+                    on_progress(self)
+
+            # Stops the running jobs as soon as possible, keeping the matches they found until then
+            self.__stop_event.set()
+            for future in in_flight:
+                self.matches.extend(future.result())
+
+        return self.matches[: self.__max_results] if len(self.matches) >= self.__max_results else self.matches
@@ -0,0 +1,138 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import Counter
+import heapq
+
+# Number of selectors tracked by the heavy hitters, the memory used does not depend on the size of the input
+DEFAULT_CAPACITY = 10_000
+DEFAULT_TOP = 20
+
+CALL = "call"
+CREATION = "creation"
+TRANSFER = "transfer"
+INVALID = "invalid"
+
+
+class SpaceSaving:
+    # Space-Saving heavy hitters (Metwally et al.): at most capacity keys are tracked. A new key replaces the least
+    # counted one and inherits its count as the error, so every key seen more than total / capacity times is kept and
+    # its count is overestimated by at most its error
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("The capacity must be positive")
+
+        self.capacity = capacity
+        self.total = 0
+        # key: [count, error]
+        self.__counters = {}
+        # (count, key) of every tracked key, the counts may be outdated (lower) and are fixed when popped
+        self.__heap = []
+
+    def __len__(self):
+        return len(self.__counters)
+
+    def add(self, key: str, count: int = 1):
+        self.total += count
+        counter = self.__counters.get(key)
+        if counter is not None:
+            counter[0] += count
+            return
+
+        if len(self.__counters) < self.capacity:
+            self.__counters[key] = [count, 0]
+            heapq.heappush(self.__heap, (count, key))
+            return
+
+        # Evict the key with the lowest count
+        while True:
+            minimum, evicted = heapq.heappop(self.__heap)
+            current = self.__counters[evicted][0]
+            if current == minimum:
+                break
+            heapq.heappush(self.__heap, (current, evicted))
+
+        del self.__counters[evicted]
+        self.__counters[key] = [minimum + count, minimum]
+        heapq.heappush(self.__heap, (minimum + count, key))
+
+    def top(self, k: int):
+        # [(key, count, error)] sorted by count, the counts are upper bounds and count - error lower bounds
+        return [(key, count, error) for key, (count, error) in heapq.nlargest(k, self.__counters.items(), key=lambda item: item[1][0])]
+
+
+def classify_input(transaction_input: str):
+    # Returns (kind, selector) reading only the start of the input, the contract creations can be very large
+    transaction_input = transaction_input[:64].strip()
+    if transaction_input[:2] in ("0x", "0X"):
+        transaction_input = transaction_input[2:]
+
+    if transaction_input == "":
+        return TRANSFER, ""
+    if transaction_input[:8] in ("60806040", "60606040"):
+        return CREATION, ""
+
+    selector = transaction_input[:8].lower()
+    if len(selector) != 8 or any(char not in "0123456789abcdef" for char in selector):
+        return INVALID, ""
+    return CALL, "0x" + selector
+
+
+class SelectorStatistics:
+    # Streaming statistics of the selectors of a transaction dump, in bounded memory
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.selectors = SpaceSaving(capacity)
+        self.kinds = Counter()
+
+    def add(self, transaction_input: str):
+        kind, selector = classify_input(transaction_input)
+        self.kinds[kind] += 1
+        if kind == CALL:
+            self.selectors.add(selector)
+
+    def update(self, transaction_inputs):
+        for transaction_input in transaction_inputs:
+            self.add(transaction_input)
+        return self
+
+    def report(self, toolbox=None, k: int = DEFAULT_TOP):
+        # Only the top k selectors are resolved, toolbox is a ToolBox (None skips the resolution)
+        top = self.selectors.top(k)
+        signatures = {}
+        if toolbox is not None and top != []:
+            signatures = dict(toolbox.resolve_function_selectors([selector for selector, _, _ in top]))
+
+        calls = self.selectors.total
+        return {
+            "transactions": sum(self.kinds.values()),
+            "calls": calls,
+            "creations": self.kinds[CREATION],
+            "transfers": self.kinds[TRANSFER],
+            "invalid": self.kinds[INVALID],
+            "tracked_selectors": len(self.selectors),
+            "top": [
+                {
+                    "selector": selector,
+                    "count": count,
+                    "error": error,
+                    "share": round(count / calls * 100, 2),
+                    "signatures": [signature for signature in signatures.get(selector, []) if signature != "Not found"],
+                }
+                for selector, count, error in top
+            ],
+        }
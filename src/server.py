@@ -0,0 +1,215 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from collections import deque
+from http import HTTPStatus
+import asyncio
+import json
+import time
+
+from src.results import to_json
+from src.metrics import metrics
+from src.toolbox import ToolBox
+
+MAX_WORKERS = 16
+MAX_BODY_SIZE = 16 * 1024 * 1024
+IDLE_TIMEOUT = 60
+LATENCY_SAMPLES = 1024
+
+
+class LatencyStats:
+    # Keeps the count and the latest samples of an endpoint, the percentiles are computed on demand
+    def __init__(self, samples: int = LATENCY_SAMPLES):
+        self.requests = 0
+        self.items = 0
+        self.errors = 0
+        self.__total = 0.0
+        self.__max = 0.0
+        self.__samples = deque(maxlen=samples)
+
+    def record(self, elapsed: float, items: int, error: bool = False):
+        self.requests += 1
+        self.items += items
+        self.errors += error
+        self.__total += elapsed
+        self.__max = max(self.__max, elapsed)
+        self.__samples.append(elapsed)
+
+    def summary(self):
+        samples = sorted(self.__samples)
+        percentile = lambda p: round(samples[min(len(samples) - 1, int(len(samples) * p))] * 1000, 3) if samples != [] else 0
+        return {
+            "requests": self.requests,
+            "items": self.items,
+            "errors": self.errors,
+            "mean_ms": round(self.__total / self.requests * 1000, 3) if self.requests > 0 else 0,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(self.__max * 1000, 3),
+        }
+
+
+class ToolBoxServer:
+    # HTTP/JSON service exposing the toolbox operations, without Qt. Every endpoint takes a JSON object or a list of
+    # them (batch) and answers with a result or a list of results in the same order. All the clients share one toolbox,
+    # so one selector cache and one 4byte.directory rate limiter
+    def __init__(self, toolbox: ToolBox = None, workers: int = MAX_WORKERS):
+        self.toolbox = toolbox if toolbox is not None else ToolBox()
+        self.__executor = ThreadPoolExecutor(max_workers=workers)
+
+        # path: (fields, function, fan out). The lookups can wait on the network, so each item of a batch runs in its own
+        # thread. The local operations run the whole batch in a single one
+        self.__endpoints = {
+            "/encode": (("signature",), self.toolbox.function_selector_encoder_advanced, False),
+            "/decode-selector": (("selector",), self.toolbox.function_selector_decoder, True),
+            "/decode": (("input",), self.toolbox.decode_transaction_input, True),
+            "/decode-event": (("topics", "data"), self.toolbox.decode_event_log, True),
+            "/keccak": (("value",), self.toolbox.keccak256_hash, False),
+            "/eip55": (("address",), self.toolbox.eip55_validator, False),
+            "/recover": (("message", "signature"), self.toolbox.get_signer_owner, False),
+            "/convert": (("value", "from", "to"), self.toolbox.wei_converter, False),
+        }
+        self.latency = {path: LatencyStats() for path in self.__endpoints}
+
+    def stats(self):
+        return {
+            "endpoints": {path: stats.summary() for path, stats in self.latency.items()},
+            "selector_cache": self.toolbox.selector_cache.stats(),
+            "resolver": {backend.name: {"circuit_open": backend.breaker.is_open} for backend in self.toolbox.resolver.backends},
+            "metrics": metrics.snapshot(),
+        }
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            keep_alive = True
+            while keep_alive:
+                request = await self.__read_request(reader)
+                if request is None:
+                    break
+
+                method, path, body, keep_alive = request
+                status, payload = await self.__dispatch(method, path, body)
+                await self.__write_response(writer, status, payload, keep_alive)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError as error:
+            # Malformed request, the connection can not be reused
+            await self.__write_response(writer, HTTPStatus.BAD_REQUEST, {"error": str(error)}, False)
+        finally:
+            writer.close()
+
+    async def __read_request(self, reader: asyncio.StreamReader):
+        request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+        if request_line == b"":
+            return None
+
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            raise ValueError("Invalid request line")
+
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_BODY_SIZE:
+            raise ValueError("Request body too large")
+        body = await asyncio.wait_for(reader.readexactly(length), IDLE_TIMEOUT) if length > 0 else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        return method, target.split("?")[0], body, keep_alive
+
+    async def __write_response(self, writer: asyncio.StreamWriter, status: HTTPStatus, payload, keep_alive: bool):
+        # The text payloads are the Prometheus metrics
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload, default=to_json).encode("utf-8"), "application/json"
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def __dispatch(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/stats":
+            return HTTPStatus.OK, self.stats()
+        if method == "GET" and path == "/metrics":
+            return HTTPStatus.OK, metrics.to_prometheus()
+        if method == "GET" and path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}
+        if path not in self.__endpoints:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint {path}"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST"}
+
+        start = time.perf_counter()
+        items = 0
+        try:
+            fields, function, fan_out = self.__endpoints[path]
+            request = json.loads(body)
+            batch = isinstance(request, list)
+            args = [self.__parse_item(item, fields) for item in (request if batch else [request])]
+            items = len(args)
+
+            loop = asyncio.get_running_loop()
+            if fan_out:
+                results = await asyncio.gather(*(loop.run_in_executor(self.__executor, function, *item) for item in args))
+            else:
+                results = await loop.run_in_executor(self.__executor, lambda: [function(*item) for item in args])
+        except ValueError as error:
+            self.latency[path].record(time.perf_counter() - start, items, True)
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        except Exception as error:
+            # A failing toolbox call must still answer the request, the connection stays usable
+            self.latency[path].record(time.perf_counter() - start, items, True)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"}
+
+        self.latency[path].record(time.perf_counter() - start, items)
+        results = [asdict(result) for result in results]
+        return HTTPStatus.OK, results if batch else results[0]
+
+    @staticmethod
+    def __parse_item(item, fields: tuple[str]):
+        if not isinstance(item, dict):
+            raise ValueError("Each item must be a JSON object")
+
+        # The topics of the events are the only list
+        missing = [name for name in fields if not isinstance(item.get(name), list if name == "topics" else str)]
+        if missing != []:
+            raise ValueError(f"Missing or invalid fields: {', '.join(missing)}")
+
+        return [item[name] for name in fields]
@@ -0,0 +1,163 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from functools import lru_cache
+import sys
+
+from eth_hash.auto import keccak
+
+from src.abi_decoder import split_params
+
+PARSER_CACHE_SIZE = 65_536
+
+# Canonical ABI types, https://docs.soliditylang.org/en/latest/abi-spec.html#types
+ELEMENTARY_TYPES = frozenset(
+    ["address", "bool", "string", "bytes", "function"]
+    + [f"{sign}int{bits}" for sign in ("", "u") for bits in range(8, 257, 8)]
+    + [f"bytes{size}" for size in range(1, 33)]
+    + [f"{sign}fixed{bits}x{decimals}" for sign in ("", "u") for bits in range(8, 257, 8) for decimals in range(1, 81)]
+)
+TYPE_ALIASES = {"uint": "uint256", "int": "int256", "byte": "bytes1", "fixed": "fixed128x18", "ufixed": "ufixed128x18"}
+
+# Words of the params copied from the source code that are not part of the type
+PARAM_KEYWORDS = frozenset(("memory", "calldata", "storage", "indexed"))
+DECLARATION_KEYWORDS = ("function", "event", "error")
+# Words that can follow the params of a declaration, besides "returns (...)" and "override(...)"
+DECLARATION_TRAILERS = frozenset(
+    ("external", "public", "internal", "private", "pure", "view", "payable", "nonpayable", "virtual", "override", "anonymous")
+)
+IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789$_")
+
+
+def is_valid_function_name(func_name: str):
+    # https://docs.soliditylang.org/en/v0.8.6/grammar.html#identifiers
+    if func_name == "" or func_name[0] in "0123456789":
+        return False
+
+    for char in func_name:
+        if char not in IDENTIFIER_CHARS:
+            return False
+
+    return True
+
+
+def closing_parenthesis(text: str, start: int):
+    # Index of the parenthesis closing the one at start
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+
+    raise ValueError(f"Unbalanced parentheses: {text}")
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def canonical_type(param: str):
+    # "uint[] memory amounts" -> "uint256[]", "(address payable to, uint value)[2]" -> "(address,uint256)[2]". Raises
+    # ValueError for unknown types (structs, enums and contracts can't be resolved without their source)
+    param = param.strip()
+    if param.startswith("tuple("):
+        param = param[5:]
+
+    if param.startswith("("):
+        end = closing_parenthesis(param, 0)
+        canonical = "(" + ",".join(canonical_type(component) for component in split_params(param[1:end])) + ")"
+        rest = param[end + 1 :]
+    else:
+        end = next((index for index, char in enumerate(param) if char.isspace() or char == "["), len(param))
+        canonical = TYPE_ALIASES.get(param[:end], param[:end])
+        if canonical not in ELEMENTARY_TYPES:
+            raise ValueError(f"Unknown param type: {param[:end] or param}")
+
+        rest = param[end:].lstrip()
+        if canonical == "address" and rest.startswith("payable") and (rest[7:8] in ("", "[") or rest[7:8].isspace()):
+            rest = rest[7:]
+
+    # Array dimensions, "[]" or "[size]"
+    rest = rest.lstrip()
+    while rest.startswith("["):
+        end = rest.find("]")
+        size = rest[1:end].strip()
+        if end == -1 or size != "" and (not size.isdigit() or int(size) == 0):
+            raise ValueError(f"Invalid array size: {param}")
+        canonical += f"[{int(size)}]" if size != "" else "[]"
+        rest = rest[end + 1 :].lstrip()
+
+    # Then only the data location (or indexed) and the name can follow
+    words = [word for word in rest.split() if word not in PARAM_KEYWORDS]
+    if len(words) > 1 or words != [] and not is_valid_function_name(words[0]):
+        raise ValueError(f"Invalid param: {param}")
+
+    return sys.intern(canonical)
+
+
+def check_trailers(trailing: str, signature: str):
+    # Visibility, mutability, override and returns clauses, ended by the end of the text, ";" or the body
+    if trailing != "" and not trailing[0].isspace() and trailing[0] not in ";{":
+        raise ValueError(f"Invalid function signature: {signature}")
+
+    rest = trailing.lstrip()
+    while rest != "" and rest[0] not in ";{":
+        end = next((index for index, char in enumerate(rest) if char not in IDENTIFIER_CHARS), len(rest))
+        word, rest = rest[:end], rest[end:].lstrip()
+        if word == "returns" and rest.startswith("(") or word == "override" and rest.startswith("("):
+            rest = rest[closing_parenthesis(rest, 0) + 1 :].lstrip()
+        elif word not in DECLARATION_TRAILERS:
+            raise ValueError(f"Invalid function signature: {signature}")
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def canonical_params(params: str):
+    # "address to, uint amount" -> ("address", "uint256")
+    return tuple(canonical_type(param) for param in split_params(params))
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def parse_function_signature(signature: str):
+    # "transfer(address,uint)" or "function transfer(address to, uint256 amount) external returns (bool)" ->
+    # ("transfer", ("address", "uint256")). The name is not validated, raises ValueError if the rest is invalid
+    signature = signature.strip()
+    for keyword in DECLARATION_KEYWORDS:
+        if signature.startswith(keyword) and signature[len(keyword) : len(keyword) + 1].isspace():
+            signature = signature[len(keyword) :].lstrip()
+            break
+
+    start = signature.find("(")
+    if start == -1:
+        raise ValueError(f"Invalid function signature: {signature}")
+
+    end = closing_parenthesis(signature, start)
+    check_trailers(signature[end + 1 :], signature)
+
+    return sys.intern(signature[:start].strip()), canonical_params(signature[start + 1 : end])
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def canonical_signature(signature: str):
+    func_name, params_type = parse_function_signature(signature)
+    return sys.intern(f"{func_name}({','.join(params_type)})")
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def function_selector(signature: str):
+    # Of a canonical signature
+    return "0x" + keccak(signature.encode("utf-8"))[:4].hex()
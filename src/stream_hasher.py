@@ -0,0 +1,73 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import mmap
+import stat
+import os
+import re
+
+from eth_hash.auto import keccak
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = re.compile(r"\s")
+
+
+def hash_chunks(chunks, total: int, on_progress=None):
+    # Feeds the chunks to an incremental keccak. on_progress(hashed, total) is called after each chunk and can return
+    # False to stop, then None is returned instead of the digest
+    hasher = keccak.new(b"")
+    hashed = 0
+    for chunk in chunks:
+        hasher.update(chunk)
+        hashed += len(chunk)
+        if on_progress is not None and on_progress(hashed, total) is False:
+            return None
+
+    return hasher.digest()
+
+
+def hash_file(path: str, on_progress=None, chunk_size: int = CHUNK_SIZE):
+    with open(path, "rb") as file:
+        status = os.fstat(file.fileno())
+        # Pipes and devices can't be mapped and their size is unknown (0)
+        if not stat.S_ISREG(status.st_mode):
+            return hash_chunks(iter(lambda: file.read(chunk_size), b""), 0, on_progress)
+
+        size = status.st_size
+        if size == 0:
+            return hash_chunks([], 0, on_progress)
+
+        # Mapped instead of read, only one chunk at a time is copied out of the page cache
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            chunks = (mapped[offset : offset + chunk_size] for offset in range(0, size, chunk_size))
+            return hash_chunks(chunks, size, on_progress)
+
+
+def hash_hex(value: str, on_progress=None, chunk_size: int = CHUNK_SIZE):
+    # Hashes the bytes of a hex string ("0x" optional), raises ValueError if it is not valid hex
+    value = value.strip()
+    if value[:2] in ("0x", "0X"):
+        value = value[2:]
+    # Multiline dumps, the whitespace could split a byte between two chunks
+    if WHITESPACE.search(value) is not None:
+        value = "".join(value.split())
+    if len(value) % 2 != 0:
+        raise ValueError("Odd number of hex digits")
+
+    chunks = (bytes.fromhex(value[offset : offset + 2 * chunk_size]) for offset in range(0, len(value), 2 * chunk_size))
+    return hash_chunks(chunks, len(value) // 2, on_progress)
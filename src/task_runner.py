@@ -0,0 +1,124 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+
+from PySide6.QtCore import QObject, QThread, QThreadPool, QTimer, Signal, Slot
+
+MIN_THREADS = 4
+
+
+class _Channel:
+    # Stands for one of the signals of the result signal object (result, result_to_copy...)
+    def __init__(self, runner, name: str):
+        self.__runner = runner
+        self.__name = name
+
+    def emit(self, value):
+        self.__runner.forward(self.__name, value)
+
+
+class TaskRunner(QObject):
+    # Runs the core calls of the GUI in a shared thread pool. Each key (one per tab) has its own debounce timer and a
+    # generation number: a new call supersedes the scheduled and running ones of the same key, and only the results of
+    # the latest generation reach the result signal. It is passed to the core in place of the result signal
+    __emitted = Signal(str, int, str, object)
+
+    def __init__(self, signal, signal_names: tuple[str]):
+        super().__init__()
+        self.__signal = signal
+        self.__generations = {}
+        self.__scheduled = {}
+        self.__timers = {}
+        self.__task = threading.local()
+
+        # Blocking calls (network lookups, selector search) must not starve the rest of the tabs
+        self.__pool = QThreadPool(self)
+        self.__pool.setMaxThreadCount(max(MIN_THREADS, QThread.idealThreadCount()))
+
+        for name in signal_names:
+            setattr(self, name, _Channel(self, name))
+
+        # Emitted from the pool threads, delivered in the GUI thread where the generations are updated
+        self.__emitted.connect(self.__deliver)
+
+    def submit(self, key: str, delay: int, function, *args):
+        generation = self.__generations.get(key, 0) + 1
+        self.__generations[key] = generation
+        self.__scheduled[key] = (generation, function, args)
+
+        if delay <= 0:
+            self.__start(key)
+            return
+
+        timer = self.__timers.get(key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self.__start(key))
+            self.__timers[key] = timer
+
+        # Restarting the timer drops the previous call if it was still waiting
+        timer.start(delay)
+
+    def cancel_all(self):
+        # Drops every scheduled call and the results of the running ones (e.g. when the tab changes)
+        for timer in self.__timers.values():
+            timer.stop()
+        self.__scheduled.clear()
+        for key in self.__generations:
+            self.__generations[key] += 1
+
+    def shutdown(self):
+        self.cancel_all()
+        self.__pool.clear()
+
+    def superseded(self):
+        # Polled by the long tasks, True once a newer call of the same key (or cancel_all) makes its result useless
+        task = getattr(self.__task, "current", None)
+        return task is not None and self.__generations.get(task[0]) != task[1]
+
+    def forward(self, name: str, value):
+        task = getattr(self.__task, "current", None)
+        if task is None:
+            # Called outside the pool (from the GUI thread), nothing to drop
+            getattr(self.__signal, name).emit(value)
+        else:
+            self.__emitted.emit(task[0], task[1], name, value)
+
+    def __start(self, key: str):
+        scheduled = self.__scheduled.pop(key, None)
+        if scheduled is not None:
+            generation, function, args = scheduled
+            self.__pool.start(lambda: self.__run(key, generation, function, args))
+
+    def __run(self, key: str, generation: int, function, args: tuple):
+        # Superseded while waiting for a free thread
+        if self.__generations.get(key) != generation:
+            return
+
+        self.__task.current = (key, generation)
+        try:
+            function(*args)
+        finally:
+            self.__task.current = None
+
+    @Slot(str, int, str, object)
+    def __deliver(self, key: str, generation: int, name: str, value):
+        if self.__generations.get(key) == generation:
+            getattr(self.__signal, name).emit(value)
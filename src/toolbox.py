@@ -0,0 +1,357 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+
+from web3 import Web3
+
+from src.results import (
+    AddressValidationResult,
+    ConversionResult,
+    DecodedCall,
+    EventDecodeResult,
+    HashResult,
+    SelectorDecodeResult,
+    SelectorEncodeResult,
+    SignerResult,
+    TransactionDecodeResult,
+)
+from src.bulk_address import CHECKSUMMED, FIXED, INVALID, check_address
+from src.bulk_signer import recover_signer
+from src.evm_disassembler import find_function_selectors
+from src.abi_decoder import decode_params
+from src.event_decoder import decode_event, parse_log
+from src.unit_converter import convert_unit, convert_units
+from src.stream_hasher import hash_file, hash_hex
+from src.signature_parser import canonical_type, function_selector, is_valid_function_name, parse_function_signature
+from src.metrics import instrumented, metrics
+from src.resolver import (
+    EVENT,
+    FUNCTION,
+    MAX_RESOLVER_WORKERS,
+    AbiDirectoryBackend,
+    FourByteBackend,
+    KnownSelectorsBackend,
+    SelectorDatabaseBackend,
+    SignatureResolver,
+    rank_known_signatures,
+)
+from src.abi_index import AbiIndex, DEFAULT_ABI_DIRECTORY
+from src.selector_cache import SelectorCache
+from src.selector_db import SelectorDatabase, DEFAULT_DATABASE_PATH
+
+# Returned by the encoders when a param type is not selected yet, the GUI keeps the previous output
+INVALID_PARAM_TYPE = "Invalid param type"
+# Returned by the streaming hashes stopped by their on_progress callback
+HASH_CANCELLED = "Cancelled"
+
+
+class ToolBox:
+    def __init__(
+        self,
+        selector_cache: SelectorCache = None,
+        selector_database: SelectorDatabase = None,
+        resolver: SignatureResolver = None,
+        abi_index: AbiIndex = None,
+    ):
+        self.selector_cache = selector_cache if selector_cache is not None else SelectorCache()
+
+        # The offline database is optional, it is only used if it has been built
+        if selector_database is None and os.path.isfile(DEFAULT_DATABASE_PATH):
+            selector_database = SelectorDatabase(DEFAULT_DATABASE_PATH)
+        self.selector_database = selector_database
+
+        # Same with the ABIs directory, indexed if it exists
+        if abi_index is None and os.path.isdir(DEFAULT_ABI_DIRECTORY):
+            abi_index = AbiIndex([DEFAULT_ABI_DIRECTORY])
+        self.abi_index = abi_index
+
+        # By default the ABIs (the project's own signatures win), the well-known selectors, the offline database and
+        # 4byte.directory. The resolver and its rate limiters are shared by all the lookups, including the concurrent ones
+        if resolver is None:
+            backends = [AbiDirectoryBackend(abi_index)] if abi_index is not None else []
+            backends.append(KnownSelectorsBackend())
+            if selector_database is not None:
+                backends.append(SelectorDatabaseBackend(selector_database))
+            resolver = SignatureResolver(backends + [FourByteBackend()])
+        self.resolver = resolver
+
+    def __resolve_locally(self, selector: str, kind: str = FUNCTION):
+        # The answer of a local backend is kept as it is, the ABIs of the project come before the well-known selectors
+        decoded = self.resolver.resolve_locally(selector, kind)
+        if decoded != []:
+            return decoded
+
+        # Cached selectors skip both the requests and the rate limiters. Event topics are longer, so they never collide
+        # with the function selectors
+        decoded = self.selector_cache.get(selector)
+        if metrics.enabled:
+            metrics.increment("selector_cache.hit" if decoded is not None else "selector_cache.miss")
+        return decoded
+
+    def __resolve_remotely(self, selector: str, kind: str = FUNCTION):
+        decoded = self.resolver.resolve_remotely(selector, kind)
+
+        # Failed lookups are not cached, so they are retried on the next lookup
+        if decoded is None:
+            return ["Not found"]
+
+        # The remote sources can have several candidates (or merge several answers), the well-known ones go first
+        decoded = rank_known_signatures(selector, decoded, kind) if decoded != [] else ["Not found"]
+        self.selector_cache.set(selector, decoded)
+        return decoded
+
+    def __resolve_many(self, selectors: list[str], kind: str):
+        # Yields (selector, signatures) as soon as each one is resolved. Duplicates are only looked up once and the
+        # selectors already known locally are returned before any request is made
+        selectors = list(dict.fromkeys(selectors))
+        pending = []
+        for selector in selectors:
+            decoded = self.__resolve_locally(selector, kind)
+            if decoded is None:
+                pending.append(selector)
+            else:
+                yield selector, decoded
+
+        if pending == []:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_RESOLVER_WORKERS, len(pending))) as executor:
+            futures = {executor.submit(self.__resolve_remotely, selector, kind): selector for selector in pending}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    @instrumented("resolve_function_selector")
+    def resolve_function_selector(self, func_selector: str):
+        decoded = self.__resolve_locally(func_selector)
+        if decoded is not None:
+            return decoded
+
+        return self.__resolve_remotely(func_selector)
+
+    def resolve_function_selectors(self, func_selectors: list[str]):
+        return self.__resolve_many(func_selectors, FUNCTION)
+
+    @instrumented("resolve_event_topic")
+    def resolve_event_topic(self, topic: str):
+        decoded = self.__resolve_locally(topic, EVENT)
+        if decoded is not None:
+            return decoded
+
+        return self.__resolve_remotely(topic, EVENT)
+
+    def resolve_event_topics(self, topics: list[str]):
+        return self.__resolve_many(topics, EVENT)
+
+    def function_param_names(self, func_selector: str):
+        # {signature: param names} of the functions of the indexed ABIs with that selector
+        if self.abi_index is None:
+            return {}
+        return {entry["signature"]: [param["name"] for param in entry["inputs"]] for entry in self.abi_index.lookup_function(func_selector)}
+
+    def event_params(self, topic: str):
+        # {signature: (param names, indexed flags)} of the events of the indexed ABIs with that topic
+        if self.abi_index is None:
+            return {}
+        return {
+            entry["signature"]: ([param["name"] for param in entry["inputs"]], [param["indexed"] for param in entry["inputs"]])
+            for entry in self.abi_index.lookup_event(topic)
+        }
+
+    @instrumented("wei_converter")
+    def wei_converter(self, value: str, currencyFrom: str, currencyTo: str):
+        result = ConversionResult(value, currencyFrom, currencyTo)
+        try:
+            result.output = convert_unit(value, currencyFrom, currencyTo)
+        except (ValueError, KeyError):
+            result.error = "Enter a value" if value == "" else "Invalid value"
+
+        return result
+
+    def wei_converter_batch(self, values: list[str], currencyFrom: str, currencyTo: str):
+        results = []
+        for value, (output, error) in zip(values, convert_units(values, currencyFrom, currencyTo)):
+            result = ConversionResult(value, currencyFrom, currencyTo, output)
+            if error != "":
+                result.error = "Enter a value" if value == "" else "Invalid value"
+            results.append(result)
+
+        return results
+
+    def function_selector_encoder(self, func_name: str, params_type: list[str]):
+        func_name = func_name.strip()
+
+        # The aliases are canonicalized ("uint" -> "uint256", "address payable" -> "address")
+        try:
+            params_type = [canonical_type(param) for param in params_type]
+        except ValueError:
+            return SelectorEncodeResult(error=INVALID_PARAM_TYPE)
+
+        if func_name == "":
+            return SelectorEncodeResult()
+
+        if not is_valid_function_name(func_name):
+            return SelectorEncodeResult(error="Invalid function name")
+
+        signature = f'{func_name}({",".join(params_type)})'
+        return SelectorEncodeResult(signature, function_selector(signature))
+
+    @instrumented("function_selector_encoder_advanced")
+    def function_selector_encoder_advanced(self, func_signature: str):
+        func_signature = func_signature.strip()
+
+        if func_signature == "":
+            return SelectorEncodeResult()
+
+        # Also accepts the declarations of the source code, "function transfer(address to, uint amount) external"
+        try:
+            func_name, params_type = parse_function_signature(func_signature)
+        except ValueError:
+            return SelectorEncodeResult(error="Invalid function signature")
+
+        if not is_valid_function_name(func_name):
+            return SelectorEncodeResult(error="Invalid function name")
+
+        func_signature = f'{func_name}({",".join(params_type)})'
+        return SelectorEncodeResult(func_signature, function_selector(func_signature))
+
+    @instrumented("function_selector_decoder")
+    def function_selector_decoder(self, func_selector: str):
+        func_selector = func_selector.strip().replace("0x", "")
+
+        if func_selector == "":
+            return SelectorDecodeResult(func_selector)
+
+        if len(func_selector) != 8:
+            return SelectorDecodeResult(func_selector, error="Invalid function selector")
+
+        for char in func_selector:
+            if char not in "0123456789abcdef":
+                return SelectorDecodeResult(func_selector, error="Invalid function selector, only hex characters")
+
+        decoded = self.resolve_function_selector(func_selector)
+        return SelectorDecodeResult("0x" + func_selector, decoded if decoded[0] != "Not found" else [])
+
+    def decode_call_params(self, signature: str, tx_params_body: bytes, names: list[str] = None):
+        try:
+            with metrics.timer("abi.decode"):
+                return DecodedCall(signature, decode_params(signature, tx_params_body), names=names)
+        except ValueError:
+            return DecodedCall(signature, error="Invalid transaction params", names=names)
+
+    @instrumented("decode_transaction_input")
+    def decode_transaction_input(self, transaction_input: str, on_progress=None):
+        transaction_input = transaction_input.replace("0x", "")
+
+        # Contract creation (free memory pointer initialization of solc, "mstore(0x40, 0x80)" or "0x60" on old versions)
+        if transaction_input[:8] in ("60806040", "60606040"):
+            result = TransactionDecodeResult("creation")
+            try:
+                bytecode = bytes.fromhex(transaction_input.strip())
+            except ValueError:
+                result.error = "Invalid bytecode"
+                return result
+
+            with metrics.timer("bytecode.scan"):
+                result.selectors = dict.fromkeys(function_selector for _, function_selector in find_function_selectors(bytecode))
+            if on_progress is not None:
+                on_progress(result)
+
+            # The partial result is reported as each selector is resolved, keeping the order of the bytecode
+            for encoded, decoded in self.resolve_function_selectors(list(result.selectors)):
+                result.selectors[encoded] = decoded
+                if on_progress is not None:
+                    on_progress(result)
+
+            return result
+
+        # Contract call
+        result = TransactionDecodeResult("call", "0x" + transaction_input[:8])
+        decoded = self.resolve_function_selector(transaction_input[:8])
+        result.signatures = decoded if decoded[0] != "Not found" else []
+
+        if result.signatures != [] and len(transaction_input) > 8:
+            try:
+                tx_params_body = bytes.fromhex(transaction_input[8:])
+            except ValueError:
+                result.calls = [DecodedCall(signature, error="Invalid transaction params") for signature in result.signatures]
+                return result
+
+            names = self.function_param_names(transaction_input[:8])
+            result.calls = [self.decode_call_params(signature, tx_params_body, names.get(signature)) for signature in result.signatures]
+
+        return result
+
+    @instrumented("decode_event_log")
+    def decode_event_log(self, topics: list[str], data: str):
+        try:
+            topics, data = parse_log(topics, data)
+        except ValueError as error:
+            return EventDecodeResult(error=str(error))
+
+        result = EventDecodeResult("0x" + topics[0].hex())
+        decoded = self.resolve_event_topic(result.topic)
+        result.signatures = decoded if decoded[0] != "Not found" else []
+
+        params = self.event_params(result.topic)
+        with metrics.timer("event.decode"):
+            result.events = [decode_event(signature, topics[1:], data, *params.get(signature, (None, None))) for signature in result.signatures]
+        return result
+
+    @instrumented("keccak256_hash")
+    def keccak256_hash(self, value: str):
+        return HashResult(value, Web3.keccak(text=value).hex() if value != "" else "")
+
+    def keccak256_hash_hex(self, value: str, on_progress=None):
+        # Hashes the bytes, in chunks. on_progress(hashed, total) can return False to stop
+        if value.strip() == "":
+            return HashResult(value, "")
+
+        try:
+            with metrics.timer("keccak.stream"):
+                digest = hash_hex(value, on_progress)
+        except ValueError:
+            return HashResult(value, "", "Invalid hex value")
+
+        return HashResult(value, "0x" + digest.hex() if digest is not None else "", None if digest is not None else HASH_CANCELLED)
+
+    def keccak256_hash_file(self, path: str, on_progress=None):
+        # Hashes the content of the file, in chunks. on_progress(hashed, total) can return False to stop
+        if path.strip() == "":
+            return HashResult(path, "")
+
+        try:
+            with metrics.timer("keccak.stream"):
+                digest = hash_file(path.strip(), on_progress)
+        except OSError as error:
+            return HashResult(path, "", f"Can't read the file: {error.strerror or error}")
+
+        return HashResult(path, "0x" + digest.hex() if digest is not None else "", None if digest is not None else HASH_CANCELLED)
+
+    @instrumented("eip55_validator")
+    def eip55_validator(self, address: str):
+        status, checksum_address = check_address(address)
+        return AddressValidationResult(
+            address, status != INVALID, status == CHECKSUMMED, checksum_address if status == FIXED else ""
+        )
+
+    @instrumented("get_signer_owner")
+    def get_signer_owner(self, signature_message_or_hash: str, signature: str):
+        owner, error = recover_signer(signature_message_or_hash, signature)
+        return SignerResult(owner, error if error != "" else None)
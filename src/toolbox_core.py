@@ -16,269 +16,246 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from decimal import Decimal, Context, ROUND_HALF_DOWN, setcontext, BasicContext
-
-from eth_account.messages import encode_defunct
-from ratelimit import limits, sleep_and_retry
-from eth_abi import decode
-from web3 import Web3
-import requests
-
-from src.custom_types import SOLIDITY_DATA_TYPES
+from src.selector_search import SelectorSearch
+from src.metrics import instrumented
+from src.results import TransactionDecodeResult
+from src.signature_parser import canonical_params
+from src.toolbox import ToolBox, HASH_CANCELLED, INVALID_PARAM_TYPE
+import threading
 
 
+# Adapts the results of ToolBox to the markdown shown by the GUI, emitting them through the result signal
 class ToolBoxCore:
-    def __init__(self, signal):
+    def __init__(self, signal, toolbox: ToolBox = None):
         self.__signal = signal
+        self.toolbox = toolbox if toolbox is not None else ToolBox()
+        self.__selector_search = None
+        self.__selector_search_lock = threading.Lock()
+        # Held while a search runs, so a new search waits for the workers of the previous one to stop
+        self.__selector_search_running = threading.Lock()
 
-    # 5 requests per 2 second because of the API limits
-    @sleep_and_retry
-    @limits(calls=5, period=2)
+    @instrumented("core.resolve_function_selector")
     def resolve_function_selector(self, func_selector: str):
-        response = requests.get(f"https://www.4byte.directory/api/v1/signatures/?hex_signature={func_selector}")
-        if response.status_code != 200 or response.json()["results"] == []:
-            return ["Not found"]
-        else:
-            return [result["text_signature"] for result in response.json()["results"]]
-
-    def wei_converter(self, value: str, currencyFrom: str, currencyTo: str):
-        try:
-            value = float(value)
-
-            # Set the precision to 30 decimal places
-            wei_converter_context = Context(prec=30, rounding=ROUND_HALF_DOWN)
-            setcontext(wei_converter_context)
-
-            wei = Decimal(Web3.to_wei(value, currencyFrom))
-            output = "{:.30f}".format(Decimal(Web3.from_wei(wei, currencyTo))).rstrip("0")
+        return self.toolbox.resolve_function_selector(func_selector)
 
-            # If the output is an integer, remove the decimal point
-            if output[-1] == ".":
-                output = output[:-1]
+    def __emit(self, result_to_copy: str, result: str):
+        self.__signal.result_to_copy.emit(result_to_copy)
+        self.__signal.result.emit(result)
 
-            self.__signal.result_to_copy.emit(output)
-            self.__signal.result.emit(f"**{output}** {currencyTo}")
+    @instrumented("core.wei_converter")
+    def wei_converter(self, value: str, currencyFrom: str, currencyTo: str):
+        result = self.toolbox.wei_converter(value, currencyFrom, currencyTo)
 
-            # Reset the precision to the original value
-            setcontext(BasicContext)
-        except:
-            self.__signal.result_to_copy.emit("")
-            if value == "":
-                self.__signal.result.emit("Enter a value")
-            else:
-                self.__signal.result.emit(f"Invalid value: **{value}**")
+        if result.error is None:
+            self.__emit(result.output, f"**{result.output}** {currencyTo}")
+        elif result.value == "":
+            self.__emit("", "Enter a value")
+        else:
+            self.__emit("", f"Invalid value: **{result.value}**")
 
+    @instrumented("core.function_selector_encoder")
     def function_selector_encoder(self, func_name: str, params_type: list[str]):
-        func_name = func_name.strip()
-
-        for param in params_type:
-            if param not in SOLIDITY_DATA_TYPES:
-                return
-
-        if func_name == "":
-            self.__signal.function_signature.emit("")
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("")
-            return
-
-        # https://docs.soliditylang.org/en/v0.8.6/grammar.html#identifiers
-        for char in func_name:
-            if char not in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789$_":
-                self.__signal.function_signature.emit("")
-                self.__signal.result_to_copy.emit("")
-                self.__signal.result.emit("Invalid function name")
-                return
+        result = self.toolbox.function_selector_encoder(func_name, params_type)
 
-        if func_name[0] in "0123456789":
-            self.__signal.function_signature.emit("")
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Invalid function name")
+        if result.error == INVALID_PARAM_TYPE:
             return
 
-        self.__signal.function_signature.emit(f'{func_name}({",".join(params_type)})')
-        output = Web3.keccak(text=f'{func_name}({",".join(params_type)})')[:4].hex()
-
-        self.__signal.result_to_copy.emit(output)
-        self.__signal.result.emit(f"Your function selector is: **{output}**")
+        self.__signal.function_signature.emit(result.signature)
+        if result.error is not None:
+            self.__emit("", result.error)
+        elif result.selector == "":
+            self.__emit("", "")
+        else:
+            self.__emit(result.selector, f"Your function selector is: **{result.selector}**")
 
+    @instrumented("core.function_selector_encoder_advanced")
     def function_selector_encoder_advanced(self, func_signature: str):
-        func_signature = func_signature.strip().replace(" ", "")
+        result = self.toolbox.function_selector_encoder_advanced(func_signature)
 
-        if func_signature == "":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("")
-            return
+        if result.error is not None:
+            self.__emit("", result.error)
+        elif result.selector == "":
+            self.__emit("", "")
+        else:
+            self.__emit(result.selector, f"Your function selector is: **{result.selector}**")
 
-        try:
-            func_name = func_signature.split("(")[0]
-            params_type = func_signature.split("(")[1].split(")")[0].split(",")
-        except:
+    @instrumented("core.function_selector_decoder")
+    def function_selector_decoder(self, func_selector: str):
+        result = self.toolbox.function_selector_decoder(func_selector)
+
+        if result.error is not None:
+            self.__emit("", result.error)
+        elif result.selector == "":
+            self.__emit("", "")
+        elif result.signatures == []:
+            self.__emit("", "Function signature not found in 4byte.directory")
+        elif len(result.signatures) > 1:
+            self.__emit(", ".join(result.signatures), f"Multiple function signatures found:<br />**{'<br />'.join(result.signatures)}**")
+        else:
+            self.__emit(", ".join(result.signatures), f"Your function signature is: **{', '.join(result.signatures)}**")
+
+    def __format_contract_creation(self, result: TransactionDecodeResult):
+        resolved = len([value for value in result.selectors.values() if value is not None])
+
+        return "Transaction type: **Contract creation**<br />Function selectors found in the bytecode{}:<br />{}".format(
+            f" ({resolved}/{len(result.selectors)})" if resolved < len(result.selectors) else "",
+            "<br />".join(
+                [
+                    f"__{key}{' [!]' if len(value) > 1 else ''}__:<br /> - **{'<br /> - '.join(value)}**"
+                    for key, value in result.selectors.items()
+                    if value is not None
+                ]
+            ),
+        )
+
+    @instrumented("core.decode_transaction_input")
+    def decode_transaction_input(self, transaction_input: str):
+        # Contract creation
+        if transaction_input.replace("0x", "")[:8] in ("60806040", "60606040"):
             self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Invalid function signature")
-            return
+            self.__signal.result.emit("Transaction type: **Contract creation**<br />Checking for function selectors in the bytecode...")
 
-        for param in params_type:
-            if param not in SOLIDITY_DATA_TYPES:
-                self.__signal.result_to_copy.emit("")
-                self.__signal.result.emit("Invalid function signature")
+            result = self.toolbox.decode_transaction_input(
+                transaction_input, on_progress=lambda partial: self.__signal.result.emit(self.__format_contract_creation(partial))
+            )
+            if result.error is not None:
+                self.__signal.result.emit(f"Transaction type: **Contract creation**<br />{result.error}")
                 return
 
-        # https://docs.soliditylang.org/en/v0.8.6/grammar.html#identifiers
-        if func_name[0] in "0123456789":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Invalid function name")
+            output = self.__format_contract_creation(result)
+            self.__emit(output, output)
             return
 
-        for char in func_name:
-            if char not in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789$_":
-                self.__signal.result_to_copy.emit("")
-                self.__signal.result.emit("Invalid function name")
-                return
-
-        output = Web3.keccak(text=func_signature)[:4].hex()
-        self.__signal.result_to_copy.emit(output)
-        self.__signal.result.emit(f"Your function selector is: **{output}**")
-
-    def function_selector_decoder(self, func_selector: str):
-        func_selector = func_selector.strip().replace("0x", "")
-
-        if func_selector == "":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("")
-            return
+        # Contract call
+        result = self.toolbox.decode_transaction_input(transaction_input)
+
+        if result.calls != []:
+            output = ""
+            for call in result.calls:
+                if call.error is None:
+                    names = call.names if call.names is not None else [""] * len(call.params)
+                    tx_params_list = [
+                        f"- {param_type}{' ' + name if name != '' else ''}: {value}"
+                        for (param_type, value), name in zip(call.params, names)
+                    ]
 
-        if len(func_selector) != 8:
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Invalid function selector")
-            return
+                    if output != "":
+                        output += "<br />"
 
-        for char in func_selector:
-            if char not in "0123456789abcdef":
-                self.__signal.result_to_copy.emit("")
-                self.__signal.result.emit("Invalid function selector, only hex characters")
-                return
+                    output += "Transaction type: **<br /> - {}**<br />Transaction params (values):<br />**{}**".format(
+                        call.signature, ",<br />".join(tx_params_list)
+                    )
+                else:
+                    output += "Transaction type: **<br /> - {}**<br />Invalid transaction params".format(call.signature)
 
-        decode = self.resolve_function_selector(func_selector)
-        if decode[0] == "Not found":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Function signature not found in 4byte.directory")
+            self.__emit(output, output)
         else:
-            self.__signal.result_to_copy.emit(", ".join(decode))
-            if len(decode) > 1:
-                self.__signal.result.emit(f"Multiple function signatures found:<br />**{'<br />'.join(decode)}**")
-            else:
-                self.__signal.result.emit(f"Your function signature is: **{', '.join(decode)}**")
-
-    def decode_transaction_input(self, transaction_input: str):
-        transaction_input = transaction_input.replace("0x", "")
-
-        # Contract creation
-        if transaction_input[:8] == "60806040":
-            tx_type = "Contract creation"
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Transaction type: **Contract creation**<br />Checking for function selectors in the bytecode...")
-
-            function_selectors = transaction_input.split("8063")[1:]
-            function_selectors_dict = {}
-            for function_selector in function_selectors:
-                if function_selector != "":
-                    encoded = "0x" + function_selector[:8]
-                    decoded = self.resolve_function_selector(encoded)
-                    function_selectors_dict[encoded] = decoded
-
-            output = "Transaction type: **Contract creation**<br />Function selectors found in the bytecode:<br />{}".format(
-                "<br />".join(
-                    [
-                        f"__{key}{' [!]' if len(value) > 1 else ''}__:<br /> - **{'<br /> - '.join(value)}**"
-                        for key, value in function_selectors_dict.items()
-                    ]
-                )
+            self.__emit(
+                "",
+                "Transaction type: **<br /> - {}**<br />No transaction params found".format(
+                    "<br /> - ".join(result.signatures if result.signatures != [] else ["Not found"])
+                ),
             )
-            self.__signal.result_to_copy.emit(output)
-            self.__signal.result.emit(output)
 
-        # Contract call
+    def __hash_progress(self, hashed: int, total: int):
+        # Stops when the input has changed (only the task runner knows it)
+        superseded = getattr(self.__signal, "superseded", None)
+        if superseded is not None and superseded():
+            return False
+        if total > 0:
+            self.__signal.result.emit(f"Hashing... **{hashed * 100 // total}%** of {total:,} bytes")
         else:
-            tx_type = self.resolve_function_selector(transaction_input[:8])
-
-            if tx_type[0] != "Not found" and len(transaction_input) > 8:
-                output = ""
-                for type in tx_type:
-                    try:
-                        tx_params_body = transaction_input[8:]
-                        tx_params_type = type.split("(")[1].split(")")[0].split(",")
-                        result = decode(tx_params_type, bytes.fromhex(tx_params_body))
-                        tx_params_list = ["- " + tx_params_type[i] + ": " + str(result[i]) for i in range(len(tx_params_type))]
-
-                        if output != "":
-                            output += "<br />"
-
-                        output += "Transaction type: **<br /> - {}**<br />Transaction params (values):<br />**{}**".format(
-                            type, ",<br />".join(tx_params_list)
-                        )
-                    except:
-                        output += "Transaction type: **<br /> - {}**<br />Invalid transaction params".format(type)
-
-                self.__signal.result_to_copy.emit(output)
-                self.__signal.result.emit(output)
-            else:
-                self.__signal.result_to_copy.emit("")
-                self.__signal.result.emit(
-                    "Transaction type: **<br /> - {}**<br />No transaction params found".format("<br /> - ".join(tx_type))
-                )
+            self.__signal.result.emit(f"Hashing... **{hashed:,}** bytes")
+
+    @instrumented("core.keccak256_hash")
+    def keccak256_hash(self, value: str, input_type: str = "Text"):
+        if input_type == "Hex":
+            result = self.toolbox.keccak256_hash_hex(value, self.__hash_progress)
+        elif input_type == "File":
+            result = self.toolbox.keccak256_hash_file(value, self.__hash_progress)
+        else:
+            result = self.toolbox.keccak256_hash(value)
 
-    def keccak256_hash(self, value: str):
-        if value == "":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("")
+        if result.error == HASH_CANCELLED:
             return
+        elif result.error is not None:
+            self.__emit("", result.error)
+        elif result.hash == "":
+            self.__emit("", "")
         else:
-            output = Web3.keccak(text=value).hex()
-            self.__signal.result_to_copy.emit(output)
-            self.__signal.result.emit(f"Your hash is: **{output}**")
+            self.__emit(result.hash, f"Your hash is: **{result.hash}**")
 
+    @instrumented("core.eip55_validator")
     def eip55_validator(self, address: str):
         if address == "":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("")
+            self.__emit("", "")
             return
 
-        tempOutput = ""
-        valid_address = ""
-        if Web3.is_address(address):
-            tempOutput += "✓ Valid address<br />"
-            if Web3.is_checksum_address(address):
-                tempOutput += "✓ Valid checksum address"
-            else:
-                tempOutput += "✕ Invalid checksum address"
-                valid_address = Web3.to_checksum_address(address)
-                tempOutput += "<br />✓ Valid checksum address: **{}**".format(valid_address)
+        result = self.toolbox.eip55_validator(address)
+
+        if not result.is_address:
+            output = "✕ Invalid address"
+        elif result.is_checksum_address:
+            output = "✓ Valid address<br />✓ Valid checksum address"
         else:
-            tempOutput += "✕ Invalid address"
+            output = "✓ Valid address<br />✕ Invalid checksum address<br />✓ Valid checksum address: **{}**".format(
+                result.checksum_address
+            )
 
-        self.__signal.result_to_copy.emit(valid_address)
-        self.__signal.result.emit(tempOutput)
+        self.__emit(result.checksum_address, output)
 
+    @instrumented("core.get_signer_owner")
     def get_signer_owner(self, signature_message_or_hash: str, signature: str):
         if signature_message_or_hash == "" or signature == "":
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("")
+            self.__emit("", "")
             return
 
+        result = self.toolbox.get_signer_owner(signature_message_or_hash, signature)
+
+        if result.error is not None:
+            self.__emit("", result.error)
+        else:
+            self.__emit(result.owner, f"Signature owner: **{result.owner}**")
+
+    # Blocking, the GUI runs it in a thread and can stop it with cancel_function_selector_search
+    @instrumented("core.search_function_selector")
+    def search_function_selector(self, target: str, func_prefix: str, params: str, max_length: int):
         try:
-            if signature_message_or_hash[:2] == "0x":
-                signature_message_or_hash = encode_defunct(hexstr=signature_message_or_hash)
-            else:
-                signature_message_or_hash = encode_defunct(text=signature_message_or_hash)
-        except:
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Invalid signature message or hash")
+            search = SelectorSearch(target, list(canonical_params(params)), func_prefix.strip(), max_length=max_length)
+        except ValueError as error:
+            self.cancel_function_selector_search()
+            self.__emit("", str(error))
             return
 
-        try:
-            output = Web3.to_checksum_address(Web3().eth.account.recover_message(signature_message_or_hash, signature=signature))
-            self.__signal.result_to_copy.emit(output)
-            self.__signal.result.emit(f"Signature owner: **{output}**")
-        except:
-            self.__signal.result_to_copy.emit("")
-            self.__signal.result.emit("Invalid signature")
+        with self.__selector_search_lock:
+            previous, self.__selector_search = self.__selector_search, search
+        if previous is not None:
+            previous.cancel()
+
+        with self.__selector_search_running:
+            # Superseded by a newer search while the previous one was stopping
+            if search.cancelled:
+                return
+
+            self.__emit("", "Searching...")
+            matches = search.run(
+                on_progress=lambda progress: self.__signal.result.emit(
+                    f"Searching... **{progress.checked}** names checked ({progress.rate:.0f} hashes/sec)"
+                )
+            )
+
+        if matches != []:
+            self.__emit(
+                ", ".join(signature for signature, _ in matches),
+                "Function signatures found:<br />{}".format("<br />".join(f"**{signature}**: {selector}" for signature, selector in matches)),
+            )
+        elif search.cancelled:
+            self.__emit("", f"Search cancelled after **{search.checked}** names checked")
+        else:
+            self.__emit("", f"No function signature found (**{search.checked}** names checked)")
+
+    def cancel_function_selector_search(self):
+        with self.__selector_search_lock:
+            search = self.__selector_search
+        if search is not None:
+            search.cancel()
@@ -0,0 +1,111 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+from eth_utils.units import units
+
+from src.custom_types import CURRENCY_TYPES
+
+# Power of ten of each unit, so the conversions are done with integers only
+UNIT_EXPONENTS = {currency: len(str(int(units[currency]))) - 1 for currency in CURRENCY_TYPES}
+POWERS_OF_TEN = {exponent: 10**exponent for exponent in set(UNIT_EXPONENTS.values())}
+MAX_WEI = 2**256 - 1
+MAX_WEI_DIGITS = len(str(MAX_WEI))
+
+
+def _parse_decimal(value: str, exponent: int):
+    # Slow path: signs, exponents ("1e18"), underscores... Building a Decimal from a string is exact, it does not
+    # depend on the context precision
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid value: {value}")
+
+    if not number.is_finite():
+        raise ValueError(f"Invalid value: {value}")
+
+    sign, digits, number_exponent = number.as_tuple()
+    if number.is_zero():
+        return 0
+    if sign == 1:
+        raise ValueError(f"Negative value: {value}")
+
+    # The range is checked on the number of integer digits, before any power of ten is computed
+    number_exponent += exponent
+    if len(digits) + number_exponent > MAX_WEI_DIGITS:
+        raise ValueError(f"Value out of range: {value}")
+    if len(digits) + number_exponent <= 0:
+        return 0
+
+    # Fractions of wei are truncated, as Web3.to_wei does, by dropping their digits
+    if number_exponent < 0:
+        digits = digits[:number_exponent]
+        number_exponent = 0
+
+    return int("".join(map(str, digits))) * 10**number_exponent
+
+
+def to_wei(value: str, currency: str):
+    exponent = UNIT_EXPONENTS[currency]
+    value = value.strip()
+
+    # Fast path for plain decimal numbers ("123", "0.5")
+    integer, _, fraction = value.partition(".")
+    if integer.isascii() and integer.isdigit() and (fraction == "" or (fraction.isascii() and fraction.isdigit())):
+        if len(integer.lstrip("0")) > MAX_WEI_DIGITS:
+            raise ValueError(f"Value out of range: {value}")
+        wei = int(integer + fraction[:exponent].ljust(exponent, "0"))
+    else:
+        wei = _parse_decimal(value, exponent)
+
+    if wei > MAX_WEI:
+        raise ValueError(f"Value out of range: {value}")
+
+    return wei
+
+
+def from_wei(wei: int, currency: str):
+    exponent = UNIT_EXPONENTS[currency]
+    if exponent == 0:
+        return str(wei)
+
+    integer, fraction = divmod(wei, POWERS_OF_TEN[exponent])
+    if fraction == 0:
+        return str(integer)
+
+    return f"{integer}.{fraction:0{exponent}d}".rstrip("0")
+
+
+def convert_unit(value: str, currency_from: str, currency_to: str):
+    return from_wei(to_wei(value, currency_from), currency_to)
+
+
+def convert_units(values, currency_from: str, currency_to: str):
+    # Converts a whole column of values, returning (output, error) for each one. The error is "" when the value is valid
+    if currency_from not in UNIT_EXPONENTS or currency_to not in UNIT_EXPONENTS:
+        raise ValueError(f"Unknown unit: {currency_from if currency_from not in UNIT_EXPONENTS else currency_to}")
+
+    results = []
+    for value in values:
+        try:
+            results.append((from_wei(to_wei(value, currency_from), currency_to), ""))
+        except ValueError as error:
+            results.append(("", str(error)))
+
+    return results
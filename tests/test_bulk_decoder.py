@@ -0,0 +1,39 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from src import bulk_decoder
+from src.bulk_decoder import BulkDecoder
+from src.known_selectors import FUNCTIONS
+from src.resolver import KnownSelectorsBackend, SignatureResolver
+from src.selector_cache import SelectorCache
+from src.toolbox import ToolBox
+
+
+def test_resolved_selectors_cleared_with_chunks_in_flight(tmp_path, monkeypatch):
+    # More distinct selectors than the cache keeps, the chunks still in flight must keep their param names
+    monkeypatch.setattr(bulk_decoder, "MAX_RESOLVED_SELECTORS", 20)
+    toolbox = ToolBox(
+        selector_cache=SelectorCache(str(tmp_path / "selector_cache.sqlite3")),
+        resolver=SignatureResolver([KnownSelectorsBackend()]),
+    )
+    selectors = list(FUNCTIONS)[:200]
+    inputs = [selector + "00" * 32 for selector in selectors] * 2
+
+    results = list(BulkDecoder(toolbox, workers=2, chunk_size=10).decode(inputs))
+    assert [result.selector for result in results] == selectors * 2
+    assert all(result.calls != [] for result in results)
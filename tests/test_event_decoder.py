@@ -0,0 +1,37 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from src.event_decoder import parse_log
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+def test_parse_log():
+    topics, data = parse_log([TRANSFER_TOPIC], "0x01")
+    assert topics == [bytes.fromhex(TRANSFER_TOPIC[2:])] and data == b"\x01"
+
+
+@pytest.mark.parametrize(
+    "topics, data",
+    [([1], "0x"), ([None], "0x"), ([[TRANSFER_TOPIC]], "0x"), ([TRANSFER_TOPIC], None), ([TRANSFER_TOPIC], 1), (None, "0x"), (["0xzz"], "0x")],
+)
+def test_malformed_logs_raise_value_error(topics, data):
+    with pytest.raises(ValueError, match="Invalid topics or data"):
+        parse_log(topics, data)
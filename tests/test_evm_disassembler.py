@@ -0,0 +1,41 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from src.evm_disassembler import find_function_selectors
+
+# DUP1 PUSHn <selector> EQ PUSH2 <tag> JUMPI
+DUP1, EQ, PUSH2, JUMPI = "80", "14", "61", "57"
+
+
+def dispatcher(push: str, selector: str):
+    return DUP1 + push + selector + EQ + PUSH2 + "0010" + JUMPI
+
+
+def test_push4_selectors():
+    bytecode = bytes.fromhex(dispatcher("63", "a9059cbb") + dispatcher("63", "095ea7b3"))
+    assert [selector for _, selector in find_function_selectors(bytecode)] == ["0xa9059cbb", "0x095ea7b3"]
+
+
+def test_short_push_selectors_are_left_padded():
+    bytecode = bytes.fromhex(dispatcher("62", "fdd58e") + dispatcher("60", "01"))
+    assert [selector for _, selector in find_function_selectors(bytecode)] == ["0x00fdd58e", "0x00000001"]
+
+
+def test_short_push_without_eq_is_ignored():
+    # PUSH1 0x40 PUSH1 0x80 MSTORE, the usual constructor prologue
+    assert find_function_selectors(bytes.fromhex(DUP1 + "6040" + "6080" + "52")) == []
@@ -0,0 +1,146 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+import pytest
+
+from benchmarks.stub_server import Stub4ByteServer
+from src.rate_limiter import TokenBucket
+from src.resolver import EVENT, FIRST, MERGE, CircuitBreaker, FourByteBackend, SignatureResolver
+
+TRANSFER = "0xa9059cbb"
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+@pytest.fixture
+def stub():
+    server = Stub4ByteServer(
+        {TRANSFER: ["transfer(address,uint256)"]},
+        {TRANSFER_TOPIC: ["Transfer(address,address,uint256)"]},
+    ).start()
+    yield server
+    server.stop()
+
+
+def backend_of(server: Stub4ByteServer, calls: int = 100, period: float = 1):
+    return FourByteBackend(server.url, timeout=5, calls=calls, period=period)
+
+
+def test_four_byte_backend(stub):
+    backend = backend_of(stub)
+    assert backend.lookup(TRANSFER) == ["transfer(address,uint256)"]
+    assert backend.lookup(TRANSFER_TOPIC, EVENT) == ["Transfer(address,address,uint256)"]
+    assert backend.lookup("0x12345678") == []
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_transient_errors_are_retried(stub, status):
+    stub.errors = [status, status]
+    assert backend_of(stub).lookup(TRANSFER) == ["transfer(address,uint256)"]
+    assert stub.requests == 3
+
+
+def test_retries_are_limited(stub):
+    stub.errors = [503] * 3
+    resolver = SignatureResolver([backend_of(stub)])
+    # None (and not []) so the failure is not cached as an unknown selector
+    assert resolver.resolve_remotely(TRANSFER) is None
+    assert stub.requests == 3
+
+
+def test_client_errors_are_not_retried(stub):
+    stub.errors = [404]
+    assert SignatureResolver([backend_of(stub)]).resolve_remotely(TRANSFER) is None
+    assert stub.requests == 1
+
+
+def test_circuit_breaker_opens_and_closes(stub):
+    backend = backend_of(stub)
+    backend.breaker = CircuitBreaker(max_failures=2, reset_timeout=0.2)
+    resolver = SignatureResolver([backend])
+
+    stub.errors = [500] * 6
+    assert resolver.resolve_remotely(TRANSFER) is None
+    assert not backend.breaker.is_open
+    assert resolver.resolve_remotely(TRANSFER) is None
+    assert backend.breaker.is_open
+
+    # Open: the backend is skipped without any request
+    requests = stub.requests
+    assert resolver.resolve_remotely(TRANSFER) is None
+    assert stub.requests == requests
+
+    # After the reset timeout a successful trial request closes it
+    time.sleep(0.25)
+    assert resolver.resolve_remotely(TRANSFER) == ["transfer(address,uint256)"]
+    assert not backend.breaker.is_open
+
+
+def test_circuit_breaker_trial():
+    breaker = CircuitBreaker(max_failures=1, reset_timeout=0.1)
+    breaker.record_failure()
+    assert breaker.is_open and not breaker.allow()
+
+    # A single trial is allowed, a failed trial opens it again for the whole timeout
+    time.sleep(0.15)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.15)
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open and breaker.allow()
+
+
+def test_first_answer_skips_failing_backends(stub):
+    failing = Stub4ByteServer({}).start()
+    try:
+        failing.errors = [503] * 3
+        resolver = SignatureResolver([backend_of(failing), backend_of(stub)], FIRST)
+        assert resolver.resolve_remotely(TRANSFER) == ["transfer(address,uint256)"]
+    finally:
+        failing.stop()
+
+
+def test_merged_answers_keep_the_backend_order(stub):
+    other = Stub4ByteServer({TRANSFER: ["many_msg_babbage(bytes1)", "transfer(address,uint256)"]}).start()
+    try:
+        resolver = SignatureResolver([backend_of(other), backend_of(stub)], MERGE)
+        assert resolver.resolve_remotely(TRANSFER) == ["many_msg_babbage(bytes1)", "transfer(address,uint256)"]
+    finally:
+        other.stop()
+
+
+def test_token_bucket():
+    bucket = TokenBucket(2, 0.2)
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    # One token every 0.1 seconds
+    assert 0 < bucket.acquire() <= 0.15
+
+
+def test_rate_limited_backend(stub):
+    resolver = SignatureResolver([backend_of(stub, calls=2, period=0.2)])
+    start = time.monotonic()
+    for _ in range(4):
+        assert resolver.resolve_remotely(TRANSFER) == ["transfer(address,uint256)"]
+    assert time.monotonic() - start >= 0.15
+    assert stub.requests == 4
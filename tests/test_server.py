@@ -0,0 +1,65 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import json
+
+from src.resolver import KnownSelectorsBackend, SignatureResolver
+from src.selector_cache import SelectorCache
+from src.server import ToolBoxServer
+from src.toolbox import ToolBox
+
+
+async def post(port: int, path: str, payload):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def request(server: ToolBoxServer, path: str, payload):
+    async def run():
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        async with listener:
+            return await post(listener.sockets[0].getsockname()[1], path, payload)
+
+    return asyncio.run(run())
+
+
+def test_failing_toolbox_call_answers_500(tmp_path, monkeypatch):
+    toolbox = ToolBox(
+        selector_cache=SelectorCache(str(tmp_path / "selector_cache.sqlite3")),
+        resolver=SignatureResolver([KnownSelectorsBackend()]),
+    )
+
+    def fail(value: str):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(toolbox, "keccak256_hash", fail)
+    server = ToolBoxServer(toolbox, workers=2)
+
+    status, body = request(server, "/keccak", {"value": "a"})
+    assert status == 500 and body == {"error": "RuntimeError: boom"}
+    assert server.latency["/keccak"].summary()["errors"] == 1
+
+    status, body = request(server, "/eip55", [{"address": "0x52908400098527886e0f7030069857d2e4169ee7"}])
+    assert status == 200 and body[0]["checksum_address"] == "0x52908400098527886E0F7030069857D2E4169EE7"
@@ -0,0 +1,44 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from src.signature_parser import canonical_signature, parse_function_signature
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [
+        "transfer(address,uint256)",
+        "function transfer(address to, uint amount) external returns (bool);",
+        "function f(uint256 a) public view virtual override(A, B) returns (uint256) {",
+        "event Transfer(address indexed from, address indexed to, uint256 value) anonymous;",
+    ],
+)
+def test_declaration_trailers(signature):
+    parse_function_signature(signature)
+
+
+@pytest.mark.parametrize("signature", ["f(uint256) garbage", "f(uint256) external onlyOwner", "f(uint256) returns", "f(uint256)x"])
+def test_unknown_trailers_are_rejected(signature):
+    with pytest.raises(ValueError):
+        parse_function_signature(signature)
+
+
+def test_canonical_signature():
+    assert canonical_signature("function transfer(address payable to, uint amount) external") == "transfer(address,uint256)"
@@ -0,0 +1,71 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.stub_server import Stub4ByteServer
+from src.abi_index import AbiIndex
+from src.resolver import FourByteBackend, KnownSelectorsBackend, SignatureResolver
+from src.selector_cache import SelectorCache
+from src.toolbox import ToolBox
+
+# many_msg_babbage(bytes1) has the same selector as the ERC-20 transfer
+TRANSFER = "0xa9059cbb"
+COLLISION = "many_msg_babbage(bytes1)"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SelectorCache(str(tmp_path / "selector_cache.sqlite3"))
+
+
+@pytest.fixture
+def stub():
+    server = Stub4ByteServer({TRANSFER: [COLLISION, "transfer(address,uint256)"]}).start()
+    yield server
+    server.stop()
+
+
+def test_project_abis_win_over_known_selectors(tmp_path, cache):
+    abi_directory = tmp_path / "abis"
+    abi_directory.mkdir()
+    abi = [{"type": "function", "name": "many_msg_babbage", "inputs": [{"name": "value", "type": "bytes1"}], "outputs": []}]
+    (abi_directory / "Babbage.json").write_text(json.dumps(abi), encoding="utf-8")
+    abi_index = AbiIndex([str(abi_directory)], str(tmp_path / "abi_index.json"))
+
+    toolbox = ToolBox(selector_cache=cache, abi_index=abi_index)
+    assert toolbox.resolve_function_selector(TRANSFER) == [COLLISION]
+    # The selectors missing from the ABIs are still answered by the table
+    assert toolbox.resolve_function_selector("0x095ea7b3") == ["approve(address,uint256)"]
+
+
+def test_known_selectors_answer_without_requests(stub, cache):
+    resolver = SignatureResolver([KnownSelectorsBackend(), FourByteBackend(stub.url, timeout=5)])
+    toolbox = ToolBox(selector_cache=cache, resolver=resolver)
+    assert toolbox.resolve_function_selector(TRANSFER) == ["transfer(address,uint256)"]
+    assert stub.requests == 0
+
+
+def test_known_selectors_are_ranked_first(stub, cache):
+    toolbox = ToolBox(selector_cache=cache, resolver=SignatureResolver([FourByteBackend(stub.url, timeout=5)]))
+    assert toolbox.resolve_function_selector(TRANSFER) == ["transfer(address,uint256)", COLLISION]
+    # Cached already ranked
+    assert toolbox.resolve_function_selector(TRANSFER) == ["transfer(address,uint256)", COLLISION]
+    assert stub.requests == 1
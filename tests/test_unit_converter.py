@@ -0,0 +1,50 @@
+"""
+CrazyToolBox, a web3 utilities GUI toolbox.
+© 2023 Telefónica Digital España S.L.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+ 
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+import pytest
+
+from src.unit_converter import MAX_WEI, convert_unit, to_wei
+
+
+def test_tiny_exponents_are_truncated_quickly():
+    start = time.perf_counter()
+    assert convert_unit("1e-5000000", "ether", "wei") == "0"
+    assert time.perf_counter() - start < 0.1
+
+
+def test_huge_exponents_are_rejected():
+    with pytest.raises(ValueError, match="out of range"):
+        convert_unit("1e5000000", "ether", "wei")
+
+
+def test_uint256_bound():
+    assert to_wei(str(MAX_WEI), "wei") == MAX_WEI
+    assert to_wei(f"{MAX_WEI}e0", "wei") == MAX_WEI
+    with pytest.raises(ValueError, match="out of range"):
+        to_wei(str(MAX_WEI + 1), "wei")
+    with pytest.raises(ValueError, match="out of range"):
+        to_wei(f"{MAX_WEI + 1}e0", "wei")
+
+
+def test_exact_values_above_2_53():
+    assert convert_unit("9007199254740993", "wei", "ether") == "0.009007199254740993"
+    assert convert_unit("123456789.123456789123456789", "ether", "wei") == "123456789123456789123456789"
+    assert convert_unit("1.5e-3", "ether", "wei") == "1500000000000000"
+    assert convert_unit("0.0000000000000000019", "ether", "wei") == "1"